@@ -4,13 +4,12 @@ Gerencia o menu, combate, salvamento e carregamento.
 """
 
 import random
-from models.personagem import Personagem
-from models.classes import Guerreiro, Mago, Arqueiro
-from models.missão import Missao
-from utils.repositorio import Repositorio
 from utils.logger import Logger
-from models.inventario import Item, Inventario
+from utils.saida import exibir, ler
 
+# Os modelos e o repositório são importados no primeiro uso (ver
+# criar_personagem, encarar_missao e a propriedade repositorio), para que
+# o menu apareça sem carregar subsistemas que a sessão talvez nem use.
 
 
 class Jogo:
@@ -18,56 +17,84 @@ class Jogo:
     Classe principal que gerencia o fluxo do jogo RPG.
     """
     
-    # Lista de nomes de missões disponíveis
-    NOMES_MISSOES = [
-        "Encontro na Floresta",
-        "Caverna Sombria",
-        "Ruínas Antigas",
-        "Torre do Mago",
-        "Covil do Dragão",
-        "Templo Perdido",
-        "Floresta Proibida",
-        "Montanha Gélida"
-    ]
-    
-    def __init__(self):
-        """Inicializa o jogo."""
+    def __init__(self, rng=None, logger=None, repositorio=None):
+        """
+        Inicializa o jogo.
+        
+        Args:
+            rng (random.Random, optional): Fonte de aleatoriedade da sessão.
+                Se None, usa o módulo random global.
+            logger (Logger, optional): Logger da sessão. Se None, usa um
+                Logger com buffer gravando em jogo.log.
+            repositorio (optional): Repositorio (JSON) ou RepositorioSQLite.
+                Se None, usa um Repositorio gravando em save.json, criado
+                no primeiro salvamento ou carregamento.
+        """
+        self.rng = rng or random
         self.personagem = None
-        self.repositorio = Repositorio()
-        self.logger = Logger()
-        self.logger.registrar("Jogo iniciado")
+        self._repositorio = repositorio
+        self.logger = logger or Logger(buffer=True)
+
+    @property
+    def repositorio(self):
+        """Repositório de saves (criado no primeiro uso)."""
+        if self._repositorio is None:
+            from utils.repositorio import Repositorio
+            self._repositorio = Repositorio()
+        return self._repositorio
     
     def exibir_menu(self):
         """Exibe o menu principal do jogo."""
-        print("\n" + "=" * 30)
-        print("=== RPG OO ===")
-        print("=" * 30)
-        print("[1] Criar personagem")
-        print("[2] Encarar missão")
-        print("[3] Ver status")
-        print("[4] Salvar")
-        print("[5] Carregar")
-        print("[0] Sair")
-        print("=" * 30)
+        exibir("\n" + "=" * 30)
+        exibir("=== RPG OO ===")
+        exibir("=" * 30)
+        exibir("[1] Criar personagem")
+        exibir("[2] Encarar missão")
+        exibir("[3] Ver status")
+        exibir("[4] Salvar")
+        exibir("[5] Carregar")
+        exibir("[0] Sair")
+        exibir("=" * 30)
     
     def criar_personagem(self):
         """
         Cria um novo personagem com nome e classe escolhidos pelo jogador.
         """
-        print("\n=== Criar Personagem ===")
-        nome = input("Nome do personagem: ").strip()
+        exibir("\n=== Criar Personagem ===")
+        nome = ler("Nome do personagem: ").strip()
         
         if not nome:
-            print("Nome inválido!")
+            exibir("Nome inválido!")
             return
         
-        print("\nEscolha a classe:")
-        print("[1] Guerreiro (Alto HP, Alta Defesa, Baixa Mana)")
-        print("[2] Mago (Baixo HP, Baixa Defesa, Alta Mana)")
-        print("[3] Arqueiro (HP Médio, Equilibrado)")
+        self._exibir_classes()
+        self._novo_personagem(nome, ler("> ").strip())
+    
+    async def criar_personagem_async(self, ler):
+        """
+        Versão de criar_personagem() com as respostas lidas pela corrotina `ler`.
+        """
+        exibir("\n=== Criar Personagem ===")
+        nome = (await ler("Nome do personagem: ")).strip()
         
-        escolha = input("> ").strip()
+        if not nome:
+            exibir("Nome inválido!")
+            return
         
+        self._exibir_classes()
+        self._novo_personagem(nome, (await ler("> ")).strip())
+    
+    def _exibir_classes(self):
+        """Mostra as classes que podem ser escolhidas."""
+        exibir("\nEscolha a classe:")
+        exibir("[1] Guerreiro (Alto HP, Alta Defesa, Baixa Mana)")
+        exibir("[2] Mago (Baixo HP, Baixa Defesa, Alta Mana)")
+        exibir("[3] Arqueiro (HP Médio, Equilibrado)")
+    
+    def _novo_personagem(self, nome, escolha):
+        """Cria o personagem da classe escolhida no menu."""
+        from models.classes import Guerreiro, Mago, Arqueiro
+
         if escolha == "1":
             self.personagem = Guerreiro(nome)
         elif escolha == "2":
@@ -75,13 +102,14 @@ class Jogo:
         elif escolha == "3":
             self.personagem = Arqueiro(nome)
         else:
-            print("Opção inválida! Criando Guerreiro por padrão.")
+            exibir("Opção inválida! Criando Guerreiro por padrão.")
             self.personagem = Guerreiro(nome)
+        self.personagem.rng = self.rng
         
-        print(f"\nPersonagem criado: {self.personagem.nome} ({self.personagem.classe})")
-        print(f"HP: {self.personagem.hp}/{self.personagem.hp_maximo}")
-        print(f"Mana: {self.personagem.mana}/{self.personagem.mana_maxima}")
-        print(f"Nível: {self.personagem.nivel}")
+        exibir(f"\nPersonagem criado: {self.personagem.nome} ({self.personagem.classe})")
+        exibir(f"HP: {self.personagem.hp}/{self.personagem.hp_maximo}")
+        exibir(f"Mana: {self.personagem.mana}/{self.personagem.mana_maxima}")
+        exibir(f"Nível: {self.personagem.nivel}")
         
         self.logger.registrar(f"Personagem criado: {self.personagem.nome} ({self.personagem.classe})")
     
@@ -89,132 +117,191 @@ class Jogo:
         """
         Inicia uma missão aleatória para o personagem.
         """
+        missao = self._sortear_missao()
+        if missao is not None:
+            self._exibir_progresso(missao.executar_combate(self.personagem, self.logger))
+    
+    async def encarar_missao_async(self, ler):
+        """
+        Versão de encarar_missao() com as respostas lidas pela corrotina `ler`.
+        """
+        missao = self._sortear_missao()
+        if missao is not None:
+            self._exibir_progresso(await missao.executar_combate_async(self.personagem, ler, self.logger))
+    
+    def _sortear_missao(self):
+        """
+        Returns:
+            Missao: Missão sorteada para o personagem, ou None se ele não
+            pode encarar uma missão agora
+        """
         if not self.personagem:
-            print("\nVocê precisa criar um personagem primeiro!")
-            return
+            exibir("\nVocê precisa criar um personagem primeiro!")
+            return None
         
         if not self.personagem.esta_vivo():
-            print("\nSeu personagem está sem HP! Use itens para curar ou recrie o personagem.")
-            return
-        
-        # Escolhe dificuldade baseada no nível
-        if self.personagem.nivel <= 2:
-            dificuldade = "fácil"
-        elif self.personagem.nivel <= 5:
-            dificuldade = random.choice(["fácil", "médio"])
-        else:
-            dificuldade = random.choice(["médio", "difícil"])
-        
-        nome_missao = random.choice(self.NOMES_MISSOES)
-        missao = Missao(nome_missao, dificuldade)
-        
-        resultado = missao.executar_combate(self.personagem, self.logger)
+            exibir("\nSeu personagem está sem HP! Use itens para curar ou recrie o personagem.")
+            return None
         
+        from models.missão import Missao
+
+        # Dificuldade baseada no nível e missão aleatória
+        return Missao.sortear(self.personagem.nivel, self.rng)
+    
+    def _exibir_progresso(self, resultado):
+        """Mostra o XP até o próximo nível depois de uma vitória."""
         if resultado["vitoria"]:
-            print(f"\nXP atual: {self.personagem.xp}/{self.personagem.xp_proximo_nivel}")
-            print(f"Próximo nível em: {self.personagem.xp_proximo_nivel - self.personagem.xp} XP")
+            exibir(f"\nXP atual: {self.personagem.xp}/{self.personagem.xp_proximo_nivel}")
+            exibir(f"Próximo nível em: {self.personagem.xp_proximo_nivel - self.personagem.xp} XP")
     
     def ver_status(self):
         """
         Exibe o status completo do personagem.
         """
         if not self.personagem:
-            print("\nVocê precisa criar um personagem primeiro!")
+            exibir("\nVocê precisa criar um personagem primeiro!")
             return
         
-        print("\n" + "=" * 40)
-        print(f"=== Status de {self.personagem.nome} ===")
-        print("=" * 40)
-        print(f"Classe: {self.personagem.classe}")
+        exibir("\n" + "=" * 40)
+        exibir(f"=== Status de {self.personagem.nome} ===")
+        exibir("=" * 40)
+        exibir(f"Classe: {self.personagem.classe}")
         # Exibe sub-classe quando presente
         if getattr(self.personagem, 'sub_classe', None):
-            print(f"Sub-classe: {self.personagem.sub_classe}")
-        print(f"Nível: {self.personagem.nivel}")
-        print(f"XP: {self.personagem.xp}/{self.personagem.xp_proximo_nivel}")
-        print(f"HP: {self.personagem.hp}/{self.personagem.hp_maximo}")
-        print(f"Barra de Vida: [{self.personagem.get_barra_vida()}]")
-        print(f"Mana: {self.personagem.mana}/{self.personagem.mana_maxima}")
-        print(f"Dano Base: {self.personagem.dano_base}")
-        print(f"Defesa: {self.personagem.defesa}")
+            exibir(f"Sub-classe: {self.personagem.sub_classe}")
+        exibir(f"Nível: {self.personagem.nivel}")
+        exibir(f"XP: {self.personagem.xp}/{self.personagem.xp_proximo_nivel}")
+        exibir(f"HP: {self.personagem.hp}/{self.personagem.hp_maximo}")
+        exibir(f"Barra de Vida: [{self.personagem.get_barra_vida()}]")
+        exibir(f"Mana: {self.personagem.mana}/{self.personagem.mana_maxima}")
+        exibir(f"Dano Base: {self.personagem.dano_base}")
+        exibir(f"Defesa: {self.personagem.defesa}")
         # Atributos específicos de sub-classes
         # Exibe apenas quando relevante (valores não-zero ou buff diferente de 1)
         if getattr(self.personagem, 'crit_chance', 0) > 0:
-            print(f"Chance de Crítico: {self.personagem.crit_chance*100:.1f}%")
+            exibir(f"Chance de Crítico: {self.personagem.crit_chance*100:.1f}%")
         if getattr(self.personagem, 'stun_chance', 0) > 0:
-            print(f"Chance de Stun: {self.personagem.stun_chance*100:.1f}%")
+            exibir(f"Chance de Stun: {self.personagem.stun_chance*100:.1f}%")
         if getattr(self.personagem, 'dot_sangramento', 0) > 0:
-            print(f"Sangramento (DoT): {self.personagem.dot_sangramento*100:.1f}%")
+            exibir(f"Sangramento (DoT): {self.personagem.dot_sangramento*100:.1f}%")
         if getattr(self.personagem, 'buff_dano', 1.0) != 1.0:
-            print(f"Buff de Dano: x{self.personagem.buff_dano:.2f}")
+            exibir(f"Buff de Dano: x{self.personagem.buff_dano:.2f}")
         if getattr(self.personagem, 'chance_queimadura', 0) > 0:
-            print(f"Chance de Queimadura: {self.personagem.chance_queimadura*100:.1f}%")
+            exibir(f"Chance de Queimadura: {self.personagem.chance_queimadura*100:.1f}%")
         if getattr(self.personagem, 'cura_base', 0) > 0:
-            print(f"Cura Base: {self.personagem.cura_base}")
-        print(f"\nInventário ({len(self.personagem.inventario)} itens):")
+            exibir(f"Cura Base: {self.personagem.cura_base}")
+        exibir(f"\nInventário ({len(self.personagem.inventario)} itens):")
         if self.personagem.inventario:
-            for item in self.personagem.inventario:
-                print(f"  - {item}")
+            for item, quantidade in self.personagem.inventario.pilhas():
+                exibir(f"  - {item} x{quantidade}" if quantidade > 1 else f"  - {item}")
         else:
-            print("  (vazio)")
-        print("=" * 40)
+            exibir("  (vazio)")
+        exibir("=" * 40)
     
     def salvar(self):
         """
         Salva o progresso do jogo.
         """
         if not self.personagem:
-            print("\nVocê precisa criar um personagem primeiro!")
+            exibir("\nVocê precisa criar um personagem primeiro!")
             return
         
         if self.repositorio.salvar(self.personagem):
-            print("\nJogo salvo com sucesso!")
+            exibir("\nJogo salvo com sucesso!")
             self.logger.registrar(f"Jogo salvo: {self.personagem.nome}")
         else:
-            print("\nErro ao salvar o jogo!")
+            exibir("\nErro ao salvar o jogo!")
     
     def carregar(self):
         """
         Carrega o progresso do jogo salvo.
         """
         if not self.repositorio.existe_save():
-            print("\nNenhum save encontrado!")
+            exibir("\nNenhum save encontrado!")
             return
         
         personagem_carregado = self.repositorio.carregar()
         
         if personagem_carregado:
             self.personagem = personagem_carregado
-            print(f"\nJogo carregado com sucesso!")
-            print(f"Personagem: {self.personagem.nome} ({self.personagem.classe})")
-            print(f"Nível: {self.personagem.nivel}")
+            self.personagem.rng = self.rng
+            exibir(f"\nJogo carregado com sucesso!")
+            exibir(f"Personagem: {self.personagem.nome} ({self.personagem.classe})")
+            exibir(f"Nível: {self.personagem.nivel}")
             self.logger.registrar(f"Jogo carregado: {self.personagem.nome}")
         else:
-            print("\nErro ao carregar o jogo!")
+            exibir("\nErro ao carregar o jogo!")
     
     def executar(self):
         """
         Loop principal do jogo.
         """
-        print("\nBem-vindo ao RPG OO!")
-        
-        while True:
-            self.exibir_menu()
-            escolha = input("\n> ").strip()
-            
-            if escolha == "1":
-                self.criar_personagem()
-            elif escolha == "2":
-                self.encarar_missao()
-            elif escolha == "3":
-                self.ver_status()
-            elif escolha == "4":
-                self.salvar()
-            elif escolha == "5":
-                self.carregar()
-            elif escolha == "0":
-                print("\nObrigado por jogar! Até logo!")
-                self.logger.registrar("Jogo encerrado")
-                break
-            else:
-                print("\nOpção inválida! Tente novamente.")
+        exibir("\nBem-vindo ao RPG OO!")
+        self.logger.registrar("Jogo iniciado")
+        
+        try:
+            while True:
+                self.exibir_menu()
+                escolha = ler("\n> ").strip()
+                
+                if escolha == "1":
+                    self.criar_personagem()
+                elif escolha == "2":
+                    self.encarar_missao()
+                elif escolha == "4":
+                    self.salvar()
+                elif escolha == "5":
+                    self.carregar()
+                elif not self._opcao_menu(escolha):
+                    break
+        finally:
+            # Grava o que estiver pendente no log e na saída, inclusive em caso de erro
+            self.logger.fechar()
+            exibir.descarregar()
+    
+    async def executar_async(self, ler):
+        """
+        Loop principal do jogo com as respostas lidas pela corrotina `ler`,
+        com a assinatura de input() (ver utils/servidor.py). Saves e
+        carregamentos rodam em outra thread, sem travar o loop asyncio.
+        """
+        import asyncio
 
+        exibir("\nBem-vindo ao RPG OO!")
+        self.logger.registrar("Jogo iniciado")
+        
+        try:
+            while True:
+                self.exibir_menu()
+                escolha = (await ler("\n> ")).strip()
+                
+                if escolha == "1":
+                    await self.criar_personagem_async(ler)
+                elif escolha == "2":
+                    await self.encarar_missao_async(ler)
+                elif escolha == "4":
+                    await asyncio.to_thread(self.salvar)
+                elif escolha == "5":
+                    await asyncio.to_thread(self.carregar)
+                elif not self._opcao_menu(escolha):
+                    break
+        finally:
+            self.logger.fechar()
+            exibir.descarregar()
+    
+    def _opcao_menu(self, escolha):
+        """
+        Executa as opções do menu que não fazem perguntas.
+        
+        Returns:
+            bool: False se o jogador escolheu sair
+        """
+        if escolha == "3":
+            self.ver_status()
+        elif escolha == "0":
+            exibir("\nObrigado por jogar! Até logo!")
+            self.logger.registrar("Jogo encerrado")
+            return False
+        else:
+            exibir("\nOpção inválida! Tente novamente.")
+        return True
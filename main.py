@@ -1,17 +1,99 @@
 """
 Arquivo principal que inicia o jogo RPG.
 Execute este arquivo para começar a jogar.
+
+Uso:
+    python main.py                        # mensagens no console
+    python main.py --saida buffer         # uma escrita por turno/entrada
+    python main.py --saida nula           # execuções automatizadas, sem nenhuma saída
+    python main.py --gravar sessao.json   # grava a sessão (ver utils/sessao.py)
+    python main.py --profile-startup      # tempo de importação de cada módulo
+    python main.py --servidor 0.0.0.0:8765  # várias sessões por TCP (ver utils/servidor.py)
 """
 
+import argparse
+import random
+import sys
+
 from jogo import Jogo
+from utils.saida import SAIDAS, definir_saida
+
+
+def perfil_inicializacao(limite=15):
+    """
+    Executa o jogo em um subprocesso com `python -X importtime`, do início
+    até o menu (saída nula, escolhendo "Sair"), e mostra quanto cada
+    módulo custa na inicialização.
+
+    Args:
+        limite (int): Quantos módulos listar, dos mais caros para os mais baratos
+
+    Returns:
+        bool: True se o subprocesso chegou ao menu e saiu normalmente
+    """
+    import subprocess
+    import time
+
+    inicio = time.perf_counter()
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", __file__, "--saida", "nula"],
+        input="0\n", capture_output=True, text=True,
+    )
+    total = time.perf_counter() - inicio
+    if processo.returncode != 0:
+        print(f"Erro ao executar o jogo: {processo.stderr.strip()}")
+        return False
+
+    # Linhas no formato "import time: <própria> | <acumulada> | <módulo>", em µs
+    modulos = []
+    for linha in processo.stderr.splitlines():
+        if not linha.startswith("import time:") or "self [us]" in linha:
+            continue
+        propria, acumulada, nome = linha[len("import time:"):].split("|")
+        modulos.append((int(acumulada), int(propria), nome.rstrip()[1:]))
+
+    # Módulos sem indentação foram importados diretamente (não por outro módulo)
+    importacao = sum(acumulada for acumulada, _, nome in modulos if not nome.startswith(" "))
+    print(f"Até o menu e de volta: {total * 1000:.1f} ms ({importacao / 1000:.1f} ms importando {len(modulos)} módulos)")
+    print(f"{'acumulado':>10} {'próprio':>9}  módulo")
+    for acumulada, propria, nome in sorted(modulos, reverse=True)[:limite]:
+        print(f"{acumulada / 1000:8.1f}ms {propria / 1000:7.1f}ms  {nome}")
+    return True
 
 
 def main():
     """Função principal que inicia o jogo."""
-    jogo = Jogo()
+    parser = argparse.ArgumentParser(description="RPG OO")
+    parser.add_argument("--saida", default="console", choices=sorted(SAIDAS),
+                        help="para onde vão as mensagens do jogo (padrão: console)")
+    parser.add_argument("--semente", type=int, default=None,
+                        help="semente da aleatoriedade da sessão")
+    parser.add_argument("--gravar", metavar="ARQUIVO",
+                        help="grava a semente e as entradas da sessão para reprodução")
+    parser.add_argument("--servidor", metavar="ENDERECO",
+                        help='hospeda sessões pela rede: "host:porta" ou "unix:/caminho"')
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="mostra o tempo de importação de cada módulo até o menu e sai")
+    args = parser.parse_args()
+
+    if args.profile_startup:
+        sys.exit(0 if perfil_inicializacao() else 1)
+
+    if args.servidor:
+        from utils.servidor import servir
+        servir(args.servidor)
+        return
+
+    definir_saida(args.saida)
+    if args.gravar:
+        from utils.sessao import gravar_sessao
+        gravar_sessao(args.gravar, args.semente)
+        return
+
+    rng = random.Random(args.semente) if args.semente is not None else None
+    jogo = Jogo(rng=rng)
     jogo.executar()
 
 
 if __name__ == "__main__":
     main()
-
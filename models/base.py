@@ -3,10 +3,21 @@ Classe base que serve como modelo tanto para o personagem quanto para o inimigo.
 Implementa atributos comuns como nome e HP.
 """
 
+import random
+
 
 class Atributos:
     """Classe base com atributos comuns para personagens e inimigos."""
     
+    # Atributos declarados (sem __dict__ por instância) para reduzir memória
+    # em simulações com muitos personagens e inimigos. Os efeitos de status
+    # (turnos restantes de atordoamento, sangramento e queimadura) também
+    # são declarados aqui, já que qualquer um pode ser alvo de um ataque.
+    __slots__ = (
+        "nome", "hp", "hp_maximo", "rng",
+        "stunned_turns", "sangramento_turns", "queimadura_turns",
+    )
+    
     def __init__(self, nome, hp, hp_maximo=None):
         """
         Inicializa um objeto com atributos básicos.
@@ -19,6 +30,12 @@ class Atributos:
         self.nome = nome
         self.hp = hp
         self.hp_maximo = hp_maximo if hp_maximo is not None else hp
+        # Fonte de aleatoriedade: o módulo random global por padrão, ou um
+        # random.Random próprio para simulações reproduzíveis
+        self.rng = random
+        self.stunned_turns = 0
+        self.sangramento_turns = 0
+        self.queimadura_turns = 0
     
     def esta_vivo(self):
         """Verifica se o personagem/inimigo está vivo."""
@@ -12,6 +12,15 @@ class Guerreiro(Personagem):
     Possui mais HP e defesa, mas menos mana.
     """
     
+    __slots__ = ()
+    
+    CUSTO_HABILIDADE = 15
+    # Faixas de dano e (chance, multiplicador) de crítico de cada golpe
+    FAIXA_ATAQUE = (0.9, 1.3)
+    CRITICO_ATAQUE = (0.18, 1.9)
+    FAIXA_HABILIDADE = (1.5, 2.0)
+    CRITICO_HABILIDADE = (0.15, 1.8)
+    
     def __init__(self, nome):
         """
         Inicializa um Guerreiro.
@@ -25,41 +34,39 @@ class Guerreiro(Personagem):
         self.dano_base = 12
         self.defesa = 8
     
-    def habilidade_especial(self):
+    def habilidade_especial(self, verbose=True):
         """
         Ataque devastador: causa muito dano, mas consome mana.
         
         Returns:
             int: Dano causado pela habilidade especial
         """
-        if self.mana >= 15:
-            import random
+        if self.mana >= self.CUSTO_HABILIDADE:
             from utils import calcular_critico
 
-            self.mana -= 15
+            self.mana -= self.CUSTO_HABILIDADE
             # Ataque devastador causa 150% a 200% do dano base
-            dano = int(self.dano_base * random.uniform(1.5, 2.0))
+            dano = int(self.dano_base * self.rng.uniform(*self.FAIXA_HABILIDADE))
 
             # Aplicar crítico com chance um pouco menor para ataques pesados
-            dano_final, _ = calcular_critico(dano, chance=0.15, multiplicador=1.8, animacao=False, verbose=False)
+            dano_final, _ = calcular_critico(dano, chance=self.CRITICO_HABILIDADE[0], multiplicador=self.CRITICO_HABILIDADE[1], rng=self.rng, animacao=False, verbose=False)
             return max(1, dano_final)
         return 0
     
-    def atacar(self):
+    def atacar(self, alvo=None, verbose=True):
         """
         Sobrescreve o método atacar para causar mais dano.
         
         Returns:
             int: Dano causado pelo ataque
         """
-        import random
         from utils import calcular_critico
 
         # Guerreiros causam mais dano físico
-        dano = int(self.dano_base * random.uniform(0.9, 1.3))
+        dano = int(self.dano_base * self.rng.uniform(*self.FAIXA_ATAQUE))
 
         # Chance de crítico ligeiramente reduzida para ataques físicos
-        dano_final, _ = calcular_critico(dano, chance=0.18, multiplicador=1.9, animacao=False, verbose=False)
+        dano_final, _ = calcular_critico(dano, chance=self.CRITICO_ATAQUE[0], multiplicador=self.CRITICO_ATAQUE[1], rng=self.rng, animacao=False, verbose=False)
         return max(1, dano_final)
 
 
@@ -69,6 +76,14 @@ class Mago(Personagem):
     Possui menos HP, mas mais mana e dano mágico.
     """
     
+    __slots__ = ()
+    
+    CUSTO_HABILIDADE = 20
+    FAIXA_ATAQUE = (0.85, 1.15)
+    CRITICO_ATAQUE = (0.22, 1.75)
+    FAIXA_HABILIDADE = (2.0, 2.5)
+    CRITICO_HABILIDADE = (0.20, 2.0)
+    
     def __init__(self, nome):
         """
         Inicializa um Mago.
@@ -82,40 +97,38 @@ class Mago(Personagem):
         self.dano_base = 8
         self.defesa = 3
     
-    def habilidade_especial(self):
+    def habilidade_especial(self, verbose=True):
         """
         Bola de fogo: causa dano mágico significativo.
         
         Returns:
             int: Dano causado pela habilidade especial
         """
-        if self.mana >= 20:
-            import random
+        if self.mana >= self.CUSTO_HABILIDADE:
             from utils import calcular_critico
 
-            self.mana -= 20
+            self.mana -= self.CUSTO_HABILIDADE
             # Bola de fogo causa 200% a 250% do dano base
-            dano = int(self.dano_base * random.uniform(2.0, 2.5))
+            dano = int(self.dano_base * self.rng.uniform(*self.FAIXA_HABILIDADE))
 
             # Magia tem a mesma chance padrão de crítico
-            dano_final, _ = calcular_critico(dano, chance=0.20, multiplicador=2.0, animacao=False, verbose=False)
+            dano_final, _ = calcular_critico(dano, chance=self.CRITICO_HABILIDADE[0], multiplicador=self.CRITICO_HABILIDADE[1], rng=self.rng, animacao=False, verbose=False)
             return max(1, dano_final)
         return 0
     
-    def atacar(self):
+    def atacar(self, alvo=None, verbose=True):
         """
         Sobrescreve o método atacar para usar magia básica.
         
         Returns:
             int: Dano causado pelo ataque
         """
-        import random
         from utils import calcular_critico
 
         # Magos causam dano mágico consistente
-        dano = int(self.dano_base * random.uniform(0.85, 1.15))
+        dano = int(self.dano_base * self.rng.uniform(*self.FAIXA_ATAQUE))
 
-        dano_final, _ = calcular_critico(dano, chance=0.22, multiplicador=1.75, animacao=False, verbose=False)
+        dano_final, _ = calcular_critico(dano, chance=self.CRITICO_ATAQUE[0], multiplicador=self.CRITICO_ATAQUE[1], rng=self.rng, animacao=False, verbose=False)
         return max(1, dano_final)
 
 
@@ -125,6 +138,12 @@ class Arqueiro(Personagem):
     Possui equilíbrio entre HP, mana e dano.
     """
     
+    __slots__ = ()
+    
+    CUSTO_HABILIDADE = 18
+    FAIXA_HABILIDADE = (1.4, 1.8)
+    CRITICO_HABILIDADE = (0.30, 1.5)
+    
     def __init__(self, nome):
         """
         Inicializa um Arqueiro.
@@ -138,23 +157,22 @@ class Arqueiro(Personagem):
         self.dano_base = 11
         self.defesa = 5
     
-    def habilidade_especial(self):
+    def habilidade_especial(self, verbose=True):
         """
         Chuva de flechas: ataque múltiplo com chance de crítico.
         
         Returns:
             int: Dano causado pela habilidade especial
         """
-        if self.mana >= 18:
-            import random
+        if self.mana >= self.CUSTO_HABILIDADE:
             from utils import calcular_critico
 
-            self.mana -= 18
+            self.mana -= self.CUSTO_HABILIDADE
             # Chuva de flechas causa 140% a 180% do dano base
-            dano = int(self.dano_base * random.uniform(1.4, 1.8))
+            dano = int(self.dano_base * self.rng.uniform(*self.FAIXA_HABILIDADE))
 
             # Usa calcular_critico com chance 30% e multiplicador 1.5
-            dano_final, _ = calcular_critico(dano, chance=0.30, multiplicador=1.5, animacao=False, verbose=False)
+            dano_final, _ = calcular_critico(dano, chance=self.CRITICO_HABILIDADE[0], multiplicador=self.CRITICO_HABILIDADE[1], rng=self.rng, animacao=False, verbose=False)
             return max(1, dano_final)
         return 0
 
@@ -0,0 +1,390 @@
+"""
+Módulo que implementa o motor de combate headless.
+Resolve o combate turno a turno a partir de uma política de ações,
+sem input() e sem print(), permitindo simulações em massa.
+"""
+
+from models.efeitos import AgendadorEfeitos, ATORDOAMENTO, MENSAGENS_EFEITO
+
+
+class PoliticaAtacar:
+    """Política que sempre realiza o ataque básico."""
+
+    def escolher(self, personagem, inimigo):
+        """
+        Escolhe a ação do turno.
+
+        Returns:
+            tuple: (ação, item) onde ação é "atacar", "habilidade" ou "item"
+        """
+        return "atacar", None
+
+
+class PoliticaHabilidade:
+    """Usa a habilidade especial sempre que houver mana; caso contrário, ataca."""
+
+    def escolher(self, personagem, inimigo):
+        if personagem.mana >= personagem.CUSTO_HABILIDADE:
+            return "habilidade", None
+        return "atacar", None
+
+
+class PoliticaPocao:
+    """
+    Bebe uma poção quando o HP cai abaixo de uma fração do HP máximo.
+    Nos demais turnos delega a escolha para outra política.
+    """
+
+    def __init__(self, limiar=0.3, base=None):
+        """
+        Args:
+            limiar (float): Fração do HP máximo abaixo da qual a poção é usada
+            base: Política usada quando não é hora de beber poção
+        """
+        self.limiar = limiar
+        self.base = base if base is not None else PoliticaHabilidade()
+
+    def escolher(self, personagem, inimigo):
+        if personagem.hp < personagem.hp_maximo * self.limiar:
+            item = personagem.inventario.obter("poção")
+            if item is not None:
+                return "item", item
+        return self.base.escolher(personagem, inimigo)
+
+
+# Políticas disponíveis por nome (usado por ferramentas de simulação)
+POLITICAS = {
+    "atacar": PoliticaAtacar,
+    "habilidade": PoliticaHabilidade,
+    "pocao": PoliticaPocao,
+}
+
+
+class ResultadoCombate:
+    """
+    Resultado estruturado de um combate.
+    """
+
+    def __init__(self, vitoria, turnos, dano_causado, dano_recebido, hp_restante):
+        self.vitoria = vitoria
+        self.turnos = turnos
+        self.dano_causado = dano_causado
+        self.dano_recebido = dano_recebido
+        self.hp_restante = hp_restante
+
+    def to_dict(self):
+        return {
+            "vitoria": self.vitoria,
+            "turnos": self.turnos,
+            "dano_causado": self.dano_causado,
+            "dano_recebido": self.dano_recebido,
+            "hp_restante": self.hp_restante,
+        }
+
+
+class Combate:
+    """
+    Combate entre um personagem e um inimigo, resolvido turno a turno.
+
+    As regras ficam todas aqui; quem chama decide as ações (uma política
+    automática ou o jogador) e, opcionalmente, para onde vão as mensagens.
+    """
+
+    def __init__(self, personagem, inimigo, logger=None, saida=None):
+        """
+        Args:
+            personagem: Instância do personagem do jogador
+            inimigo: Instância do inimigo
+            logger: Instância do logger para registrar eventos (opcional)
+            saida: Função que recebe as mensagens do combate (ex.: print ou
+                utils.saida.exibir). Se None (ou a saída nula), o combate
+                roda sem formatar nenhuma mensagem.
+        """
+        self.personagem = personagem
+        self.inimigo = inimigo
+        self.logger = logger
+        self.saida = saida
+        self.turno = 1
+        self.dano_causado = 0
+        self.dano_recebido = 0
+        self.efeitos = AgendadorEfeitos()
+
+    def encerrado(self):
+        """Verifica se um dos lados foi derrotado."""
+        return not (self.personagem.esta_vivo() and self.inimigo.esta_vivo())
+
+    def _golpear(self, dano):
+        """
+        Aplica o dano do personagem no inimigo (considerando a defesa).
+
+        Returns:
+            int: Dano real aplicado
+        """
+        dano_aplicado = self.inimigo.receber_dano_com_defesa(dano)
+        self.dano_causado += dano_aplicado
+        if self.saida:
+            self.saida(f"{self.personagem.nome} causa {dano_aplicado} de dano em {self.inimigo.nome}!")
+            self.saida(f"{self.inimigo.nome} agora tem {self.inimigo.hp} HP.")
+        return dano_aplicado
+
+    def _ataque_basico(self, verbose):
+        """
+        Ataque básico do personagem, incluindo os efeitos de status da sub-classe.
+
+        Returns:
+            int: Dano real aplicado
+        """
+        inimigo = self.inimigo
+        dano_aplicado = self._golpear(self.personagem.atacar(verbose=verbose))
+        if inimigo.esta_vivo():
+            for tipo, duracao, dano in self.personagem.rolar_efeitos():
+                self.efeitos.aplicar(inimigo, tipo, duracao, self.turno, dano)
+                if self.saida:
+                    self.saida(MENSAGENS_EFEITO[tipo].format(nome=inimigo.nome))
+        return dano_aplicado
+
+    def executar_turno(self, acao, item=None):
+        """
+        Executa um turno completo: ação do personagem e resposta do inimigo.
+
+        Args:
+            acao (str): "atacar", "habilidade" ou "item"
+            item: Item a ser usado quando a ação é "item". Se None, o
+                personagem ataca normalmente.
+        """
+        self._acao_personagem(acao, item)
+
+        # Efeitos de status (dano contínuo e expiração)
+        if self.efeitos:
+            self._processar_efeitos()
+
+        # Verifica se os inimigos foram derrotados
+        if not self._inimigos_restantes():
+            return
+
+        self._turno_inimigo()
+        self.turno += 1
+
+    def _acao_personagem(self, acao, item):
+        """Executa a ação escolhida pelo personagem contra o inimigo atual."""
+        personagem = self.personagem
+        saida = self.saida
+        logger = self.logger
+        verbose = bool(saida)
+
+        if acao == "habilidade":
+            dano = personagem.habilidade_especial(verbose=verbose)
+            if dano > 0:
+                if saida:
+                    saida(f"{personagem.nome} usa habilidade especial!")
+                dano_aplicado = self._golpear(dano)
+                if logger:
+                    logger.registrar(f"Turno {self.turno}: {personagem.nome} usou habilidade especial causando {dano_aplicado} de dano")
+            else:
+                if saida:
+                    saida(f"{personagem.nome} não tem mana suficiente para usar habilidade especial!")
+                # Se não tem mana, ataca normalmente
+                self._ataque_basico(verbose)
+
+        elif acao == "item":
+            if item is None:
+                if saida and not personagem.inventario:
+                    saida(f"{personagem.nome} não tem itens no inventário!")
+                # Sem item escolhido, ataca normalmente
+                self._ataque_basico(verbose)
+            elif personagem.usar_item(item):
+                if saida:
+                    saida(f"{personagem.nome} usou {item}!")
+                    saida(f"{personagem.nome} agora tem {personagem.hp} HP.")
+            elif saida:
+                saida(f"Não foi possível usar {item}.")
+
+        else:
+            dano_aplicado = self._ataque_basico(verbose)
+            if logger:
+                logger.registrar(f"Turno {self.turno}: {personagem.nome} causou {dano_aplicado} de dano")
+
+    def _inimigos_restantes(self):
+        """Verifica se ainda há inimigo vivo para responder neste turno."""
+        return self.inimigo.esta_vivo()
+
+    def _turno_inimigo(self):
+        """Regeneração e ataque do inimigo."""
+        personagem = self.personagem
+        inimigo = self.inimigo
+        saida = self.saida
+
+        # Regeneração do chefão (se aplicável)
+        if hasattr(inimigo, 'regenerar'):
+            inimigo.regenerar()
+
+        # Inimigo atordoado perde o ataque deste turno
+        if self.efeitos and self.efeitos.ativo(inimigo, ATORDOAMENTO):
+            if saida:
+                saida(f"{inimigo.nome} está atordoado e não consegue atacar!")
+            return
+
+        dano_inimigo = inimigo.atacar()
+        dano_aplicado = personagem.receber_dano(max(1, dano_inimigo - personagem.defesa))
+        self.dano_recebido += dano_aplicado
+        if saida:
+            saida(f"{inimigo.nome} causa {dano_aplicado} de dano em {personagem.nome}!")
+            saida(f"{personagem.nome} agora tem {personagem.hp} HP.")
+        if self.logger:
+            self.logger.registrar(f"Turno {self.turno}: {inimigo.nome} causou {dano_aplicado} de dano")
+
+    def _processar_efeitos(self):
+        """Aplica o dano dos efeitos ativos neste turno."""
+        for alvo, tipo, dano in self.efeitos.processar_turno(self.turno):
+            if alvo is not self.personagem:
+                self.dano_causado += dano
+            if self.saida:
+                self.saida(f"{alvo.nome} sofre {dano} de dano de {tipo}!")
+                self.saida(f"{alvo.nome} agora tem {alvo.hp} HP.")
+            if self.logger:
+                self.logger.registrar(f"Turno {self.turno}: {alvo.nome} sofreu {dano} de dano de {tipo}")
+
+    def resolver(self, politica):
+        """
+        Resolve o combate inteiro consultando a política a cada turno.
+
+        Args:
+            politica: Objeto com método escolher(personagem, inimigo)
+                que retorna uma tupla (ação, item)
+
+        Returns:
+            ResultadoCombate: Resultado do combate
+        """
+        personagem = self.personagem
+        saida = self.saida
+        # Saídas com buffer são descarregadas uma vez por turno
+        descarregar = getattr(saida, "descarregar", None) if saida else None
+        while not self.encerrado():
+            if saida:
+                saida(f"\n--- Turno {self.turno} ---")
+            acao, item = politica.escolher(personagem, self.inimigo)
+            self.executar_turno(acao, item)
+            if descarregar:
+                descarregar()
+        return self.resultado()
+
+    async def resolver_async(self, escolher):
+        """
+        Versão de resolver() em que a ação de cada turno vem de uma
+        corrotina (ex.: o jogador de uma sessão do servidor).
+
+        Args:
+            escolher: Corrotina escolher(personagem, inimigo) que retorna
+                uma tupla (ação, item)
+
+        Returns:
+            ResultadoCombate: Resultado do combate
+        """
+        personagem = self.personagem
+        saida = self.saida
+        descarregar = getattr(saida, "descarregar", None) if saida else None
+        while not self.encerrado():
+            if saida:
+                saida(f"\n--- Turno {self.turno} ---")
+            acao, item = await escolher(personagem, self.inimigo)
+            self.executar_turno(acao, item)
+            if descarregar:
+                descarregar()
+        return self.resultado()
+
+    def resultado(self):
+        """
+        Returns:
+            ResultadoCombate: Estado atual do combate
+        """
+        return ResultadoCombate(
+            self.personagem.esta_vivo(),
+            self.turno,
+            self.dano_causado,
+            self.dano_recebido,
+            self.personagem.hp,
+        )
+
+
+class CombateGrupo(Combate):
+    """
+    Combate entre um personagem e um grupo de inimigos.
+
+    O personagem golpeia um alvo por vez (o primeiro inimigo vivo); os
+    inimigos restantes atacam juntos, resolvidos em lote pelo GrupoInimigos.
+    """
+
+    def __init__(self, personagem, grupo, logger=None, saida=None):
+        """
+        Args:
+            personagem: Instância do personagem do jogador
+            grupo (GrupoInimigos): Inimigos enfrentados
+            logger: Instância do logger para registrar eventos (opcional)
+            saida: Função que recebe as mensagens do combate (opcional)
+        """
+        super().__init__(personagem, grupo.membros[0], logger, saida)
+        self.grupo = grupo
+
+    def encerrado(self):
+        """Verifica se o personagem ou todo o grupo foi derrotado."""
+        return not (self.personagem.esta_vivo() and self.grupo.vivos())
+
+    def _inimigos_restantes(self):
+        """Troca de alvo quando o atual cai; False se o grupo foi derrotado."""
+        if self.inimigo.esta_vivo():
+            return True
+        vivos = self.grupo.vivos()
+        if not vivos:
+            return False
+        if self.saida:
+            self.saida(f"{self.inimigo.nome} foi derrotado!")
+        self.inimigo = self.grupo.membros[vivos[0]]
+        if self.saida:
+            self.saida(f"Próximo alvo: {self.inimigo.nome} ({self.inimigo.hp} HP)")
+        return True
+
+    def _turno_inimigo(self):
+        """Regeneração e ataques de todos os inimigos vivos em uma passada."""
+        personagem = self.personagem
+        grupo = self.grupo
+        saida = self.saida
+
+        grupo.regenerar()
+
+        atacantes = grupo.vivos()
+        if self.efeitos:
+            atordoados = [i for i in atacantes if self.efeitos.ativo(grupo.membros[i], ATORDOAMENTO)]
+            if atordoados:
+                if saida:
+                    for i in atordoados:
+                        saida(f"{grupo.membros[i].nome} está atordoado e não consegue atacar!")
+                atacantes = [i for i in atacantes if i not in atordoados]
+        if not atacantes:
+            return
+
+        # Cada ataque é reduzido pela defesa; o total é aplicado de uma vez
+        defesa = personagem.defesa
+        danos = [max(1, dano - defesa) for dano in grupo.atacar(atacantes)]
+        hp_antes = personagem.hp
+        dano_aplicado = personagem.receber_dano(sum(danos))
+        self.dano_recebido += dano_aplicado
+
+        if saida:
+            hp = hp_antes
+            for i, dano in zip(atacantes, danos):
+                dano = min(dano, hp)
+                hp -= dano
+                saida(f"{grupo.membros[i].nome} causa {dano} de dano em {personagem.nome}!")
+            saida(f"{personagem.nome} agora tem {personagem.hp} HP.")
+        if self.logger:
+            self.logger.registrar(f"Turno {self.turno}: {len(atacantes)} inimigo(s) causaram {dano_aplicado} de dano")
+
+
+def resolver_combate(personagem, inimigo, politica, logger=None, saida=None):
+    """
+    Atalho para resolver um combate completo sem interação.
+
+    Returns:
+        ResultadoCombate: Resultado do combate
+    """
+    return Combate(personagem, inimigo, logger, saida).resolver(politica)
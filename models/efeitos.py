@@ -0,0 +1,92 @@
+"""
+Módulo que implementa os efeitos de status (atordoamento, sangramento e
+queimadura) aplicados durante o combate.
+"""
+
+import heapq
+from itertools import count
+
+
+# Tipos de efeito e o campo do alvo que mostra os turnos restantes
+ATORDOAMENTO = "atordoamento"
+SANGRAMENTO = "sangramento"
+QUEIMADURA = "queimadura"
+
+CAMPOS_EFEITO = {
+    ATORDOAMENTO: "stunned_turns",
+    SANGRAMENTO: "sangramento_turns",
+    QUEIMADURA: "queimadura_turns",
+}
+
+# Mensagens exibidas quando um efeito é aplicado
+MENSAGENS_EFEITO = {
+    ATORDOAMENTO: "{nome} foi ATORDOADO por 1 rodada!",
+    SANGRAMENTO: "{nome} está SANGRANDO!",
+    QUEIMADURA: "{nome} está QUEIMANDO!",
+}
+
+
+class AgendadorEfeitos:
+    """
+    Agenda os efeitos de status ativos em um combate.
+
+    Os efeitos ficam em um heap ordenado pelo turno em que expiram, de modo
+    que o custo de cada turno depende apenas dos efeitos ativos. Reaplicar
+    um efeito que já está ativo no mesmo alvo renova a sua duração.
+    """
+
+    def __init__(self):
+        self._heap = []
+        # (id do alvo, tipo) -> [expira, alvo, tipo, dano por turno]
+        self._ativos = {}
+        self._sequencia = count()
+
+    def __len__(self):
+        return len(self._ativos)
+
+    def aplicar(self, alvo, tipo, duracao, turno, dano=0):
+        """
+        Aplica (ou renova) um efeito no alvo.
+
+        Args:
+            alvo: Personagem ou inimigo afetado
+            tipo (str): ATORDOAMENTO, SANGRAMENTO ou QUEIMADURA
+            duracao (int): Número de turnos, contando o turno atual
+            turno (int): Turno em que o efeito foi aplicado
+            dano (int): Dano causado a cada turno (0 para efeitos sem dano)
+        """
+        expira = turno + duracao
+        chave = (id(alvo), tipo)
+        self._ativos[chave] = [expira, alvo, tipo, dano]
+        heapq.heappush(self._heap, (expira, next(self._sequencia), chave))
+        setattr(alvo, CAMPOS_EFEITO[tipo], duracao)
+
+    def processar_turno(self, turno):
+        """
+        Remove os efeitos expirados e aplica o dano dos efeitos ativos.
+
+        Args:
+            turno (int): Turno atual
+
+        Returns:
+            list: Tuplas (alvo, tipo, dano aplicado) dos efeitos com dano
+        """
+        heap = self._heap
+        while heap and heap[0][0] <= turno:
+            expira, _, chave = heapq.heappop(heap)
+            efeito = self._ativos.get(chave)
+            # Entradas antigas de efeitos renovados ficam no heap e são ignoradas
+            if efeito is not None and efeito[0] == expira:
+                del self._ativos[chave]
+                setattr(efeito[1], CAMPOS_EFEITO[efeito[2]], 0)
+
+        eventos = []
+        for expira, alvo, tipo, dano in self._ativos.values():
+            setattr(alvo, CAMPOS_EFEITO[tipo], expira - turno)
+            if dano and alvo.esta_vivo():
+                eventos.append((alvo, tipo, alvo.receber_dano(dano)))
+        return eventos
+
+    def ativo(self, alvo, tipo):
+        """Verifica se o alvo está sob um efeito."""
+        return (id(alvo), tipo) in self._ativos
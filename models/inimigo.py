@@ -2,8 +2,8 @@
 Módulo que define as classes de inimigos do jogo.
 """
 
-from models.base import Atributos
 import random
+from models.base import Atributos
 
 
 class Inimigo(Atributos):
@@ -11,6 +11,11 @@ class Inimigo(Atributos):
     Classe base para inimigos do jogo.
     """
     
+    __slots__ = ("dano", "xp_recompensa", "defesa")
+    
+    # Faixa de variação do dano (fração do dano base)
+    FAIXA_ATAQUE = (0.8, 1.2)
+    
     def __init__(self, nome, hp, dano, xp_recompensa=50):
         """
         Inicializa um inimigo.
@@ -34,7 +39,7 @@ class Inimigo(Atributos):
             int: Dano causado pelo ataque
         """
         # Dano varia entre 80% e 120% do dano base
-        dano = int(self.dano * random.uniform(0.8, 1.2))
+        dano = int(self.dano * self.rng.uniform(*self.FAIXA_ATAQUE))
         return max(1, dano)
     
     def receber_dano_com_defesa(self, dano):
@@ -56,6 +61,8 @@ class Goblin(Inimigo):
     Inimigo fraco, comum no início do jogo.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         """Inicializa um Goblin."""
         super().__init__("Goblin", 14, 3, xp_recompensa=30)
@@ -67,6 +74,10 @@ class Lobo(Inimigo):
     Inimigo de nível médio, mais rápido e agressivo.
     """
     
+    __slots__ = ()
+    
+    CHANCE_ATAQUE_DUPLO = 0.2
+    
     def __init__(self):
         """Inicializa um Lobo."""
         super().__init__("Lobo", 25, 5, xp_recompensa=50)
@@ -81,7 +92,7 @@ class Lobo(Inimigo):
         """
         dano_base = super().atacar()
         # 20% de chance de ataque duplo
-        if random.random() < 0.2:
+        if self.rng.random() < self.CHANCE_ATAQUE_DUPLO:
             return dano_base + super().atacar()
         return dano_base
 
@@ -91,6 +102,8 @@ class Orc(Inimigo):
     Inimigo forte, com muita vida e defesa.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         """Inicializa um Orc."""
         super().__init__("Orc", 40, 7, xp_recompensa=80)
@@ -102,6 +115,16 @@ class Chefao(Inimigo):
     Inimigo poderoso, com habilidades especiais.
     """
     
+    __slots__ = ("mana", "mana_maxima")
+    
+    # Chance, custo de mana e faixa de dano do ataque especial
+    CHANCE_ESPECIAL = 0.3
+    CUSTO_ESPECIAL = 20
+    FAIXA_ESPECIAL = (2.0, 2.5)
+    # Chance de regenerar e HP recuperado a cada turno
+    CHANCE_REGENERACAO = 0.2
+    CURA_REGENERACAO = 5
+    
     def __init__(self):
         """Inicializa um Chefão."""
         super().__init__("Chefão", 80, 10, xp_recompensa=200)
@@ -117,8 +140,8 @@ class Chefao(Inimigo):
             int: Dano causado pelo ataque
         """
         # 30% de chance de usar habilidade especial
-        if random.random() < 0.3 and self.mana >= 20:
-            self.mana -= 20
+        if self.rng.random() < self.CHANCE_ESPECIAL and self.mana >= self.CUSTO_ESPECIAL:
+            self.mana -= self.CUSTO_ESPECIAL
             return self.ataque_especial()
         return super().atacar()
     
@@ -130,13 +153,305 @@ class Chefao(Inimigo):
             int: Dano causado pelo ataque especial
         """
         # Ataque especial causa 200% a 250% do dano base
-        dano = int(self.dano * random.uniform(2.0, 2.5))
+        dano = int(self.dano * self.rng.uniform(*self.FAIXA_ESPECIAL))
         return max(1, dano)
     
     def regenerar(self):
         """
         Regenera um pouco de HP a cada turno (apenas chefões).
         """
-        if random.random() < 0.2:  # 20% de chance
-            self.curar(5)
+        if self.rng.random() < self.CHANCE_REGENERACAO:
+            self.curar(self.CURA_REGENERACAO)
+
+
+
+def _capturar_modelo(classe):
+    """
+    Constrói uma instância da classe uma única vez e guarda seus atributos
+    iniciais como modelo (tupla de pares nome/valor).
+    """
+    inimigo = classe()
+    nomes = []
+    for base in reversed(classe.__mro__):
+        nomes.extend(getattr(base, "__slots__", ()))
+    return tuple((nome, getattr(inimigo, nome)) for nome in nomes if nome != "rng")
+
+
+def _resetar(inimigo, modelo, rng):
+    """
+    Copia os atributos do modelo para uma instância (nova ou reciclada).
+    """
+    for nome, valor in modelo:
+        setattr(inimigo, nome, valor)
+    inimigo.rng = rng
+
+
+# Modelos pré-calculados de atributos de cada tipo de inimigo
+MODELOS_INIMIGOS = {classe: _capturar_modelo(classe) for classe in (Goblin, Lobo, Orc, Chefao)}
+
+
+class FabricaInimigos:
+    """
+    Cria inimigos a partir dos modelos pré-calculados, sem passar pela cadeia
+    de __init__, e reaproveita instâncias devolvidas com liberar().
+    """
+
+    def __init__(self, capacidade=64):
+        """
+        Args:
+            capacidade (int): Máximo de instâncias guardadas por tipo de inimigo
+        """
+        self.capacidade = capacidade
+        self._reservas = {}
+
+    def criar(self, classe, rng=None):
+        """
+        Retorna um inimigo novo (ou reciclado) com os atributos do modelo.
+
+        Args:
+            classe: Classe do inimigo (ex.: Goblin)
+            rng (random.Random, optional): Fonte de aleatoriedade do inimigo
+
+        Returns:
+            Inimigo: Instância pronta para o combate
+        """
+        modelo = MODELOS_INIMIGOS.get(classe)
+        if modelo is None:
+            modelo = MODELOS_INIMIGOS[classe] = _capturar_modelo(classe)
+
+        reserva = self._reservas.get(classe)
+        inimigo = reserva.pop() if reserva else classe.__new__(classe)
+        _resetar(inimigo, modelo, rng or random)
+        return inimigo
+
+    def liberar(self, inimigo):
+        """
+        Devolve um inimigo que não será mais usado para ser reaproveitado.
+
+        Args:
+            inimigo: Instância criada por esta fábrica
+        """
+        reserva = self._reservas.setdefault(type(inimigo), [])
+        if len(reserva) < self.capacidade:
+            reserva.append(inimigo)
+
+
+# Fábrica compartilhada usada pelas missões quando nenhuma outra é informada
+fabrica_inimigos = FabricaInimigos()
+
+
+# Formas de ataque resolvidas diretamente nas listas do grupo
+_ATAQUE_SIMPLES = 0
+_ATAQUE_DUPLO = 1
+_ATAQUE_CHEFAO = 2
+# Ataque sobrescrito por uma classe desconhecida: delega para a instância
+_ATAQUE_INSTANCIA = 3
+
+
+def _forma_ataque(classe):
+    """
+    Identifica como o ataque de uma classe de inimigo é resolvido no grupo.
+
+    Returns:
+        tuple: (forma, faixa de ataque, chance extra, custo, faixa especial)
+    """
+    if classe.atacar is Inimigo.atacar:
+        return (_ATAQUE_SIMPLES, classe.FAIXA_ATAQUE, 0, 0, None)
+    if classe.atacar is Lobo.atacar:
+        return (_ATAQUE_DUPLO, classe.FAIXA_ATAQUE, classe.CHANCE_ATAQUE_DUPLO, 0, None)
+    if classe.atacar is Chefao.atacar and classe.ataque_especial is Chefao.ataque_especial:
+        return (_ATAQUE_CHEFAO, classe.FAIXA_ATAQUE, classe.CHANCE_ESPECIAL,
+                classe.CUSTO_ESPECIAL, classe.FAIXA_ESPECIAL)
+    return (_ATAQUE_INSTANCIA, None, 0, 0, None)
+
+
+class MembroGrupo:
+    """
+    Visão de um inimigo dentro de um GrupoInimigos.
+
+    Lê e escreve o HP nas listas do grupo, para que o combate, as políticas
+    e os efeitos de status tratem cada membro como um inimigo comum.
+    """
+
+    __slots__ = ("grupo", "indice", "nome", "stunned_turns", "sangramento_turns", "queimadura_turns")
+
+    def __init__(self, grupo, indice, nome):
+        self.grupo = grupo
+        self.indice = indice
+        self.nome = nome
+        self.stunned_turns = 0
+        self.sangramento_turns = 0
+        self.queimadura_turns = 0
+
+    @property
+    def hp(self):
+        return self.grupo.hp[self.indice]
+
+    @hp.setter
+    def hp(self, valor):
+        self.grupo.hp[self.indice] = valor
+
+    @property
+    def hp_maximo(self):
+        return self.grupo.hp_maximo[self.indice]
+
+    @property
+    def dano(self):
+        return self.grupo.dano[self.indice]
+
+    @property
+    def defesa(self):
+        return self.grupo.defesa[self.indice]
+
+    @property
+    def xp_recompensa(self):
+        return self.grupo.inimigos[self.indice].xp_recompensa
+
+    def esta_vivo(self):
+        return self.grupo.hp[self.indice] > 0
+
+    def receber_dano(self, dano):
+        hp = self.grupo.hp
+        dano_real = min(dano, hp[self.indice])
+        hp[self.indice] -= dano_real
+        return dano_real
+
+    def receber_dano_com_defesa(self, dano):
+        return self.grupo.receber_dano_com_defesa(dano, (self.indice,))[0]
+
+    def curar(self, quantidade):
+        hp = self.grupo.hp
+        hp[self.indice] = min(hp[self.indice] + quantidade, self.grupo.hp_maximo[self.indice])
+
+    def get_barra_vida(self):
+        return Atributos.get_barra_vida(self)
+
+
+class GrupoInimigos:
+    """
+    Grupo de inimigos enfrentados ao mesmo tempo (ex.: três Goblins e um Lobo).
+
+    HP, dano, defesa e mana de cada inimigo ficam em listas paralelas, uma
+    posição por inimigo. Os ataques de todo o grupo e a redução de dano pela
+    defesa são resolvidos em uma única passada sobre essas listas, sem
+    despacho de métodos por inimigo. As instâncias originais só são
+    atualizadas ao chamar sincronizar().
+    """
+
+    def __init__(self, inimigos, rng=None):
+        """
+        Args:
+            inimigos (list): Instâncias dos inimigos do grupo
+            rng (random.Random, optional): Fonte de aleatoriedade dos ataques.
+                Se None, usa a do primeiro inimigo.
+        """
+        self.inimigos = list(inimigos)
+        if not self.inimigos:
+            raise ValueError("um grupo precisa de pelo menos um inimigo")
+        self.rng = rng or self.inimigos[0].rng
+
+        self.hp = [inimigo.hp for inimigo in self.inimigos]
+        self.hp_maximo = [inimigo.hp_maximo for inimigo in self.inimigos]
+        self.dano = [inimigo.dano for inimigo in self.inimigos]
+        self.defesa = [inimigo.defesa for inimigo in self.inimigos]
+        self.mana = [getattr(inimigo, "mana", 0) for inimigo in self.inimigos]
+        self.ataques = [_forma_ataque(type(inimigo)) for inimigo in self.inimigos]
+        self.regeneradores = [i for i, inimigo in enumerate(self.inimigos) if hasattr(inimigo, "regenerar")]
+
+        # Nomes numerados quando há inimigos repetidos ("Goblin 1", "Goblin 2")
+        total = {}
+        for inimigo in self.inimigos:
+            total[inimigo.nome] = total.get(inimigo.nome, 0) + 1
+        vistos = {}
+        self.membros = []
+        for i, inimigo in enumerate(self.inimigos):
+            nome = inimigo.nome
+            if total[nome] > 1:
+                vistos[nome] = vistos.get(nome, 0) + 1
+                nome = f"{nome} {vistos[nome]}"
+            self.membros.append(MembroGrupo(self, i, nome))
+
+    def __len__(self):
+        return len(self.inimigos)
+
+    def vivos(self):
+        """
+        Returns:
+            list: Índices dos inimigos ainda vivos
+        """
+        return [i for i, hp in enumerate(self.hp) if hp > 0]
+
+    def receber_dano_com_defesa(self, dano, indices=None):
+        """
+        Aplica o mesmo dano bruto em vários inimigos, descontando a defesa de cada um.
+
+        Args:
+            dano (int): Dano bruto recebido
+            indices (iterable, optional): Inimigos atingidos. Se None, todos os vivos.
+
+        Returns:
+            list: Dano real aplicado em cada inimigo, na ordem dos índices
+        """
+        hp = self.hp
+        defesa = self.defesa
+        aplicados = []
+        for i in (self.vivos() if indices is None else indices):
+            dano_real = min(max(1, dano - defesa[i]), hp[i])
+            hp[i] -= dano_real
+            aplicados.append(dano_real)
+        return aplicados
+
+    def atacar(self, indices):
+        """
+        Resolve os ataques dos inimigos indicados em uma única passada,
+        com as mesmas regras de Inimigo, Lobo e Chefao.
+
+        Args:
+            indices (list): Inimigos que atacam neste turno
+
+        Returns:
+            list: Dano bruto de cada ataque, na ordem dos índices
+        """
+        uniform = self.rng.uniform
+        aleatorio = self.rng.random
+        dano = self.dano
+        mana = self.mana
+        ataques = self.ataques
+        danos = []
+        for i in indices:
+            forma, faixa, chance, custo, faixa_especial = ataques[i]
+            if forma == _ATAQUE_CHEFAO:
+                if aleatorio() < chance and mana[i] >= custo:
+                    mana[i] -= custo
+                    danos.append(max(1, int(dano[i] * uniform(*faixa_especial))))
+                    continue
+            elif forma == _ATAQUE_INSTANCIA:
+                danos.append(self.inimigos[i].atacar())
+                continue
+            golpe = max(1, int(dano[i] * uniform(*faixa)))
+            if forma == _ATAQUE_DUPLO and aleatorio() < chance:
+                golpe += max(1, int(dano[i] * uniform(*faixa)))
+            danos.append(golpe)
+        return danos
+
+    def regenerar(self):
+        """Regeneração dos inimigos vivos que a possuem (chefões)."""
+        hp = self.hp
+        for i in self.regeneradores:
+            if hp[i] <= 0:
+                continue
+            inimigo = self.inimigos[i]
+            if type(inimigo).regenerar is Chefao.regenerar:
+                if self.rng.random() < inimigo.CHANCE_REGENERACAO:
+                    hp[i] = min(hp[i] + inimigo.CURA_REGENERACAO, self.hp_maximo[i])
+            else:
+                inimigo.hp = hp[i]
+                inimigo.regenerar()
+                hp[i] = inimigo.hp
 
+    def sincronizar(self):
+        """Copia HP e mana das listas de volta para as instâncias dos inimigos."""
+        for i, inimigo in enumerate(self.inimigos):
+            inimigo.hp = self.hp[i]
+            if hasattr(inimigo, "mana"):
+                inimigo.mana = self.mana[i]
@@ -1,67 +1,302 @@
+from utils.saida import exibir, ler
+
+
 class Item:
-    def __init__(self, nome, descricao):
-        self.nome = nome
-        self.descricao = descricao
+    """
+    Tipo de item. As instâncias do catálogo (ver obter_item) são
+    compartilhadas por todos os inventários e, por isso, imutáveis.
+    """
+
+    __slots__ = ("nome", "descricao", "efeito", "valor")
+
+    def __init__(self, nome, descricao, efeito=None, valor=0):
+        """
+        Args:
+            nome (str): Nome do item
+            descricao (str): Descrição exibida no inventário
+            efeito (str, optional): Chave do efeito em EFEITOS_ITEM (None se o item não é usável)
+            valor (int): Intensidade do efeito (HP curado, mana restaurada...)
+        """
+        object.__setattr__(self, "nome", nome)
+        object.__setattr__(self, "descricao", descricao)
+        object.__setattr__(self, "efeito", efeito)
+        object.__setattr__(self, "valor", valor)
+
+    def __setattr__(self, nome, valor):
+        raise AttributeError("itens são imutáveis")
 
     def __str__(self):
         return self.nome
 
+    def __repr__(self):
+        return f"Item({self.nome!r})"
+
+    def usar(self, personagem):
+        """
+        Aplica o efeito do item no personagem.
+
+        Returns:
+            bool: True se o item tem efeito e foi usado, False caso contrário
+        """
+        efeito = EFEITOS_ITEM.get(self.efeito)
+        if efeito is None:
+            return False
+        efeito(personagem, self.valor)
+        return True
+
+
+def _curar(personagem, valor):
+    personagem.curar(valor)
+
+
+def _restaurar_mana(personagem, valor):
+    personagem.mana = min(personagem.mana + valor, personagem.mana_maxima)
+
+
+# Efeitos de uso dos itens, indexados pela chave Item.efeito
+EFEITOS_ITEM = {
+    "cura": _curar,
+    "mana": _restaurar_mana,
+}
+
+# Catálogo de itens: uma única instância compartilhada por nome
+CATALOGO_ITENS = {}
+
+
+def registrar_item(nome, descricao, efeito=None, valor=0):
+    """
+    Adiciona (ou substitui) um tipo de item no catálogo.
+
+    Returns:
+        Item: Instância compartilhada do item
+    """
+    item = CATALOGO_ITENS[nome] = Item(nome, descricao, efeito, valor)
+    return item
+
+
+def obter_item(nome):
+    """
+    Retorna a instância compartilhada do item com o nome informado.
+    Nomes desconhecidos (ex.: vindos de saves antigos) são registrados
+    como itens sem efeito, para que também sejam compartilhados.
+
+    Args:
+        nome (str): Nome do item
+
+    Returns:
+        Item: Instância do catálogo
+    """
+    item = CATALOGO_ITENS.get(nome)
+    if item is None:
+        item = registrar_item(nome, "")
+    return item
+
+
+registrar_item("poção", "Recupera 30 de HP", "cura", 30)
+registrar_item("poção de mana", "Recupera 25 de mana", "mana", 25)
+registrar_item("elixir", "Líquido raro de efeito desconhecido")
+registrar_item("cristal", "Cristal brilhante, valioso para colecionadores")
+
+
 class Inventario:
-    def __init__(self):
-        self.itens = []
+    """
+    Inventário empilhado: itens com o mesmo nome ocupam uma única pilha
+    com a quantidade. As pilhas ficam em um dicionário indexado pelo nome,
+    então adicionar, usar e consultar um item não dependem do tamanho do
+    inventário; a exibição segue a ordem em que cada item foi obtido.
+    """
+
+    __slots__ = ("_quantidades", "_itens", "_resumo", "_versao")
+
+    def __init__(self, itens=None):
+        """
+        Args:
+            itens (iterable, optional): Itens (objetos Item ou nomes) iniciais
+        """
+        # nome -> quantidade e nome -> item exibido
+        self._quantidades = {}
+        self._itens = {}
+        self._resumo = None
+        # Contador de alterações (ver a propriedade versao)
+        self._versao = 0
+        for item in itens or ():
+            self.adicionar_item(item)
+
+    @staticmethod
+    def _nome(item):
+        return item.nome if hasattr(item, "nome") else str(item)
+
+    def __len__(self):
+        """Número total de itens, somando as pilhas."""
+        return sum(self._quantidades.values())
+
+    def __bool__(self):
+        return bool(self._quantidades)
+
+    def __iter__(self):
+        """Percorre um item de cada pilha, na ordem de exibição."""
+        return iter(self._itens.values())
+
+    def __contains__(self, item):
+        return self._nome(item) in self._quantidades
+
+    def __eq__(self, outro):
+        if isinstance(outro, Inventario):
+            return self._quantidades == outro._quantidades
+        return NotImplemented
+
+    def adicionar_item(self, item, quantidade=1):
+        """
+        Adiciona itens, empilhando com os de mesmo nome. Nomes são
+        resolvidos para a instância compartilhada do catálogo.
+
+        Args:
+            item: Objeto Item ou nome do item
+            quantidade (int): Quantidade adicionada (>= 1)
+        """
+        if quantidade < 1:
+            raise ValueError("quantidade deve ser >= 1")
+        nome = self._nome(item)
+        if nome in self._quantidades:
+            self._quantidades[nome] += quantidade
+        else:
+            self._quantidades[nome] = quantidade
+            self._itens[nome] = item if hasattr(item, "nome") else obter_item(nome)
+        self._resumo = None
+        self._versao += 1
 
-    def adicionar_item(self, item):
-        self.itens.append(item)
+    def remover(self, item, quantidade=1):
+        """
+        Remove itens de uma pilha; a pilha some quando chega a zero.
+
+        Args:
+            item: Objeto Item ou nome do item
+            quantidade (int): Quantidade removida (>= 1)
+
+        Returns:
+            bool: True se havia itens suficientes, False caso contrário
+        """
+        if quantidade < 1:
+            raise ValueError("quantidade deve ser >= 1")
+        nome = self._nome(item)
+        atual = self._quantidades.get(nome, 0)
+        if atual < quantidade:
+            return False
+        if atual == quantidade:
+            del self._quantidades[nome]
+            del self._itens[nome]
+        else:
+            self._quantidades[nome] = atual - quantidade
+        self._resumo = None
+        self._versao += 1
+        return True
+
+    @property
+    def versao(self):
+        """Número que muda a cada item adicionado ou removido."""
+        return self._versao
+
+    def quantidade(self, item):
+        """Quantidade de itens com o nome informado."""
+        return self._quantidades.get(self._nome(item), 0)
+
+    def obter(self, nome):
+        """
+        Returns:
+            O item da pilha com o nome informado, ou None
+        """
+        return self._itens.get(nome)
+
+    def pilhas(self):
+        """
+        Returns:
+            list: Tuplas (item, quantidade) na ordem de exibição
+        """
+        return [(item, self._quantidades[nome]) for nome, item in self._itens.items()]
+
+    def resumo(self):
+        """
+        Texto com as pilhas do inventário (ex.: "poção x3, elixir"),
+        recalculado apenas quando o inventário muda.
+        """
+        if self._resumo is None:
+            self._resumo = ", ".join(
+                nome if quantidade == 1 else f"{nome} x{quantidade}"
+                for nome, quantidade in self._quantidades.items()
+            )
+        return self._resumo
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: Quantidade por nome de item (formato do save)
+        """
+        return dict(self._quantidades)
+
+    @classmethod
+    def from_dict(cls, dados):
+        """
+        Reconstrói o inventário salvo. Aceita o formato atual (dicionário
+        nome -> quantidade) e o antigo (lista de nomes, um por item).
+        Quantidades menores que 1 levantam ValueError.
+        """
+        inventario = cls()
+        if isinstance(dados, dict):
+            for nome, quantidade in dados.items():
+                inventario.adicionar_item(nome, quantidade)
+        else:
+            for item in dados or ():
+                inventario.adicionar_item(item)
+        return inventario
 
     def listar_itens(self):
-        if not self.itens:
-            print("(vazio)")
+        if not self._quantidades:
+            exibir("(vazio)")
             return
-        for i, item in enumerate(self.itens, start=1):
+        for i, (item, quantidade) in enumerate(self.pilhas(), start=1):
             # Suporta tanto objetos Item quanto strings simples
-            if hasattr(item, "nome"):
-                nome = item.nome
-                descricao = getattr(item, "descricao", "")
-            else:
-                nome = str(item)
-                descricao = ""
-            print(f"{i}. {nome} - {descricao}")
+            nome = self._nome(item)
+            descricao = getattr(item, "descricao", "")
+            pilha = f" (x{quantidade})" if quantidade > 1 else ""
+            exibir(f"{i}. {nome} - {descricao}{pilha}")
 
     def usar_item(self, indice):
-        if indice < 1 or indice > len(self.itens):
-            print("Índice inválido!")
+        pilhas = self.pilhas()
+        if indice < 1 or indice > len(pilhas):
+            exibir("Índice inválido!")
             return
-        item = self.itens.pop(indice - 1)
+        item = pilhas[indice - 1][0]
+        self.remover(item)
         # Imprime nome adequadamente
-        nome = item.nome if hasattr(item, "nome") else str(item)
-        print(f"Você usou o item {nome}!")
+        nome = self._nome(item)
+        exibir(f"Você usou o item {nome}!")
 
 def main():
     inventario = Inventario()
 
     while True:
-        print("\n1. Adicionar item")
-        print("2. Listar itens")
-        print("3. Usar item")
-        print("4. Sair")
+        exibir("\n1. Adicionar item")
+        exibir("2. Listar itens")
+        exibir("3. Usar item")
+        exibir("4. Sair")
 
-        opcao = input("Escolha uma opção: ")
+        opcao = ler("Escolha uma opção: ")
 
         if opcao == "1":
-            nome = input("Digite o nome do item: ")
-            descricao = input("Digite a descrição do item: ")
+            nome = ler("Digite o nome do item: ")
+            descricao = ler("Digite a descrição do item: ")
             item = Item(nome, descricao)
             inventario.adicionar_item(item)
         elif opcao == "2":
             inventario.listar_itens()
         elif opcao == "3":
             inventario.listar_itens()
-            indice = int(input("Digite o número do item que deseja usar: "))
+            indice = int(ler("Digite o número do item que deseja usar: "))
             inventario.usar_item(indice)
         elif opcao == "4":
             break
         else:
-            print("Opção inválida!")
+            exibir("Opção inválida!")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
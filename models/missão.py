@@ -3,13 +3,30 @@ Módulo que define a classe Missao e o sistema de combate detalhado.
 """
 
 import random
-from models.inimigo import Inimigo, Goblin, Lobo, Orc, Chefao
+from models.inimigo import Inimigo, Goblin, Lobo, Orc, Chefao, GrupoInimigos, fabrica_inimigos
+from models.combate import Combate, CombateGrupo
+from models.inventario import obter_item
+from utils.saida import exibir, ler
+
+
+def _descrever(inimigos):
+    """
+    Descreve os inimigos de uma missão agrupando os repetidos.
+
+    Returns:
+        str: Ex.: "Orc" ou "Goblin x3, Lobo"
+    """
+    contagem = {}
+    for inimigo in inimigos:
+        contagem[inimigo.nome] = contagem.get(inimigo.nome, 0) + 1
+    return ", ".join(nome if total == 1 else f"{nome} x{total}" for nome, total in contagem.items())
 
 
 class Missao:
     """
     Classe que representa uma missão do jogo.
-    Contém um inimigo, recompensas e gerencia o combate detalhado.
+    Contém um inimigo (ou ondas de grupos de inimigos), recompensas e
+    gerencia o combate detalhado.
     """
     
     # Dicionário de tipos de inimigos disponíveis
@@ -19,23 +36,90 @@ class Missao:
         "difícil": [Orc, Chefao]
     }
     
-    # Dicionário de itens possíveis como recompensa
-    ITENS_POSSIVEIS = ["poção", "poção de mana", "elixir", "cristal"]
+    # Nomes das missões sorteadas pelo jogo (ver sortear)
+    NOMES = [
+        "Encontro na Floresta",
+        "Caverna Sombria",
+        "Ruínas Antigas",
+        "Torre do Mago",
+        "Covil do Dragão",
+        "Templo Perdido",
+        "Floresta Proibida",
+        "Montanha Gélida"
+    ]
+    
+    # Itens possíveis como recompensa (instâncias compartilhadas do catálogo)
+    ITENS_POSSIVEIS = [obter_item(nome) for nome in ("poção", "poção de mana", "elixir", "cristal")]
+    # Pergunta feita ao escolher um item durante o combate
+    PERGUNTA_ITEM = "Digite o número do item que deseja usar (0 para cancelar): "
     
-    def __init__(self, nome, dificuldade="médio"):
+    def __init__(self, nome, dificuldade="médio", rng=None, fabrica=None, ondas=None):
         """
         Inicializa uma missão.
         
         Args:
             nome (str): Nome da missão
             dificuldade (str): Nível de dificuldade ("fácil", "médio", "difícil")
+            rng (random.Random, optional): Fonte de aleatoriedade da missão e
+                do inimigo gerado. Se None, usa o módulo random global.
+            fabrica (FabricaInimigos, optional): Fábrica que cria o inimigo.
+                Se None, usa a fábrica compartilhada do módulo inimigo.
+            ondas (list, optional): Encontro em grupo: lista de ondas, cada
+                uma com as classes dos inimigos enfrentados juntos (ex.:
+                [[Goblin, Goblin, Goblin, Lobo]]). Se None, sorteia um único
+                inimigo pela dificuldade.
         """
         self.nome = nome
         self.dificuldade = dificuldade
-        self.inimigo = self._gerar_inimigo()
-        self.xp_recompensa = self.inimigo.xp_recompensa
+        self.rng = rng or random
+        self.fabrica = fabrica or fabrica_inimigos
+        if ondas:
+            self.ondas = [[self.fabrica.criar(classe, self.rng) for classe in onda] for onda in ondas]
+        else:
+            self.ondas = [[self._gerar_inimigo()]]
+        self.inimigos = [inimigo for onda in self.ondas for inimigo in onda]
+        self.inimigo = self.inimigos[0]
+        self.descricao = _descrever(self.inimigos)
+        self.xp_recompensa = sum(inimigo.xp_recompensa for inimigo in self.inimigos)
         self.itens_recompensa = self._gerar_recompensas()
     
+    @staticmethod
+    def dificuldade_por_nivel(nivel, rng=None):
+        """
+        Escolhe a dificuldade da missão a partir do nível do personagem.
+        
+        Args:
+            nivel (int): Nível do personagem
+            rng (random.Random, optional): Fonte de aleatoriedade
+            
+        Returns:
+            str: "fácil", "médio" ou "difícil"
+        """
+        rng = rng or random
+        if nivel <= 2:
+            return "fácil"
+        elif nivel <= 5:
+            return rng.choice(["fácil", "médio"])
+        return rng.choice(["médio", "difícil"])
+    
+    @classmethod
+    def sortear(cls, nivel, rng=None, fabrica=None):
+        """
+        Sorteia uma missão para um personagem do nível informado, como no
+        menu do jogo: dificuldade pelo nível e nome aleatório.
+        
+        Args:
+            nivel (int): Nível do personagem
+            rng (random.Random, optional): Fonte de aleatoriedade
+            fabrica (FabricaInimigos, optional): Fábrica que cria o inimigo
+            
+        Returns:
+            Missao: A missão sorteada
+        """
+        rng = rng or random
+        dificuldade = cls.dificuldade_por_nivel(nivel, rng)
+        return cls(rng.choice(cls.NOMES), dificuldade, rng=rng, fabrica=fabrica)
+    
     def _gerar_inimigo(self):
         """
         Gera um inimigo aleatório baseado na dificuldade.
@@ -44,8 +128,8 @@ class Missao:
             Inimigo: Instância de um inimigo
         """
         tipos = self.TIPOS_INIMIGOS.get(self.dificuldade, self.TIPOS_INIMIGOS["médio"])
-        classe_inimigo = random.choice(tipos)
-        return classe_inimigo()
+        classe_inimigo = self.rng.choice(tipos)
+        return self.fabrica.criar(classe_inimigo, self.rng)
     
     def _gerar_recompensas(self):
         """
@@ -56,192 +140,293 @@ class Missao:
         """
         itens = []
         # Chance de obter 1-2 itens
-        num_itens = random.randint(1, 2)
+        num_itens = self.rng.randint(1, 2)
         for _ in range(num_itens):
-            item = random.choice(self.ITENS_POSSIVEIS)
+            item = self.rng.choice(self.ITENS_POSSIVEIS)
             itens.append(item)
         return itens
     
-    def executar_combate(self, personagem, logger=None):
+    def executar_combate(self, personagem, logger=None, politica=None, saida=exibir):
         """
-        Executa o combate detalhado entre o personagem e o inimigo.
+        Executa o combate detalhado entre o personagem e o(s) inimigo(s).
+        As ondas são enfrentadas em sequência, sem recuperar HP entre elas.
         
         Args:
             personagem: Instância do personagem do jogador
             logger: Instância do logger para registrar eventos (opcional)
+            politica: Política de ações (ver models.combate). Se None, o
+                jogador escolhe as ações pelo teclado.
+            saida: Função que recebe as mensagens do combate. Padrão: a saída
+                definida em utils.saida. Use None para rodar sem nenhuma
+                saída (simulações).
             
         Returns:
             dict: Resultado do combate com informações sobre vitória/derrota
+        
+        Raises:
+            ValueError: Se a missão já foi executada (os inimigos já voltaram
+                para a fábrica)
+        """
+        self._verificar_inimigos()
+        politica = politica if politica is not None else self
+        try:
+            hp_inicial = personagem.hp
+            self._anunciar(personagem, logger, saida)
+            resultados = [combate.resolver(politica) for combate in self._ondas(personagem, logger, saida)]
+            vitoria = resultados[-1].vitoria
+            self._anunciar_resultado(personagem, saida, vitoria)
+            subiu_nivel = vitoria and personagem.ganhar_xp(self.xp_recompensa)
+            return self._concluir(personagem, logger, saida, resultados, hp_inicial, subiu_nivel)
+        finally:
+            # Terminado o combate, os inimigos voltam para a fábrica
+            self.liberar_inimigos()
+    
+    async def executar_combate_async(self, personagem, ler, logger=None, saida=exibir):
         """
-        print(f"\n=== Missão: {self.nome} ===")
-        print(f"Você encontrou um {self.inimigo.nome}!")
-        print(f"HP do inimigo: {self.inimigo.hp}")
+        Versão de executar_combate() em que o jogador escolhe as ações (e a
+        sub-classe, ao subir de nível) pela corrotina `ler`, com a
+        assinatura de input() (ver utils/servidor.py).
         
-        if logger:
-            logger.registrar(f"Iniciou missão: {self.nome} contra {self.inimigo.nome}")
+        Returns:
+            dict: Resultado do combate, como em executar_combate()
+        """
+        self._verificar_inimigos()
         
-        turno = 1
-        hp_inicial_personagem = personagem.hp
+        async def escolher(personagem, inimigo):
+            return await self.escolher_async(personagem, inimigo, ler)
         
-        while personagem.esta_vivo() and self.inimigo.esta_vivo():
-            print(f"\n--- Turno {turno} ---")
-            
-            # Turno do jogador
-            acao = self._escolher_acao(personagem)
-            
-            if acao == "atacar":
-                dano = personagem.atacar()
-                dano_aplicado = self.inimigo.receber_dano_com_defesa(dano)
-                print(f"{personagem.nome} causa {dano_aplicado} de dano em {self.inimigo.nome}!")
-                print(f"{self.inimigo.nome} agora tem {self.inimigo.hp} HP.")
-                
-                if logger:
-                    logger.registrar(f"Turno {turno}: {personagem.nome} causou {dano_aplicado} de dano")
-            
-            elif acao == "habilidade":
-                dano = personagem.habilidade_especial()
-                if dano > 0:
-                    print(f"{personagem.nome} usa habilidade especial!")
-                    dano_aplicado = self.inimigo.receber_dano_com_defesa(dano)
-                    print(f"{personagem.nome} causa {dano_aplicado} de dano em {self.inimigo.nome}!")
-                    print(f"{self.inimigo.nome} agora tem {self.inimigo.hp} HP.")
-                    
-                    if logger:
-                        logger.registrar(f"Turno {turno}: {personagem.nome} usou habilidade especial causando {dano_aplicado} de dano")
-                else:
-                    print(f"{personagem.nome} não tem mana suficiente para usar habilidade especial!")
-                    # Se não tem mana, ataca normalmente
-                    dano = personagem.atacar()
-                    dano_aplicado = self.inimigo.receber_dano_com_defesa(dano)
-                    print(f"{personagem.nome} causa {dano_aplicado} de dano em {self.inimigo.nome}!")
-                    print(f"{self.inimigo.nome} agora tem {self.inimigo.hp} HP.")
-            
-            elif acao == "item":
-                if personagem.inventario:
-                    # Lista itens e permite escolher qual usar
-                    while True:
-                        print("\nItens disponíveis:")
-                        for i, it in enumerate(personagem.inventario, start=1):
-                            print(f"[{i}] {it}")
-                        escolha_item = input("Digite o número do item que deseja usar (0 para cancelar): ").strip()
-                        if not escolha_item.isdigit():
-                            print("Entrada inválida! Digite um número.")
-                            continue
-                        escolha_num = int(escolha_item)
-                        if escolha_num == 0:
-                            print("Ação de item cancelada. Realizando ataque normal.")
-                            dano = personagem.atacar()
-                            dano_aplicado = self.inimigo.receber_dano_com_defesa(dano)
-                            print(f"{personagem.nome} causa {dano_aplicado} de dano em {self.inimigo.nome}!")
-                            print(f"{self.inimigo.nome} agora tem {self.inimigo.hp} HP.")
-                            break
-                        if escolha_num < 1 or escolha_num > len(personagem.inventario):
-                            print("Índice inválido! Tente novamente.")
-                            continue
-                        item = personagem.inventario[escolha_num - 1]
-                        if personagem.usar_item(item):
-                            print(f"{personagem.nome} usou {item}!")
-                            print(f"{personagem.nome} agora tem {personagem.hp} HP.")
-                        else:
-                            print(f"Não foi possível usar {item}.")
-                        break
-                else:
-                    print(f"{personagem.nome} não tem itens no inventário!")
-                    # Se não tem itens, ataca normalmente
-                    dano = personagem.atacar()
-                    dano_aplicado = self.inimigo.receber_dano_com_defesa(dano)
-                    print(f"{personagem.nome} causa {dano_aplicado} de dano em {self.inimigo.nome}!")
-                    print(f"{self.inimigo.nome} agora tem {self.inimigo.hp} HP.")
-            
-            # Verifica se o inimigo foi derrotado
-            if not self.inimigo.esta_vivo():
-                break
-            
-            # Regeneração do chefão (se aplicável)
-            if hasattr(self.inimigo, 'regenerar'):
-                self.inimigo.regenerar()
-            
-            # Turno do inimigo
-            dano_inimigo = self.inimigo.atacar()
-            dano_aplicado = personagem.receber_dano(max(1, dano_inimigo - personagem.defesa))
-            print(f"{self.inimigo.nome} causa {dano_aplicado} de dano em {personagem.nome}!")
-            print(f"{personagem.nome} agora tem {personagem.hp} HP.")
-            
-            if logger:
-                logger.registrar(f"Turno {turno}: {self.inimigo.nome} causou {dano_aplicado} de dano")
-            
-            turno += 1
+        try:
+            hp_inicial = personagem.hp
+            self._anunciar(personagem, logger, saida)
+            resultados = []
+            for combate in self._ondas(personagem, logger, saida):
+                resultados.append(await combate.resolver_async(escolher))
+            vitoria = resultados[-1].vitoria
+            self._anunciar_resultado(personagem, saida, vitoria)
+            subiu_nivel = vitoria and await personagem.ganhar_xp_async(self.xp_recompensa, ler)
+            return self._concluir(personagem, logger, saida, resultados, hp_inicial, subiu_nivel)
+        finally:
+            self.liberar_inimigos()
+    
+    def liberar_inimigos(self):
+        """
+        Devolve os inimigos da missão à fábrica que os criou, para serem
+        reaproveitados por outras missões. A missão deixa de referenciá-los
+        (inimigo passa a ser None); só tem efeito na primeira chamada.
+        """
+        inimigos = self.inimigos
+        self.ondas, self.inimigos, self.inimigo = [], [], None
+        for inimigo in inimigos:
+            self.fabrica.liberar(inimigo)
+    
+    def _verificar_inimigos(self):
+        """Impede um novo combate com inimigos já devolvidos à fábrica."""
+        if not self.inimigos:
+            raise ValueError("a missão já foi executada: seus inimigos voltaram para a fábrica")
+    
+    def _anunciar(self, personagem, logger, saida):
+        """Apresenta a missão e registra o início no log."""
+        if saida:
+            saida(f"\n=== Missão: {self.nome} ===")
+            if len(self.inimigos) == 1:
+                saida(f"Você encontrou um {self.inimigo.nome}!")
+                saida(f"HP do inimigo: {self.inimigo.hp}")
+            else:
+                saida(f"Você encontrou: {self.descricao}!")
         
-        # Resultado final
-        print(f"\n=== Resultado da Missão ===")
+        if logger:
+            logger.registrar(f"Iniciou missão: {self.nome} contra {self.descricao} (personagem: {personagem.nome})")
+    
+    def _ondas(self, personagem, logger, saida):
+        """
+        Gera o combate de cada onda, em sequência. Quem chama resolve cada
+        combate antes de pedir o próximo; a geração para na primeira derrota.
+        """
+        for numero, onda in enumerate(self.ondas, start=1):
+            if saida and len(self.ondas) > 1:
+                saida(f"\n--- Onda {numero}/{len(self.ondas)} ---")
+            if len(onda) == 1:
+                grupo = None
+                combate = Combate(personagem, onda[0], logger, saida)
+            else:
+                grupo = GrupoInimigos(onda, self.rng)
+                if saida:
+                    for membro in grupo.membros:
+                        saida(f"{membro.nome}: {membro.hp} HP")
+                combate = CombateGrupo(personagem, grupo, logger, saida)
+            yield combate
+            if grupo is not None:
+                grupo.sincronizar()
+            if not personagem.esta_vivo():
+                return
+    
+    def _anunciar_resultado(self, personagem, saida, vitoria):
+        """Exibe o resultado antes de o XP ser aplicado."""
+        if saida:
+            saida(f"\n=== Resultado da Missão ===")
+            if vitoria:
+                saida(f"{personagem.nome} venceu o combate!")
+                saida(f"XP ganho: {self.xp_recompensa}")
+    
+    def _concluir(self, personagem, logger, saida, resultados, hp_inicial, subiu_nivel):
+        """
+        Entrega as recompensas (ou restaura o HP na derrota) e monta o
+        resultado da missão a partir dos resultados das ondas enfrentadas.
+        """
+        turnos = sum(resultado.turnos for resultado in resultados)
+        dano_causado = sum(resultado.dano_causado for resultado in resultados)
+        dano_recebido = sum(resultado.dano_recebido for resultado in resultados)
         
-        if personagem.esta_vivo():
-            print(f"{personagem.nome} venceu o combate!")
-            print(f"XP ganho: {self.xp_recompensa}")
-            
-            subiu_nivel = personagem.ganhar_xp(self.xp_recompensa)
-            if subiu_nivel:
-                print(f"\n🎉 {personagem.nome} subiu para o nível {personagem.nivel}!")
-                print(f"HP máximo aumentou para {personagem.hp_maximo}!")
+        if resultados[-1].vitoria:
+            if subiu_nivel and saida:
+                saida(f"\n🎉 {personagem.nome} subiu para o nível {personagem.nivel}!")
+                saida(f"HP máximo aumentou para {personagem.hp_maximo}!")
             
             if self.itens_recompensa:
-                print(f"Itens obtidos: {', '.join(self.itens_recompensa)}")
+                if saida:
+                    saida(f"Itens obtidos: {', '.join(map(str, self.itens_recompensa))}")
                 for item in self.itens_recompensa:
                     personagem.adicionar_item(item)
             
             if logger:
-                logger.registrar(f"Missão concluída: {personagem.nome} venceu {self.inimigo.nome}")
-                logger.registrar(f"XP ganho: {self.xp_recompensa}, Itens: {', '.join(self.itens_recompensa)}")
+                logger.registrar(f"Missão concluída: {personagem.nome} venceu {self.descricao}")
+                logger.registrar(f"XP ganho: {self.xp_recompensa}, Itens: {', '.join(map(str, self.itens_recompensa))}")
             
             return {
                 "vitoria": True,
                 "xp": self.xp_recompensa,
                 "itens": self.itens_recompensa,
-                "subiu_nivel": subiu_nivel
+                "subiu_nivel": subiu_nivel,
+                "turnos": turnos,
+                "dano_causado": dano_causado,
+                "dano_recebido": dano_recebido
             }
         else:
-            print(f"{personagem.nome} foi derrotado!")
-            print(f"Você perdeu a missão.")
+            if saida:
+                saida(f"{personagem.nome} foi derrotado!")
+                saida(f"Você perdeu a missão.")
             
             # Restaura HP inicial em caso de derrota (opcional - pode remover)
-            personagem.hp = hp_inicial_personagem
+            personagem.hp = hp_inicial
             
             if logger:
-                logger.registrar(f"Missão falhou: {personagem.nome} foi derrotado por {self.inimigo.nome}")
+                logger.registrar(f"Missão falhou: {personagem.nome} foi derrotado por {self.descricao}")
             
             return {
                 "vitoria": False,
                 "xp": 0,
                 "itens": [],
-                "subiu_nivel": False
+                "subiu_nivel": False,
+                "turnos": turnos,
+                "dano_causado": dano_causado,
+                "dano_recebido": dano_recebido
             }
     
-    def _escolher_acao(self, personagem):
+    def escolher(self, personagem, inimigo):
+        """
+        Política interativa: o jogador escolhe a ação pelo teclado.
+        
+        Returns:
+            tuple: (ação, item) no formato esperado por models.combate
+        """
+        acao = None
+        while acao is None:
+            self._exibir_acoes(personagem)
+            acao = self._acao_escolhida(personagem, ler("> ").strip())
+        if acao == "item":
+            return acao, self._escolher_item(personagem)
+        return acao, None
+    
+    async def escolher_async(self, personagem, inimigo, ler):
+        """
+        Versão de escolher() com as respostas lidas pela corrotina `ler`.
+        
+        Returns:
+            tuple: (ação, item) no formato esperado por models.combate
+        """
+        acao = None
+        while acao is None:
+            self._exibir_acoes(personagem)
+            acao = self._acao_escolhida(personagem, (await ler("> ")).strip())
+        if acao == "item":
+            return acao, await self._escolher_item_async(personagem, ler)
+        return acao, None
+    
+    def _escolher_item(self, personagem):
         """
-        Permite ao jogador escolher uma ação durante o combate.
+        Lista os itens do inventário e permite escolher qual usar.
         
         Args:
             personagem: Instância do personagem
             
         Returns:
-            str: Ação escolhida ("atacar", "habilidade", "item")
+            O item escolhido, ou None se a ação foi cancelada
         """
+        pilhas = personagem.inventario.pilhas()
         while True:
-            print(f"\nEscolha sua ação:")
-            print(f"[1] Atacar")
-            print(f"[2] Habilidade Especial (Mana: {personagem.mana}/{personagem.mana_maxima})")
-            if personagem.inventario:
-                inventario_str = ', '.join(it.nome if hasattr(it, 'nome') else str(it) for it in personagem.inventario)
-                print(f"[3] Usar Item (Inventário: {inventario_str})")
-            
-            escolha = input("> ").strip()
-            
-            if escolha == "1":
-                return "atacar"
-            elif escolha == "2":
-                return "habilidade"
-            elif escolha == "3" and personagem.inventario:
-                return "item"
-            else:
-                print("Opção inválida! Tente novamente.")
-
+            self._exibir_itens(pilhas)
+            valida, item = self._item_escolhido(pilhas, ler(self.PERGUNTA_ITEM).strip())
+            if valida:
+                return item
+    
+    async def _escolher_item_async(self, personagem, ler):
+        """Versão de _escolher_item() com as respostas lidas pela corrotina `ler`."""
+        pilhas = personagem.inventario.pilhas()
+        while True:
+            self._exibir_itens(pilhas)
+            valida, item = self._item_escolhido(pilhas, (await ler(self.PERGUNTA_ITEM)).strip())
+            if valida:
+                return item
+    
+    @staticmethod
+    def _exibir_itens(pilhas):
+        """Lista os itens que podem ser usados no combate."""
+        exibir("\nItens disponíveis:")
+        for i, (it, quantidade) in enumerate(pilhas, start=1):
+            exibir(f"[{i}] {it} (x{quantidade})" if quantidade > 1 else f"[{i}] {it}")
+    
+    @staticmethod
+    def _item_escolhido(pilhas, escolha_item):
+        """
+        Interpreta a resposta do jogador na lista de itens.
+        
+        Returns:
+            tuple: (resposta válida, item escolhido ou None se a ação foi cancelada)
+        """
+        if not escolha_item.isdigit():
+            exibir("Entrada inválida! Digite um número.")
+            return False, None
+        escolha_num = int(escolha_item)
+        if escolha_num == 0:
+            exibir("Ação de item cancelada. Realizando ataque normal.")
+            return True, None
+        if escolha_num < 1 or escolha_num > len(pilhas):
+            exibir("Índice inválido! Tente novamente.")
+            return False, None
+        return True, pilhas[escolha_num - 1][0]
+    
+    @staticmethod
+    def _exibir_acoes(personagem):
+        """Mostra as ações disponíveis durante o combate."""
+        exibir(f"\nEscolha sua ação:")
+        exibir(f"[1] Atacar")
+        exibir(f"[2] Habilidade Especial (Mana: {personagem.mana}/{personagem.mana_maxima})")
+        if personagem.inventario:
+            exibir(f"[3] Usar Item (Inventário: {personagem.inventario.resumo()})")
+    
+    @staticmethod
+    def _acao_escolhida(personagem, escolha):
+        """
+        Interpreta a ação escolhida pelo jogador.
+        
+        Returns:
+            str: "atacar", "habilidade" ou "item", ou None se a opção é inválida
+        """
+        if escolha == "1":
+            return "atacar"
+        elif escolha == "2":
+            return "habilidade"
+        elif escolha == "3" and personagem.inventario:
+            return "item"
+        exibir("Opção inválida! Tente novamente.")
+        return None
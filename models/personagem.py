@@ -2,8 +2,109 @@
 Módulo que define a classe Personagem e suas funcionalidades.
 """
 
+from bisect import bisect_right
+
 from models.base import Atributos
-import random
+from models.inventario import Inventario, obter_item
+from utils.saida import exibir, ler
+from models.efeitos import ATORDOAMENTO, SANGRAMENTO, QUEIMADURA, CAMPOS_EFEITO, MENSAGENS_EFEITO
+
+
+# Sub-classes disponíveis para cada classe, na ordem do menu
+SUBCLASSES = {
+    "Guerreiro": ("Berserker", "Paladino"),
+    "Arqueiro": ("Caçador", "Patrulheiro"),
+    "Mago": ("Piromante", "Clerigo"),
+}
+
+# Bônus de cada sub-classe: atributo -> valor somado ao atributo atual
+# (efeitos de status e cura partem de 0 e buff_dano de 1.0)
+MODIFICADORES_SUBCLASSE = {
+    "Berserker": {"dano_base": 10, "hp_maximo": -20, "crit_chance": 0.10},
+    "Paladino": {"hp_maximo": 30, "defesa": 5, "dano_base": -5},
+    "Caçador": {"dot_sangramento": 0.30, "stun_chance": 0.15},
+    "Patrulheiro": {"buff_dano": 0.20, "crit_chance": 0.10},
+    "Piromante": {"dano_base": 8, "chance_queimadura": 0.30},
+    "Clerigo": {"mana_maxima": 20, "cura_base": 20},
+}
+
+# Nível em que o menu de sub-classe é oferecido
+NIVEL_SUBCLASSE = 4
+
+# Versão do esquema de to_dict() (o formato dos saves). Histórico:
+#   1  saves sem o campo "versao": qualquer campo pode faltar e o inventário
+#      pode ser uma lista de nomes, um por item
+#   2  todos os campos de to_dict(), inventário como nome -> quantidade
+# Ao mudar o formato, incremente a versão e registre a migração da versão
+# anterior em utils/migracao.MIGRACOES.
+VERSAO_SAVE = 2
+
+# Campos de to_dict() que vêm de atributos, na ordem do save (ver
+# Personagem.alteracoes)
+_CAMPOS_SALVOS = (
+    "nome", "classe", "sub_classe", "hp", "hp_maximo", "nivel", "xp",
+    "xp_proximo_nivel", "inventario", "mana", "mana_maxima", "dano_base",
+    "defesa", "crit_chance", "stun_chance", "dot_sangramento", "buff_dano",
+    "chance_queimadura", "cura_base",
+)
+
+# Curva de XP: o nível 1 custa 100 XP e cada nível seguinte custa 1,5x o
+# anterior (truncado). As tabelas são indexadas pelo nível (o índice 0 não
+# é usado) e crescem sob demanda:
+#   _CUSTO_NIVEL[n]   -> XP necessário para passar do nível n ao n + 1
+#   _XP_ACUMULADO[n]  -> XP total necessário para chegar ao nível n
+_CUSTO_NIVEL = [0, 100]
+_XP_ACUMULADO = [0, 0]
+
+
+def _estender_curva(nivel):
+    """Calcula a curva de XP até `nivel`, se ainda não calculada."""
+    while len(_XP_ACUMULADO) <= nivel:
+        ultimo = len(_XP_ACUMULADO) - 1
+        _XP_ACUMULADO.append(_XP_ACUMULADO[ultimo] + _CUSTO_NIVEL[ultimo])
+        # Aritmética inteira: igual a int(custo * 1.5) sem perder precisão
+        # (nem estourar o float) nos níveis altos
+        _CUSTO_NIVEL.append(_CUSTO_NIVEL[ultimo] * 3 // 2)
+
+
+def custo_nivel(nivel):
+    """
+    Args:
+        nivel (int): Nível atual
+
+    Returns:
+        int: XP necessário para passar de `nivel` para o seguinte
+    """
+    _estender_curva(nivel)
+    return _CUSTO_NIVEL[nivel]
+
+
+def xp_acumulado(nivel):
+    """
+    Args:
+        nivel (int): Nível desejado
+
+    Returns:
+        int: XP total necessário para chegar a `nivel` a partir do nível 1
+    """
+    _estender_curva(nivel)
+    return _XP_ACUMULADO[nivel]
+
+
+def nivel_por_xp(total):
+    """
+    Busca binária na curva de XP.
+
+    Args:
+        total (int): XP total acumulado desde o nível 1
+
+    Returns:
+        int: Nível alcançado com esse XP
+    """
+    # Os custos crescem geometricamente: estender até passar do total é O(log total)
+    while _XP_ACUMULADO[-1] <= total:
+        _estender_curva(len(_XP_ACUMULADO))
+    return bisect_right(_XP_ACUMULADO, total) - 1
 
 
 class Personagem(Atributos):
@@ -12,15 +113,39 @@ class Personagem(Atributos):
     Herda de Atributos e adiciona funcionalidades específicas do jogador.
     """
 
+    __slots__ = (
+        "classe", "sub_classe", "nivel", "xp", "xp_proximo_nivel",
+        "inventario", "mana", "mana_maxima", "dano_base", "defesa",
+        "crit_chance", "stun_chance", "dot_sangramento", "buff_dano",
+        "chance_queimadura", "cura_base", "_salvo", "_salvo_em",
+        "_inventario_salvo",
+    )
+
+    # Mana consumida pela habilidade especial
+    CUSTO_HABILIDADE = 20
+    # Faixas de variação do dano (fração do dano base) e multiplicadores de crítico
+    FAIXA_ATAQUE = (0.8, 1.2)
+    FAIXA_HABILIDADE = (1.3, 1.7)
+    MULT_CRITICO_ATAQUE = 1.8
+    MULT_CRITICO_HABILIDADE = 2
+    # Efeitos de status: duração em turnos e dano por turno (fração do dano base)
+    DURACAO_ATORDOAMENTO = 1
+    DURACAO_DOT = 2
+    FRACAO_DANO_DOT = 0.3
+    # Ganhos de atributos por nível
+    GANHO_HP_NIVEL = 20
+    GANHO_DANO_NIVEL = 2
+    GANHO_DEFESA_NIVEL = 1
+
     def __init__(self, nome, classe, hp=100, nivel=1, xp=0):
         super().__init__(nome, hp, hp)
         self.classe = classe
         self.sub_classe = None
         self.nivel = nivel
         self.xp = xp
-        self.xp_proximo_nivel = 100
+        self.xp_proximo_nivel = custo_nivel(nivel)
 
-        self.inventario = []
+        self.inventario = Inventario()
         self.mana = 50
         self.mana_maxima = 50
         self.dano_base = 10
@@ -33,167 +158,240 @@ class Personagem(Atributos):
         self.chance_queimadura = 0.0
         self.cura_base = 0
 
+        # Último estado persistido e onde foi gravado (ver alteracoes/marcar_salvo)
+        self._salvo = None
+        self._salvo_em = None
+        self._inventario_salvo = None
+
     def subclasse(self):
-        if self.nivel < 4:
-            print(f"Seu nível atual é {self.nivel}. É necessário ter nível 4 ou maior para escolher uma sub-classe.")
-            return
+        opcoes = self._opcoes_subclasse()
+        if opcoes:
+            self._escolher_subclasse(opcoes, ler("Escolha: "))
+
+    async def subclasse_async(self, ler):
+        """
+        Versão de subclasse() com a escolha lida pela corrotina `ler`
+        (ver utils/servidor.py).
+        """
+        opcoes = self._opcoes_subclasse()
+        if opcoes:
+            self._escolher_subclasse(opcoes, await ler("Escolha: "))
+
+    def _opcoes_subclasse(self):
+        """
+        Exibe o menu de sub-classe, se o personagem pode escolher uma.
+
+        Returns:
+            tuple: Sub-classes oferecidas, ou None se não há escolha
+        """
+        if self.nivel < NIVEL_SUBCLASSE:
+            exibir(f"Seu nível atual é {self.nivel}. É necessário ter nível {NIVEL_SUBCLASSE} ou maior para escolher uma sub-classe.")
+            return None
 
         if self.sub_classe is not None:
-            print(f"Você já escolheu a sub-classe: {self.sub_classe}")
-            return
+            exibir(f"Você já escolheu a sub-classe: {self.sub_classe}")
+            return None
 
-        print("\n==== Escolha de Sub-Classe ====\n")
-        if self.classe == "Guerreiro":
-            print("1 - Berserker")
-            print("2 - Paladino")
-            escolha = input("Escolha: ")
-            if escolha == "1":
-                self.sub_classe = "Berserker"
-                self.dano_base += 10
-                self.hp_maximo -= 20
-                # Se o HP máximo foi reduzido, garante que o HP atual não fique maior que o máximo
-                if self.hp > self.hp_maximo:
-                    self.hp = self.hp_maximo
-                self.crit_chance += 0.10
-                print("Agora você é um Berserker")
-            elif escolha == "2":
-                self.sub_classe = "Paladino"
-                self.hp_maximo += 30
-                self.defesa += 5
-                self.dano_base -= 5
-                print("Agora você é um Paladino")
-            else:
-                print("Escolha inválida.")
-            return
+        if self.classe not in SUBCLASSES:
+            exibir("Classe inválida.")
+            return None
 
-        elif self.classe == "Arqueiro":
-            print("1 - Caçador")
-            print("2 - Patrulheiro")
-            escolha = input("Escolha: ")
-            if escolha == "1":
-                self.sub_classe = "Caçador"
-                self.dot_sangramento = 0.30
-                self.stun_chance = 0.15
-                print("Agora você é um Caçador")
-            elif escolha == "2":
-                self.sub_classe = "Patrulheiro"
-                self.buff_dano = 1.20
-                self.crit_chance += 0.10
-                print("Agora você é um Patrulheiro")
-            else:
-                print("Escolha inválida.")
-            return
+        exibir("\n==== Escolha de Sub-Classe ====\n")
+        opcoes = SUBCLASSES[self.classe]
+        for indice, nome in enumerate(opcoes, 1):
+            exibir(f"{indice} - {nome}")
+        return opcoes
 
-        elif self.classe == "Mago":
-            print("1 - Piromante")
-            print("2 - Clérigo")
-            escolha = input("Escolha: ")
-            if escolha == "1":
-                self.sub_classe = "Piromante"
-                self.dano_base += 8
-                self.chance_queimadura = 0.30
-                print("Agora você é um Piromante")
-            elif escolha == "2":
-                self.sub_classe = "Clerigo"
-                self.mana_maxima += 20
-                self.cura_base = 20
-                print("Agora você é um Clerigo")
-            else:
-                print("Escolha inválida.")
-            return
+    def _escolher_subclasse(self, opcoes, escolha):
+        """Aplica a sub-classe escolhida no menu ("1" ou "2")."""
+        if escolha in ("1", "2"):
+            self.aplicar_subclasse(opcoes[int(escolha) - 1])
+            exibir(f"Agora você é um {self.sub_classe}")
         else:
-            print("Classe inválida.")
+            exibir("Escolha inválida.")
+
+    def aplicar_subclasse(self, nome, modificadores=None):
+        """
+        Aplica os bônus de uma sub-classe, sem menu nem verificação de nível
+        (usado pelo menu e pelas simulações).
+
+        Args:
+            nome (str): Nome da sub-classe (ver SUBCLASSES)
+            modificadores (dict, optional): Bônus usados no lugar dos de
+                MODIFICADORES_SUBCLASSE[nome] (usado pelo balanceamento)
 
-    def atacar(self, alvo=None):
+        Returns:
+            bool: True se a sub-classe pertence à classe do personagem
+        """
+        if nome not in SUBCLASSES.get(self.classe, ()):
+            return False
+
+        if modificadores is None:
+            modificadores = MODIFICADORES_SUBCLASSE[nome]
+        for atributo, delta in modificadores.items():
+            setattr(self, atributo, getattr(self, atributo) + delta)
+        # Se o HP máximo foi reduzido, garante que o HP atual não fique maior que o máximo
+        if self.hp > self.hp_maximo:
+            self.hp = self.hp_maximo
+        self.sub_classe = nome
+        return True
+
+    def atacar(self, alvo=None, verbose=True):
         """Realiza um ataque. `alvo` é opcional para permitir chamadas de smoke-tests
         que apenas verificam o cálculo de dano sem um alvo concreto.
+        Com `verbose=False` nenhuma mensagem é exibida (combate headless).
         """
+        # Com a saída nula as mensagens nem chegam a ser formatadas
+        verbose = verbose and bool(exibir)
 
-        dano = int(self.dano_base * random.uniform(0.8, 1.2))
+        dano = int(self.dano_base * self.rng.uniform(*self.FAIXA_ATAQUE))
         dano = int(dano * self.buff_dano)
 
         
-        if random.random() < self.crit_chance:
-            dano = int(dano * 1.8)
-            print(f"**CRÍTICO**")
+        if self.rng.random() < self.crit_chance:
+            dano = int(dano * self.MULT_CRITICO_ATAQUE)
+            if verbose:
+                exibir(f"**CRÍTICO**")
 
         # Redução pela defesa do alvo (se houver)
         defesa_alvo = getattr(alvo, "defesa", 0) if alvo is not None else 0
         dano_final = max(1, dano - defesa_alvo)
+        if verbose:
+            if alvo is not None:
+                exibir(f"{self.nome} causou {dano_final} de dano em {alvo.nome}!")
+            else:
+                exibir(f"{self.nome} causou {dano_final} de dano!")
+
+        # Efeitos de status das sub-classes (o combate usa rolar_efeitos diretamente)
         if alvo is not None:
-            print(f"{self.nome} causou {dano_final} de dano em {alvo.nome}!")
-        else:
-            print(f"{self.nome} causou {dano_final} de dano!")
+            for tipo, duracao, _ in self.rolar_efeitos():
+                setattr(alvo, CAMPOS_EFEITO[tipo], duracao)
+                if verbose:
+                    exibir(MENSAGENS_EFEITO[tipo].format(nome=alvo.nome))
 
-        #chance de stun
-        if alvo is not None and self.sub_classe == "Caçador":
-            roll = random.random()
-            if roll < self.stun_chance:
-                setattr(alvo, "stunned_turns", 1)
-                print(f"{alvo.nome} foi ATORDOADO por 1 rodada! (roll={roll:.2f})")
+        return dano_final
 
-        #chance de sangramento
-        if alvo is not None and self.sub_classe == "Caçador" and random.random() < self.dot_sangramento:
-            setattr(alvo, "sangramento_turns", 2)
-            print(f"{alvo.nome} está SANGRANDO!")
+    def rolar_efeitos(self):
+        """
+        Sorteia os efeitos de status que um ataque básico aplica no alvo.
+        Caçadores podem atordoar e causar sangramento; Piromantes, queimar.
 
-        #chance de queimadura
-        if alvo is not None and self.sub_classe == "Piromante" and random.random() < self.chance_queimadura:
-            setattr(alvo, "queimadura_turns", 2)
-            print(f"{alvo.nome} está QUEIMANDO!")
+        Returns:
+            list: Tuplas (tipo, duração em turnos, dano por turno)
+        """
+        if self.sub_classe == "Caçador":
+            efeitos = []
+            if self.rng.random() < self.stun_chance:
+                efeitos.append((ATORDOAMENTO, self.DURACAO_ATORDOAMENTO, 0))
+            if self.rng.random() < self.dot_sangramento:
+                efeitos.append((SANGRAMENTO, self.DURACAO_DOT, self._dano_dot()))
+            return efeitos
+        if self.sub_classe == "Piromante" and self.rng.random() < self.chance_queimadura:
+            return [(QUEIMADURA, self.DURACAO_DOT, self._dano_dot())]
+        return []
 
-        return dano_final
+    def _dano_dot(self):
+        """Dano por turno de sangramento e queimadura."""
+        return max(1, int(self.dano_base * self.FRACAO_DANO_DOT))
 
-    def habilidade_especial(self):
-        if self.mana >= 20:
-            self.mana -= 20
-            dano = int(self.dano_base * random.uniform(1.3, 1.7) * self.buff_dano)
-            if random.random() < self.crit_chance:
-                dano = int(dano * 2)
-                print("**Habilidade especial CRÍTICA!**")
+    def habilidade_especial(self, verbose=True):
+        verbose = verbose and bool(exibir)
+        if self.mana >= self.CUSTO_HABILIDADE:
+            self.mana -= self.CUSTO_HABILIDADE
+            dano = int(self.dano_base * self.rng.uniform(*self.FAIXA_HABILIDADE) * self.buff_dano)
+            if self.rng.random() < self.crit_chance:
+                dano = int(dano * self.MULT_CRITICO_HABILIDADE)
+                if verbose:
+                    exibir("**Habilidade especial CRÍTICA!**")
             return max(1, dano)
-        print("Mana insuficiente para habilidade especial.")
+        if verbose:
+            exibir("Mana insuficiente para habilidade especial.")
         return 0
 
     def usar_item(self, item):
         # Suporta tanto string quanto objeto com atributo nome
         nome_item = item.nome if hasattr(item, "nome") else str(item)
-        for inv_item in list(self.inventario):
-            inv_nome = inv_item.nome if hasattr(inv_item, "nome") else str(inv_item)
-            if inv_nome == nome_item:
-                if nome_item == "poção":
-                    self.curar(30)
-                    self.inventario.remove(inv_item)
-                    return True
-                elif nome_item == "poção de mana":
-                    self.mana = min(self.mana + 25, self.mana_maxima)
-                    self.inventario.remove(inv_item)
-                    return True
-        return False
-
-    def adicionar_item(self, item):
-        self.inventario.append(item)
+        # O efeito vem do catálogo de itens (ver models.inventario.EFEITOS_ITEM)
+        if not self.inventario.quantidade(nome_item) or not obter_item(nome_item).usar(self):
+            return False
+        self.inventario.remover(nome_item)
+        return True
+
+    def adicionar_item(self, item, quantidade=1):
+        self.inventario.adicionar_item(item, quantidade)
 
     def ganhar_xp(self, quantidade):
+        """
+        Soma XP e aplica de uma vez todos os níveis ganhos, qualquer que
+        seja a quantidade (o novo nível vem de uma busca binária na curva).
+
+        Args:
+            quantidade (int): XP ganho
+
+        Returns:
+            bool: True se subiu de nível
+        """
         self.xp += quantidade
-        subiu_nivel = False
-        while self.xp >= self.xp_proximo_nivel:
-            self.xp -= self.xp_proximo_nivel
-            self.nivel += 1
-            self.xp_proximo_nivel = int(self.xp_proximo_nivel * 1.5)
-            self.hp_maximo += 20
-            self.hp = self.hp_maximo
-            self.dano_base += 2
-            self.defesa += 1
-            subiu_nivel = True
-            # Exibe opção de subclasse ao atingir nível 4
-            if self.nivel == 4 and self.sub_classe is None:
-                print("\nVocê atingiu o nível 4! Agora pode escolher uma sub-classe:")
-                self.subclasse()
-        return subiu_nivel
+        if self.xp < self.xp_proximo_nivel:
+            return False
+        if self._subir_ate_subclasse():
+            self.subclasse()
+        self._aplicar_niveis()
+        return True
+
+    async def ganhar_xp_async(self, quantidade, ler):
+        """
+        Versão de ganhar_xp() em que a escolha da sub-classe é lida pela
+        corrotina `ler` (ver utils/servidor.py).
+        """
+        self.xp += quantidade
+        if self.xp < self.xp_proximo_nivel:
+            return False
+        if self._subir_ate_subclasse():
+            await self.subclasse_async(ler)
+        self._aplicar_niveis()
+        return True
+
+    def _subir_ate_subclasse(self):
+        """
+        Se o XP acumulado passa pelo nível 4 e a sub-classe ainda não foi
+        escolhida, sobe até o nível 4 e anuncia a escolha. Os ganhos dos
+        níveis seguintes ficam para depois dela (como no jogo nível a nível).
+
+        Returns:
+            bool: True se a sub-classe deve ser escolhida agora
+        """
+        if self.nivel >= NIVEL_SUBCLASSE or self.sub_classe is not None:
+            return False
+        total = xp_acumulado(self.nivel) + self.xp
+        if nivel_por_xp(total) < NIVEL_SUBCLASSE:
+            return False
+        self._subir_niveis(NIVEL_SUBCLASSE - self.nivel)
+        self.xp = total - xp_acumulado(NIVEL_SUBCLASSE)
+        exibir(f"\nVocê atingiu o nível {NIVEL_SUBCLASSE}! Agora pode escolher uma sub-classe:")
+        return True
+
+    def _aplicar_niveis(self):
+        """Aplica todos os níveis que o XP atual alcança."""
+        total = xp_acumulado(self.nivel) + self.xp
+        nivel_final = nivel_por_xp(total)
+        self._subir_niveis(nivel_final - self.nivel)
+        self.xp = total - xp_acumulado(nivel_final)
+        self.xp_proximo_nivel = custo_nivel(nivel_final)
+
+    def _subir_niveis(self, niveis):
+        """Aplica os ganhos de atributos de `niveis` níveis e restaura o HP."""
+        if niveis <= 0:
+            return
+        self.nivel += niveis
+        self.hp_maximo += self.GANHO_HP_NIVEL * niveis
+        self.hp = self.hp_maximo
+        self.dano_base += self.GANHO_DANO_NIVEL * niveis
+        self.defesa += self.GANHO_DEFESA_NIVEL * niveis
 
     def to_dict(self):
         return {
+            "versao": VERSAO_SAVE,
             "nome": self.nome,
             "classe": self.classe,
             "sub_classe": self.sub_classe,
@@ -202,7 +400,7 @@ class Personagem(Atributos):
             "nivel": self.nivel,
             "xp": self.xp,
             "xp_proximo_nivel": self.xp_proximo_nivel,
-            "inventario": [it.nome if hasattr(it, "nome") else str(it) for it in self.inventario],
+            "inventario": self.inventario.to_dict(),
             "mana": self.mana,
             "mana_maxima": self.mana_maxima,
             "dano_base": self.dano_base,
@@ -215,27 +413,96 @@ class Personagem(Atributos):
             "cura_base": self.cura_base,
         }
 
+    def alteracoes(self):
+        """
+        Retorna os campos que mudaram desde o último salvamento.
+
+        Cada atributo é comparado com o valor guardado em marcar_salvo(), e
+        só os alterados são serializados: o inventário só é convertido se
+        mudou desde então (ver Inventario.versao). Assim o combate não paga
+        nada por atribuição e o save incremental não chama to_dict().
+
+        Returns:
+            dict: Campos alterados com seus valores atuais, ou o estado
+            completo se o personagem nunca foi salvo
+        """
+        salvo = self._salvo
+        if salvo is None:
+            return self.to_dict()
+        delta = {}
+        for campo in _CAMPOS_SALVOS:
+            if campo == "inventario":
+                inventario, versao = self._inventario_salvo
+                if self.inventario is inventario and self.inventario.versao == versao:
+                    continue
+                valor = self.inventario.to_dict()
+            else:
+                valor = getattr(self, campo)
+            if salvo[campo] != valor:
+                delta[campo] = valor
+        return delta
+
+    def marcar_salvo(self, dados=None, origem=None):
+        """
+        Registra o estado atual como persistido.
+
+        Args:
+            dados (dict, optional): O que foi gravado: o estado completo
+                (to_dict) ou, depois do primeiro salvamento, as alterações
+                (alteracoes). Evita serializar o personagem de novo.
+            origem (optional): Repositório onde o estado foi gravado
+        """
+        if dados is None:
+            dados = self.to_dict()
+        if self._salvo is None:
+            self._salvo = dict(dados)
+        else:
+            self._salvo.update(dados)
+        self._inventario_salvo = (self.inventario, self.inventario.versao)
+        self._salvo_em = origem
+
     @classmethod
     def from_dict(cls, dados):
-        personagem = cls(
-            dados["nome"],
-            dados["classe"],
-            dados.get("hp", 100),
-            dados.get("nivel", 1),
-            dados.get("xp", 0)
-        )
-        personagem.sub_classe = dados.get("sub_classe")
-        personagem.hp_maximo = dados.get("hp_maximo", personagem.hp)
-        personagem.xp_proximo_nivel = dados.get("xp_proximo_nivel", 100)
-        personagem.inventario = dados.get("inventario", [])
-        personagem.mana = dados.get("mana", 50)
-        personagem.mana_maxima = dados.get("mana_maxima", 50)
-        personagem.dano_base = dados.get("dano_base", 10)
-        personagem.defesa = dados.get("defesa", 5)
-        personagem.crit_chance = dados.get("crit_chance", 0.05)
-        personagem.stun_chance = dados.get("stun_chance", 0.0)
-        personagem.dot_sangramento = dados.get("dot_sangramento", 0.0)
-        personagem.buff_dano = dados.get("buff_dano", 1.0)
-        personagem.chance_queimadura = dados.get("chance_queimadura", 0.0)
-        personagem.cura_base = dados.get("cura_base", 0)
+        """
+        Reconstrói um personagem desta classe a partir do dicionário salvo.
+        Para escolher a classe pelo campo "classe", use
+        utils.repositorio.personagem_de_dados.
+
+        Args:
+            dados (dict): Dados do personagem, em qualquer versão do esquema
+                (saves antigos são migrados antes, ver utils/migracao.py)
+
+        Returns:
+            Personagem: Instância com os atributos restaurados
+
+        Raises:
+            ValueError: Se a versão do save não é suportada
+        """
+        # Importado aqui: utils.migracao depende deste módulo
+        from utils.migracao import migrar
+
+        dados = migrar(dados)
+        if cls is Personagem:
+            personagem = cls(dados["nome"], dados["classe"])
+        else:
+            personagem = cls(dados["nome"])
+
+        # Na versão atual do esquema todos os campos estão presentes
+        personagem.hp = dados["hp"]
+        personagem.hp_maximo = dados["hp_maximo"]
+        personagem.nivel = dados["nivel"]
+        personagem.xp = dados["xp"]
+        personagem.xp_proximo_nivel = dados["xp_proximo_nivel"]
+        personagem.inventario = Inventario.from_dict(dados["inventario"])
+        personagem.mana = dados["mana"]
+        personagem.mana_maxima = dados["mana_maxima"]
+        personagem.dano_base = dados["dano_base"]
+        personagem.defesa = dados["defesa"]
+        personagem.sub_classe = dados["sub_classe"]
+        personagem.crit_chance = dados["crit_chance"]
+        personagem.stun_chance = dados["stun_chance"]
+        personagem.dot_sangramento = dados["dot_sangramento"]
+        personagem.buff_dano = dados["buff_dano"]
+        personagem.chance_queimadura = dados["chance_queimadura"]
+        personagem.cura_base = dados["cura_base"]
         return personagem
\ No newline at end of file
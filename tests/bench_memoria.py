@@ -0,0 +1,78 @@
+"""Benchmark de memória: bytes por instância com e sem __slots__.
+
+Para o "antes", cada objeto é copiado para uma réplica com __dict__ (o
+layout que as classes tinham antes dos __slots__), com os mesmos valores.
+
+Uso:
+    python -m tests.bench_memoria [--instancias 20000]
+"""
+import argparse
+import gc
+import tracemalloc
+
+from models.base import Atributos
+from models.personagem import Personagem
+from models.classes import Guerreiro, Mago, Arqueiro
+from models.inimigo import Goblin, Lobo, Orc, Chefao
+
+
+class _ComDict:
+    """Réplica com __dict__ por instância, usada como referência do "antes"."""
+
+
+def _nomes_slots(cls):
+    """Todos os atributos declarados em __slots__ na hierarquia da classe."""
+    nomes = []
+    for base in reversed(cls.__mro__):
+        nomes.extend(getattr(base, "__slots__", ()))
+    return nomes
+
+
+def _replica_com_dict(obj):
+    replica = _ComDict()
+    for nome in _nomes_slots(type(obj)):
+        setattr(replica, nome, getattr(obj, nome))
+    return replica
+
+
+def _bytes_por_instancia(fabrica, quantidade):
+    """Mede com tracemalloc a memória alocada por instância mantida viva."""
+    gc.collect()
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    vivos = [fabrica() for _ in range(quantidade)]
+    fim = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Desconta a própria lista que mantém as instâncias vivas
+    total = fim - inicio - (len(vivos) * 8)
+    del vivos
+    return total / quantidade
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memória por instância com e sem __slots__")
+    parser.add_argument("--instancias", type=int, default=20000)
+    args = parser.parse_args()
+
+    fabricas = {
+        "Atributos": lambda: Atributos("x", 10),
+        "Personagem": lambda: Personagem("Jogador", "Vagabundo"),
+        "Guerreiro": lambda: Guerreiro("Conan"),
+        "Mago": lambda: Mago("Gandalf"),
+        "Arqueiro": lambda: Arqueiro("Legolas"),
+        "Goblin": Goblin,
+        "Lobo": Lobo,
+        "Orc": Orc,
+        "Chefao": Chefao,
+    }
+
+    print(f"{'Classe':<12}{'antes (B)':>12}{'depois (B)':>12}{'economia':>10}")
+    for nome, fabrica in fabricas.items():
+        assert not hasattr(fabrica(), "__dict__"), f"{nome} ainda tem __dict__"
+        antes = _bytes_por_instancia(lambda: _replica_com_dict(fabrica()), args.instancias)
+        depois = _bytes_por_instancia(fabrica, args.instancias)
+        print(f"{nome:<12}{antes:>12.0f}{depois:>12.0f}{1 - depois / antes:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark de serialização: JSON (como no save) contra o formato binário.
+
+Mede o tempo de codificação e decodificação e o tamanho do estado de
+personagens típicos nos três formatos: JSON com indentação (o do
+Repositorio), JSON compacto e utils/binario.
+
+Uso:
+    python -m tests.bench_serializacao [--repeticoes 5]
+"""
+import argparse
+import json
+import timeit
+
+from models.classes import Guerreiro, Mago, Arqueiro
+from models.personagem import xp_acumulado
+from utils.binario import codificar, decodificar
+from utils.repositorio import personagem_de_dados
+
+
+def _personagens():
+    """Personagens de exemplo: novo, com sub-classe e inventário, e de nível 500."""
+    novo = Mago("Gandalf")
+
+    veterano = Arqueiro("Legolas")
+    veterano.ganhar_xp(xp_acumulado(3))
+    veterano.aplicar_subclasse("Caçador")
+    veterano.ganhar_xp(2000)
+    for item, quantidade in (("poção", 12), ("poção de mana", 4), ("elixir", 2), ("cristal", 7)):
+        veterano.adicionar_item(item, quantidade)
+
+    lendario = Guerreiro("Conan")
+    lendario.aplicar_subclasse("Paladino")
+    lendario.ganhar_xp(xp_acumulado(500))
+    lendario.adicionar_item("espada lendária")
+    return {"novo": novo, "veterano": veterano, "nível 500": lendario}
+
+
+FORMATOS = {
+    "json (save)": (
+        lambda p: json.dumps(p.to_dict(), indent=2, ensure_ascii=False).encode("utf-8"),
+        lambda dados: personagem_de_dados(json.loads(dados)),
+    ),
+    "json compacto": (
+        lambda p: json.dumps(p.to_dict(), separators=(",", ":"), ensure_ascii=False).encode("utf-8"),
+        lambda dados: personagem_de_dados(json.loads(dados)),
+    ),
+    "binário": (codificar, decodificar),
+}
+
+
+def _us_por_op(funcao, repeticoes):
+    timer = timeit.Timer(funcao)
+    numero, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeticoes, number=numero)) / numero * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serialização JSON contra binária")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'Personagem':<12}{'Formato':<15}{'bytes':>7}{'codificar (µs)':>16}{'decodificar (µs)':>18}")
+    for nome, personagem in _personagens().items():
+        for formato, (codificador, decodificador) in FORMATOS.items():
+            dados = codificador(personagem)
+            assert decodificador(dados).to_dict() == personagem.to_dict()
+            codificacao = _us_por_op(lambda: codificador(personagem), args.repeticoes)
+            decodificacao = _us_por_op(lambda: decodificador(dados), args.repeticoes)
+            print(f"{nome:<12}{formato:<15}{len(dados):>7}{codificacao:>16.2f}{decodificacao:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""Benchmarks dos caminhos críticos do jogo.
+
+Mede o tempo por operação de ataques, críticos, combates completos,
+progressão de nível, salvamento/carregamento e logging, emite os
+resultados em JSON e, se informado, compara com um baseline gravado.
+
+Uso:
+    python -m tests.benchmark                          # imprime o JSON
+    python -m tests.benchmark --gravar baseline.json   # grava um baseline
+    python -m tests.benchmark --baseline baseline.json --limite 0.20
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import timeit
+
+from models.personagem import Personagem, xp_acumulado
+from models.classes import Guerreiro, Mago, Arqueiro
+from models.combate import PoliticaHabilidade
+from models.inimigo import Goblin, Lobo
+from models.missão import Missao
+from utils import calcular_critico
+from utils.binario import codificar, decodificar
+from utils.logger import Logger
+from utils.repositorio import Repositorio
+
+
+def _medir(funcao, repeticoes=5):
+    """
+    Mede o tempo por chamada de `funcao` (melhor de várias repetições).
+
+    Returns:
+        dict: ns por operação e número de chamadas por repetição
+    """
+    timer = timeit.Timer(funcao)
+    numero, _ = timer.autorange()
+    melhor = min(timer.repeat(repeat=repeticoes, number=numero))
+    return {"ns_por_op": melhor / numero * 1e9, "ops": numero}
+
+
+def _benchmarks_ataque():
+    rng = random.Random(1)
+    personagens = {
+        "Personagem": Personagem("Jogador", "Vagabundo"),
+        "Guerreiro": Guerreiro("Conan"),
+        "Mago": Mago("Gandalf"),
+        "Arqueiro": Arqueiro("Legolas"),
+    }
+    resultados = {}
+    for nome, personagem in personagens.items():
+        personagem.rng = rng
+        resultados[f"atacar.{nome}"] = lambda p=personagem: p.atacar(verbose=False)
+
+        def habilidade(p=personagem):
+            p.mana = p.mana_maxima
+            return p.habilidade_especial(verbose=False)
+
+        resultados[f"habilidade_especial.{nome}"] = habilidade
+    return resultados
+
+
+def _benchmarks_critico():
+    rng = random.Random(2)
+    return {
+        "calcular_critico": lambda: calcular_critico(
+            20, chance=0.3, multiplicador=1.8, rng=rng, animacao=False, verbose=False
+        ),
+    }
+
+
+def _benchmarks_combate():
+    rng = random.Random(3)
+    politica = PoliticaHabilidade()
+
+    def missao(classe, dificuldade):
+        def executar():
+            personagem = classe("Simulado")
+            personagem.rng = rng
+            Missao("Benchmark", dificuldade, rng=rng).executar_combate(
+                personagem, politica=politica, saida=None
+            )
+        return executar
+
+    def missao_grupo(classe, ondas):
+        def executar():
+            personagem = classe("Simulado")
+            personagem.rng = rng
+            Missao("Benchmark", rng=rng, ondas=ondas).executar_combate(
+                personagem, politica=politica, saida=None
+            )
+        return executar
+
+    return {
+        "missao.Guerreiro.fácil": missao(Guerreiro, "fácil"),
+        "missao.Mago.médio": missao(Mago, "médio"),
+        "missao.Arqueiro.difícil": missao(Arqueiro, "difícil"),
+        "missao.Guerreiro.grupo": missao_grupo(Guerreiro, [[Goblin, Goblin, Goblin, Lobo]]),
+    }
+
+
+def _benchmarks_progressao():
+    def nivel_500():
+        personagem = Guerreiro("Admin")
+        personagem.sub_classe = "Paladino"
+        personagem.ganhar_xp(xp_acumulado(500))
+
+    return {"personagem.ganhar_xp.nivel_500": nivel_500}
+
+
+def _benchmarks_persistencia(pasta):
+    repositorio = Repositorio(os.path.join(pasta, "save.json"))
+    personagem = Guerreiro("Conan")
+    for item in ("poção", "poção de mana", "elixir"):
+        personagem.adicionar_item(item)
+
+    def salvar_completo():
+        # Um repositório novo não tem save anterior: grava o estado completo
+        Repositorio(repositorio.arquivo_save).salvar(personagem)
+
+    def salvar_incremental():
+        personagem.xp += 1
+        repositorio.salvar(personagem)
+
+    salvar_completo()
+    snapshot = codificar(personagem)
+    return {
+        "repositorio.salvar": salvar_completo,
+        "repositorio.salvar_incremental": salvar_incremental,
+        "repositorio.carregar": lambda: Repositorio(repositorio.arquivo_save).carregar(),
+        "binario.codificar": lambda: codificar(personagem),
+        "binario.decodificar": lambda: decodificar(snapshot),
+    }
+
+
+def _benchmarks_logger(pasta):
+    direto = Logger(os.path.join(pasta, "direto.log"))
+    com_buffer = Logger(os.path.join(pasta, "buffer.log"), buffer=True)
+    return {
+        "logger.registrar": lambda: direto.registrar("Turno 1: Conan causou 12 de dano"),
+        "logger.registrar_buffer": lambda: com_buffer.registrar("Turno 1: Conan causou 12 de dano"),
+    }, com_buffer
+
+
+def executar(filtro=None, repeticoes=5):
+    """
+    Executa os benchmarks.
+
+    Args:
+        filtro (str, optional): Executa apenas os benchmarks cujo nome contém o texto
+        repeticoes (int): Repetições por benchmark (vale a melhor)
+
+    Returns:
+        dict: Resultados por nome de benchmark
+    """
+    resultados = {}
+    with tempfile.TemporaryDirectory() as pasta:
+        benchmarks = {}
+        benchmarks.update(_benchmarks_ataque())
+        benchmarks.update(_benchmarks_critico())
+        benchmarks.update(_benchmarks_combate())
+        benchmarks.update(_benchmarks_progressao())
+        benchmarks.update(_benchmarks_persistencia(pasta))
+        logger_bench, logger_buffer = _benchmarks_logger(pasta)
+        benchmarks.update(logger_bench)
+
+        try:
+            for nome, funcao in benchmarks.items():
+                if filtro and filtro not in nome:
+                    continue
+                resultados[nome] = _medir(funcao, repeticoes)
+        finally:
+            logger_buffer.fechar()
+    return resultados
+
+
+def comparar(resultados, baseline, limite):
+    """
+    Compara os resultados com um baseline.
+
+    Args:
+        resultados (dict): Resultados atuais
+        baseline (dict): Resultados gravados anteriormente
+        limite (float): Piora relativa tolerada (0.20 = 20% mais lento)
+
+    Returns:
+        list: Tuplas (nome, ns_baseline, ns_atual, variação) das regressões
+    """
+    regressoes = []
+    for nome, atual in resultados.items():
+        anterior = baseline.get(nome)
+        if anterior is None:
+            continue
+        variacao = atual["ns_por_op"] / anterior["ns_por_op"] - 1
+        if variacao > limite:
+            regressoes.append((nome, anterior["ns_por_op"], atual["ns_por_op"], variacao))
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks dos caminhos críticos do jogo")
+    parser.add_argument("--filtro", help="executa só os benchmarks cujo nome contém o texto")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--saida", help="arquivo onde gravar o JSON (padrão: stdout)")
+    parser.add_argument("--gravar", metavar="BASELINE", help="grava os resultados como baseline")
+    parser.add_argument("--baseline", help="baseline para comparação")
+    parser.add_argument("--limite", type=float, default=0.20, help="piora tolerada (padrão: 0.20)")
+    args = parser.parse_args()
+
+    resultados = executar(args.filtro, args.repeticoes)
+    relatorio = {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "resultados": resultados,
+    }
+
+    texto = json.dumps(relatorio, indent=2, ensure_ascii=False)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            f.write(texto + "\n")
+    else:
+        print(texto)
+
+    if args.gravar:
+        with open(args.gravar, "w", encoding="utf-8") as f:
+            f.write(texto + "\n")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["resultados"]
+        regressoes = comparar(resultados, baseline, args.limite)
+        for nome, anterior, atual, variacao in regressoes:
+            print(f"REGRESSÃO {nome}: {anterior:.0f} ns → {atual:.0f} ns ({variacao:+.0%})", file=sys.stderr)
+        if regressoes:
+            sys.exit(1)
+        print(f"Sem regressões acima de {args.limite:.0%}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
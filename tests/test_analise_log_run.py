@@ -0,0 +1,115 @@
+"""Smoke test for the incremental log analytics.
+Compares the aggregates with the results of the logged missions and checks
+that incremental updates (including a half-written line, a cleared log
+and interleaved server sessions) match a full re-scan.
+"""
+import os
+import random
+import tempfile
+
+from models.classes import Guerreiro
+from models.combate import POLITICAS
+from models.missão import Missao
+from utils.analise_log import AnaliseLog
+from utils.logger import Logger
+
+pasta = tempfile.mkdtemp()
+arquivo = os.path.join(pasta, 'jogo.log')
+logger = Logger(arquivo)
+rng = random.Random(5)
+politica = POLITICAS['atacar']()
+esperado = {'causado': 0, 'recebido': 0, 'vencidas': 0, 'perdidas': 0, 'xp': 0}
+
+
+def jogar(missoes):
+    for _ in range(missoes):
+        personagem = Guerreiro('Conan')
+        personagem.rng = rng
+        personagem.sub_classe = 'Paladino'  # sem o menu do nível 4
+        personagem.hp = rng.randint(5, personagem.hp_maximo)  # para haver derrotas
+        missao = Missao.sortear(rng.randint(1, 12), rng)
+        resultado = missao.executar_combate(personagem, logger=logger, politica=politica, saida=None)
+        esperado['causado'] += resultado['dano_causado']
+        esperado['recebido'] += resultado['dano_recebido']
+        esperado['vencidas' if resultado['vitoria'] else 'perdidas'] += 1
+        esperado['xp'] += resultado['xp'] if resultado['vitoria'] else 0
+
+
+def conferir(analise):
+    relatorio = analise.relatorio()
+    turnos = analise.estado['dano_por_turno'].values()
+    assert sum(t['causado'] for t in turnos) == esperado['causado']
+    assert sum(t['recebido'] for t in turnos) == esperado['recebido']
+    assert sum(m['vencidas'] for m in relatorio['missoes'].values()) == esperado['vencidas']
+    assert sum(m['perdidas'] for m in relatorio['missoes'].values()) == esperado['perdidas']
+    assert relatorio['xp']['total'] == esperado['xp']
+    return relatorio
+
+
+print('--- Agregados conferem com as missões ---')
+jogar(150)
+analise = AnaliseLog(arquivo)
+assert analise.atualizar() == os.path.getsize(arquivo)
+relatorio = conferir(analise)
+assert esperado['perdidas'] > 0
+assert relatorio['dano_por_turno']['1']['combates'] == 150
+print({k: relatorio['missoes'][k] for k in list(relatorio['missoes'])[:2]})
+
+print('\n--- Atualização incremental ---')
+jogar(50)
+with open(arquivo, 'a', encoding='utf-8') as f:
+    f.write('[2024-01-01 00:00:00] XP gan')  # linha ainda sendo escrita
+analise = AnaliseLog(arquivo)
+analise.atualizar()
+assert analise.estado['posicao'] == os.path.getsize(arquivo) - len('[2024-01-01 00:00:00] XP gan')
+conferir(analise)
+with open(arquivo, 'a', encoding='utf-8') as f:
+    f.write('ho: 1000, Itens: cristal\n')
+esperado['xp'] += 1000
+assert AnaliseLog(arquivo).atualizar() == len('[2024-01-01 00:00:00] XP ganho: 1000, Itens: cristal\n')
+completa = AnaliseLog(arquivo, os.path.join(pasta, 'do_zero.json'))
+completa.atualizar()
+assert completa.relatorio() == conferir(AnaliseLog(arquivo))
+print('OK')
+
+print('\n--- Log limpo ---')
+logger.limpar_log()
+jogar(20)
+analise = AnaliseLog(arquivo)
+assert analise.atualizar() == os.path.getsize(arquivo)
+conferir(analise)
+print('OK')
+
+print('\n--- Sessões do servidor intercaladas ---')
+servidor = os.path.join(pasta, 'servidor.log')
+Logger(servidor).registrar('Servidor iniciado')
+with open(servidor, 'a', encoding='utf-8') as f:
+    f.write(
+        '[2024-01-01 00:00:00] [ana] Iniciou missão: Missão contra Orc\n'
+        '[2024-01-01 00:00:00] [bia] Iniciou missão: Missão contra Goblin x2, Lobo\n'
+        '[2024-01-01 00:00:00] [ana] Turno 1: Orc causou 9 de dano\n'
+        '[2024-01-01 00:00:00] [bia] Turno 1: Goblin causou 3 de dano\n'
+        '[2024-01-01 00:00:00] [ana] Turno 1: ana causou 20 de dano\n'
+        '[2024-01-01 00:00:00] [bia] Turno 1: Goblin sofreu 4 de dano de sangramento\n'
+        '[2024-01-01 00:00:00] [bia] Turno 2: 2 inimigo(s) causaram 6 de dano\n'
+        '[2024-01-01 00:00:00] [ana] Missão concluída: ana venceu Orc\n'
+        '[2024-01-01 00:00:00] [bia] Missão falhou: bia foi derrotado por Goblin x2, Lobo\n'
+        # Personagem com nome de inimigo e linha de XP malformada
+        '[2024-01-01 00:00:00] [cris] Iniciou missão: Missão contra Goblin (personagem: Goblin)\n'
+        '[2024-01-01 00:00:00] [cris] Turno 3: Goblin causou 10 de dano\n'
+        '[2024-01-01 00:00:00] [cris] Turno 3: Goblin causou 2 de dano\n'
+        '[2024-01-01 00:00:00] [cris] XP ganho: muito, Itens: \n'
+        '[2024-01-01 00:00:00] [cris] Missão concluída: Goblin venceu Goblin\n'
+    )
+analise = AnaliseLog(servidor)
+analise.atualizar()
+relatorio = analise.relatorio()
+assert relatorio['missoes']['Orc']['vencidas'] == 1
+assert relatorio['missoes']['Goblin x2, Lobo']['perdidas'] == 1
+assert relatorio['dano_por_turno']['1'] == {'combates': 2, 'causado_medio': 12.0, 'recebido_medio': 6.0}
+assert relatorio['dano_por_turno']['2'] == {'combates': 1, 'causado_medio': 0.0, 'recebido_medio': 6.0}
+assert relatorio['dano_por_turno']['3'] == {'combates': 1, 'causado_medio': 12.0, 'recebido_medio': 0.0}
+assert relatorio['xp']['total'] == 0 and analise.estado['posicao'] == os.path.getsize(servidor)
+print(relatorio['dano_por_turno'])
+
+print('\nOK - script terminou sem exceções')
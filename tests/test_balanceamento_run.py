@@ -0,0 +1,73 @@
+"""Smoke test for the stat-balancing optimizer.
+Checks that the current configuration is rebuilt exactly, that successive
+halving drops candidates and saves fights, and that the result does not
+depend on the number of processes.
+"""
+from models.classes import Arqueiro
+from models.personagem import SUBCLASSES, xp_acumulado
+from utils.balanceamento import criar_personagem, nivel_avaliacao, otimizar, parametros_atuais
+from utils.saida import definir_entrada, definir_saida
+from utils.simulacao import CLASSES
+
+if __name__ == "__main__":
+    print('--- Configuração atual ---')
+    atuais = parametros_atuais('Arqueiro', 'Patrulheiro')
+    print(atuais)
+    referencia = Arqueiro('Balanceamento')
+    referencia.aplicar_subclasse('Patrulheiro')
+    assert criar_personagem('Arqueiro', 'Patrulheiro', atuais).to_dict() == referencia.to_dict()
+    mais_forte = criar_personagem('Arqueiro', 'Patrulheiro', dict(atuais, **{'Patrulheiro.buff_dano': 0.5}))
+    assert mais_forte.buff_dano == 1.5 and mais_forte.hp == mais_forte.hp_maximo
+
+    print('\n--- Nível de cada dificuldade ---')
+    # Subir de nível e depois aplicar os bônus dá o mesmo personagem do jogo,
+    # que escolhe a sub-classe no nível 4 e continua subindo
+    for classe, subclasses in SUBCLASSES.items():
+        for indice, subclasse in enumerate(subclasses, start=1):
+            definir_saida('nula')
+            definir_entrada(lambda mensagem='', escolha=str(indice): escolha)
+            jogado = CLASSES[classe]('Balanceamento')
+            jogado.ganhar_xp(xp_acumulado(7))
+            definir_saida('console')
+            assert jogado.sub_classe == subclasse
+            criado = criar_personagem(classe, subclasse, parametros_atuais(classe, subclasse), 7)
+            assert criado.to_dict() == jogado.to_dict(), (classe, subclasse)
+    sem_subclasse = criar_personagem('Arqueiro', None, parametros_atuais('Arqueiro'), 6)
+    assert sem_subclasse.nivel == 6 and sem_subclasse.sub_classe is None
+    assert [nivel_avaliacao(d) for d in ('fácil', 'médio', 'difícil')] == [1, 3, 6]
+    assert [nivel_avaliacao(d, 'Patrulheiro') for d in ('fácil', 'médio', 'difícil')] == [4, 4, 6]
+    print('OK')
+
+    print('\n--- Successive halving ---')
+    alvos = {'fácil': 0.9, 'difícil': 0.5}
+    um = otimizar('Arqueiro', alvos, 'Patrulheiro', candidatos=8, lutas_iniciais=20, semente=3, processos=1)
+    assert [r['candidatos'] for r in um['rodadas']] == [8, 4, 2, 1]
+    assert [r['lutas'] for r in um['rodadas']] == [20, 40, 80, 160]
+    assert um['lutas_total'] == (8 * 20 + 4 * 20 + 2 * 40 + 1 * 80) * len(alvos)
+    assert um['lutas_total'] < um['lutas_sem_corte']
+    assert um['niveis'] == {'fácil': 4, 'difícil': 6}
+    assert um['melhor']['lutas'] == 160 and um['melhor']['erro'] <= um['rodadas'][-1]['melhor_erro']
+    print('melhor:', um['melhor']['parametros'], um['melhor']['taxas'])
+    print(f"{um['lutas_total']} lutas em vez de {um['lutas_sem_corte']}")
+
+    dois = otimizar('Arqueiro', alvos, 'Patrulheiro', candidatos=8, lutas_iniciais=20, semente=3, processos=2)
+    assert um == dois
+
+    # O difícil só aparece no nível 6: no nível 1 as taxas seriam outras
+    padrao = otimizar('Arqueiro', {'difícil': 0.5}, candidatos=1, lutas_iniciais=200, semente=3, processos=1)
+    nivel_1 = otimizar('Arqueiro', {'difícil': 0.5}, candidatos=1, lutas_iniciais=200, semente=3, processos=1, nivel=1)
+    assert padrao['niveis'] == {'difícil': 6} and nivel_1['niveis'] == {'difícil': 1}
+    assert nivel_1['atual']['taxas']['difícil'] < padrao['atual']['taxas']['difícil']
+
+    try:
+        otimizar('Arqueiro', {'impossível': 0.5})
+        raise AssertionError('dificuldade inválida deveria falhar')
+    except ValueError:
+        pass
+    try:
+        otimizar('Arqueiro', alvos, 'Patrulheiro', nivel=3)
+        raise AssertionError('sub-classe antes do nível 4 deveria falhar')
+    except ValueError:
+        pass
+
+    print('\nOK - script terminou sem exceções')
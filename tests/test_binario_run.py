@@ -0,0 +1,63 @@
+"""Smoke test for the compact binary character format.
+Round-trips characters of every class (with sub-classes, unknown items
+and classes, level 500 XP) and checks size and error handling.
+"""
+import json
+
+from models.classes import Guerreiro, Mago, Arqueiro
+from models.personagem import Personagem, SUBCLASSES, xp_acumulado
+from utils.binario import VERSAO_BINARIO, codificar, decodificar, decodificar_dados
+
+print('--- Ida e volta ---')
+personagens = []
+for classe in (Guerreiro, Mago, Arqueiro):
+    personagens.append(classe('Simples'))
+    for subclasse in SUBCLASSES[classe('x').classe]:
+        p = classe(f'Çávio {subclasse} 🐉')
+        p.aplicar_subclasse(subclasse)  # antes do XP: o menu do nível 4 não abre
+        p.ganhar_xp(1234)
+        p.hp -= 7
+        p.adicionar_item('poção', 300)
+        p.adicionar_item('cristal')
+        p.adicionar_item('espada lendária', 2)
+        personagens.append(p)
+vagabundo = Personagem('Zé', 'Vagabundo')
+vagabundo.sub_classe = 'Andarilho'
+personagens.append(vagabundo)
+lendario = Guerreiro('Conan')
+lendario.aplicar_subclasse('Berserker')
+lendario.ganhar_xp(xp_acumulado(500) + 99)
+personagens.append(lendario)
+
+for p in personagens:
+    dados = codificar(p)
+    assert decodificar_dados(dados) == p.to_dict(), p.nome
+    copia = decodificar(dados)
+    assert type(copia) is type(p) and copia.to_dict() == p.to_dict()
+    assert len(dados) < len(json.dumps(p.to_dict(), separators=(',', ':')).encode('utf-8')) / 2
+print(len(personagens), 'personagens; nível 500 em', len(codificar(lendario)), 'bytes')
+
+print('\n--- Erros ---')
+dados = codificar(personagens[1])
+for invalido in (b'', b'JSON', dados[:3] + bytes([VERSAO_BINARIO + 1]) + dados[4:], dados[:-1], dados + b'\0'):
+    try:
+        decodificar_dados(invalido)
+        raise AssertionError(f'deveria falhar: {invalido[:8]!r}')
+    except ValueError as e:
+        print('ValueError:', e)
+def fora_do_formato(ajuste):
+    p = Guerreiro('Hércules')
+    ajuste(p)
+    try:
+        codificar(p)
+        raise AssertionError('valor fora do formato deveria falhar')
+    except ValueError as e:
+        print('ValueError:', e)
+
+
+fora_do_formato(lambda p: setattr(p, 'dano_base', 2 ** 40))
+fora_do_formato(lambda p: setattr(p, 'nome', 'x' * 65536))
+fora_do_formato(lambda p: p.inventario._quantidades.__setitem__('poção', -1))
+fora_do_formato(lambda p: p.inventario._quantidades.__setitem__('espada ' + 'x' * 65536, 1))
+
+print('\nOK - script terminou sem exceções')
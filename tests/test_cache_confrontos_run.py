@@ -0,0 +1,84 @@
+"""Smoke test for the persistent confrontation cache.
+Checks hits and misses by policy parameters, inventory and calculation
+function, persistence, and invalidation when the enemy models change.
+"""
+import json
+import os
+import tempfile
+
+from models.classes import Guerreiro
+from models.combate import PoliticaAtacar, PoliticaHabilidade, PoliticaPocao
+from models.inimigo import Orc
+from utils.cache_confrontos import CacheConfrontos, versao_modelos
+
+pasta = tempfile.mkdtemp()
+arquivo = os.path.join(pasta, 'confrontos.json')
+calculos = []
+
+
+def contar(personagem, inimigo, politica):
+    calculos.append(type(politica).__name__)
+    return {'prob_vitoria': 0.5}
+
+
+def contar_outro(personagem, inimigo, politica):
+    calculos.append('outro')
+    return {'prob_vitoria': 0.25}
+
+
+print('--- Acertos e falhas ---')
+cache = CacheConfrontos(arquivo)
+g = Guerreiro('Conan')
+exato = cache.obter(g, Orc)
+assert cache.obter(g, Orc) == exato and (cache.acertos, cache.falhas) == (1, 1)
+assert cache.obter(g, Orc, PoliticaHabilidade()) != exato
+# Alterar o resultado devolvido não muda o cache
+alterado = cache.obter(g, Orc)
+alterado['prob_vitoria'] = round(alterado['prob_vitoria'], 1)
+alterado['distribuicao_hp'].clear()
+alterado['extra'] = True
+assert cache.obter(g, Orc) == exato
+
+# Mesma classe de política com parâmetros diferentes
+cache.obter(g, Orc, PoliticaPocao(limiar=0.3), contar)
+cache.obter(g, Orc, PoliticaPocao(limiar=0.3), contar)
+cache.obter(g, Orc, PoliticaPocao(limiar=0.5), contar)
+cache.obter(g, Orc, PoliticaPocao(limiar=0.5, base=PoliticaAtacar()), contar)
+assert len(calculos) == 3
+
+# Inventário diferente e outra função de cálculo
+g.adicionar_item('poção')
+cache.obter(g, Orc, PoliticaPocao(limiar=0.3), contar)
+assert len(calculos) == 4
+assert cache.obter(g, Orc, PoliticaPocao(limiar=0.3), contar_outro) == {'prob_vitoria': 0.25}
+assert cache.obter(g, Orc, PoliticaPocao(limiar=0.3), contar) == {'prob_vitoria': 0.5}
+assert len(calculos) == 5
+print('acertos:', cache.acertos, 'falhas:', cache.falhas)
+
+print('\n--- Persistência e invalidação ---')
+assert cache.salvar()
+recarregado = CacheConfrontos(arquivo)
+assert len(recarregado) == len(cache)
+assert recarregado.obter(Guerreiro('Conan'), Orc) == exato and recarregado.acertos == 1
+
+versao = versao_modelos()
+faixa = Orc.FAIXA_ATAQUE
+Orc.FAIXA_ATAQUE = (0.9, 1.1)
+try:
+    assert versao_modelos() != versao
+    assert recarregado.verificar_modelos() and len(recarregado) == 0
+    assert not recarregado.verificar_modelos()
+    assert len(CacheConfrontos(arquivo)) == 0  # arquivo de outra versão é ignorado
+finally:
+    Orc.FAIXA_ATAQUE = faixa
+assert versao_modelos() == versao and len(CacheConfrontos(arquivo)) == len(cache)
+
+with open(arquivo, encoding='utf-8') as f:
+    dados = json.load(f)
+dados['versao'] = 'antiga'
+with open(arquivo, 'w', encoding='utf-8') as f:
+    json.dump(dados, f)
+assert len(CacheConfrontos(arquivo)) == 0
+print('OK')
+
+print('\nOK - script terminou sem exceções')
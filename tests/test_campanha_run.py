@@ -0,0 +1,71 @@
+"""Smoke test for the campaign simulator.
+Checks that a simulated campaign ends in the same state as the game
+played from the menu with the same seed, that results do not depend on
+the number of processes and that the report adds up.
+"""
+import io
+import random
+
+from jogo import Jogo
+from utils.campanha import EstatisticasCampanha, simular_campanhas
+from utils.logger import Logger
+from utils.repositorio import RepositorioSQLite
+from utils.saida import SaidaBuffer, definir_entrada, definir_saida
+from utils.simulacao import gerar_sementes
+
+if __name__ == "__main__":
+    print('--- Campanha simulada == jogo pelo menu ---')
+    campanha, = simular_campanhas(1, 'Guerreiro', 6, 'atacar', semente=2024, processos=1, subclasse='Paladino')
+    semente, = gerar_sementes(2024, 1)
+    assert campanha['concluida'] and campanha['subclasse'] == 'Paladino'
+
+    menu = iter(['1'] + ['2'] * campanha['missoes'] + ['0'])
+    classe = ['1']
+
+    def teclado(mensagem=''):
+        if mensagem == '\n> ':
+            return next(menu)
+        if mensagem == 'Nome do personagem: ':
+            return 'Simulado'
+        if mensagem == 'Escolha: ':
+            return '2'  # Paladino
+        # Primeiro '> ' é a classe; os demais são ações de combate (atacar)
+        return classe.pop() if classe else '1'
+
+    saida = definir_saida(SaidaBuffer(io.StringIO()))
+    entrada = definir_entrada(teclado)
+    try:
+        jogo = Jogo(rng=random.Random(semente), logger=Logger(None), repositorio=RepositorioSQLite(':memory:'))
+        jogo.executar()
+    finally:
+        definir_entrada(entrada)
+        definir_saida(saida)
+    assert jogo.personagem.nivel == campanha['nivel'] == 6
+    assert len(jogo.personagem.inventario) == campanha['itens']
+    assert jogo.personagem.sub_classe == 'Paladino'
+    print(campanha['missoes'], 'missões até o nível', campanha['nivel'])
+
+    print('\n--- Independente do número de processos ---')
+    um = list(simular_campanhas(40, 'Arqueiro', 6, 'pocao', semente=7, processos=1, subclasse='Caçador'))
+    dois = list(simular_campanhas(40, 'Arqueiro', 6, 'pocao', semente=7, processos=2, subclasse='Caçador'))
+    assert um == dois and len(um) == 40
+    print('OK')
+
+    print('\n--- Relatório ---')
+    estatisticas = EstatisticasCampanha(6, largura_faixa=3)
+    for resumo in um:
+        estatisticas.adicionar(resumo)
+    relatorio = estatisticas.relatorio()
+    assert relatorio['campanhas'] == 40
+    assert sum(f['missoes'] for f in relatorio['derrotas_por_faixa'].values()) == sum(r['missoes'] for r in um)
+    assert list(relatorio['derrotas_por_faixa']) == ['1-3', '4-5']
+    assert relatorio['missoes_ate_nivel']['p10'] <= relatorio['missoes_ate_nivel']['p50'] <= relatorio['missoes_ate_nivel']['max']
+    print(relatorio['missoes_ate_nivel'], relatorio['derrotas_por_faixa'])
+
+    try:
+        next(simular_campanhas(1, 'Mago', 5, subclasse='Paladino'))
+        raise AssertionError('sub-classe de outra classe deveria falhar')
+    except ValueError:
+        pass
+
+    print('\nOK - script terminou sem exceções')
@@ -0,0 +1,64 @@
+"""Smoke test for the headless combat engine.
+Resolves fights with each policy and checks the structured result.
+"""
+from models.classes import Guerreiro, Mago, Arqueiro
+from models.inimigo import Goblin, Lobo, Orc, Chefao, GrupoInimigos
+from models.missão import Missao
+from models.combate import (resolver_combate, Combate, CombateGrupo,
+                            PoliticaAtacar, PoliticaHabilidade, PoliticaPocao)
+import random
+
+random.seed(7)
+
+print('--- Combates headless ---')
+for politica in (PoliticaAtacar(), PoliticaHabilidade(), PoliticaPocao(limiar=0.5)):
+    for classe in (Guerreiro, Mago, Arqueiro):
+        p = classe('Teste')
+        p.adicionar_item('poção')
+        r = resolver_combate(p, Orc(), politica)
+        assert r.turnos >= 1
+        assert r.vitoria == p.esta_vivo()
+        print(f'{type(politica).__name__:20} {classe.__name__:10} →', r.to_dict())
+
+print('\n--- Missão sem saída ---')
+m = Missao('Teste', 'fácil')
+g = Guerreiro('Conan')
+resultado = m.executar_combate(g, politica=PoliticaAtacar(), saida=None)
+assert resultado['vitoria'] and resultado['xp'] == m.xp_recompensa
+print(resultado)
+
+print('\n--- Goblin contra poção ---')
+a = Arqueiro('Legolas')
+a.hp = 10
+a.adicionar_item('poção')
+r = resolver_combate(a, Goblin(), PoliticaPocao(limiar=0.5))
+assert 'poção' not in a.inventario
+print(r.to_dict())
+
+print('\n--- Grupo de um inimigo equivale ao combate simples ---')
+for classe in (Goblin, Lobo, Orc, Chefao):
+    for semente in range(50):
+        resultados = []
+        for em_grupo in (False, True):
+            rng = random.Random(semente)
+            p = Guerreiro('Conan')
+            p.rng = rng
+            inimigo = classe()
+            inimigo.rng = rng
+            combate = CombateGrupo(p, GrupoInimigos([inimigo], rng)) if em_grupo else Combate(p, inimigo)
+            resultados.append(combate.resolver(PoliticaHabilidade()).to_dict())
+        assert resultados[0] == resultados[1], (classe.__name__, semente, resultados)
+print('OK')
+
+print('\n--- Missão em grupo com ondas ---')
+m = Missao('Emboscada', rng=random.Random(5), ondas=[[Goblin, Goblin, Goblin, Lobo], [Orc]])
+assert m.descricao == 'Goblin x3, Lobo, Orc'
+assert m.xp_recompensa == 3 * 30 + 50 + 80
+g = Guerreiro('Conan')
+g.hp = g.hp_maximo = 300
+resultado = m.executar_combate(g, politica=PoliticaHabilidade(), saida=None)
+assert resultado['vitoria']
+assert all(not inimigo.esta_vivo() for inimigo in m.inimigos)
+print(resultado)
+
+print('\nOK - script terminou sem exceções')
@@ -3,7 +3,7 @@ Runs several attacks and abilities to ensure no exceptions and outputs sensible
 """
 from models.personagem import Personagem
 from models.classes import Guerreiro, Mago, Arqueiro
-from utils import calcular_critico, is_critico
+from utils import calcular_critico, is_critico, calcular_critico_lote
 import random
 
 random.seed(42)
@@ -30,4 +30,46 @@ rng = random.Random(123)
 dano, foi = calcular_critico(20, chance=0.5, multiplicador=2.0, rng=rng, animacao=False, verbose=False)
 print('Dano final:', dano, 'foi critico?', foi)
 
+print('\n--- Teste do modo em lote (NumPy) ---')
+try:
+    import numpy as np
+except ImportError:
+    print('NumPy não instalado, pulando modo em lote')
+else:
+    danos, crits = calcular_critico_lote(np.full(100000, 20), chance=0.5, multiplicador=2.0, rng=np.random.default_rng(123))
+    assert set(np.unique(danos)) <= {20, 40}
+    assert (danos[crits] == 40).all() and (danos[~crits] == 20).all()
+    print('Taxa de crítico:', crits.mean(), 'dano médio:', danos.mean())
+
+    # Cada golpe do lote é igual ao da versão escalar com o mesmo resultado de crítico
+    def escalar(dano, crit, multiplicador, mode):
+        return calcular_critico(dano, chance=1.0 if crit else 0.0, multiplicador=multiplicador,
+                                mode=mode, animacao=False, verbose=False)[0]
+
+    base = np.array([0, 7, 13, 20.5, 33.9, 100])
+    for mode, multiplicador in (('multiply', 1.8), ('add', 5.7)):
+        for chance in (0.0, 1.0):
+            lote, crit = calcular_critico_lote(base, chance, multiplicador, mode, rng=np.random.default_rng(1))
+            assert lote.tolist() == [escalar(d, c, multiplicador, mode) for d, c in zip(base.tolist(), crit)]
+        inteiros, _ = calcular_critico_lote([10, 15], 1.0, multiplicador, mode)
+        assert inteiros.dtype.kind == 'i' and inteiros.tolist() == [escalar(10, True, multiplicador, mode),
+                                                                  escalar(15, True, multiplicador, mode)]
+
+    # Modo 'add' e chance por golpe (array)
+    chances = np.tile([0.0, 0.25, 1.0], 100000)
+    danos, crits = calcular_critico_lote(np.full(chances.size, 20), chances, 5, 'add', rng=np.random.default_rng(7))
+    assert not crits[chances == 0.0].any() and crits[chances == 1.0].all()
+    assert abs(crits[chances == 0.25].mean() - 0.25) < 0.01
+    assert set(np.unique(danos)) == {20, 25}
+
+    # Taxa e dano médio iguais aos da versão escalar (mesma semente e N)
+    N = 100000
+    rng_escalar = random.Random(2024)
+    escalares = [calcular_critico(20, 0.3, 1.8, rng=rng_escalar, animacao=False, verbose=False) for _ in range(N)]
+    danos, crits = calcular_critico_lote(np.full(N, 20), 0.3, 1.8, rng=np.random.default_rng(2024))
+    taxa_escalar = sum(foi for _, foi in escalares) / N
+    media_escalar = sum(dano for dano, _ in escalares) / N
+    assert abs(crits.mean() - taxa_escalar) < 0.01 and abs(danos.mean() - media_escalar) < 0.1
+    print('Escalar:', taxa_escalar, media_escalar, '| lote:', crits.mean(), danos.mean())
+
 print('\nOK - script terminou sem exceções')
@@ -0,0 +1,60 @@
+"""Smoke test for the status-effect scheduler.
+Checks expiry, renewal and damage over time, and that Caçador/Piromante
+effects are applied by the combat engine and the batch simulation.
+"""
+import random
+
+from models.classes import Mago, Arqueiro
+from models.combate import Combate, PoliticaAtacar
+from models.efeitos import AgendadorEfeitos, ATORDOAMENTO, SANGRAMENTO
+from models.inimigo import Orc, Goblin
+from utils.simulacao import simular_missoes
+
+print('--- Agendador ---')
+ag = AgendadorEfeitos()
+orc = Orc()
+hp = orc.hp
+ag.aplicar(orc, SANGRAMENTO, 2, turno=1, dano=5)
+ag.aplicar(orc, ATORDOAMENTO, 1, turno=1)
+assert orc.sangramento_turns == 2 and orc.stunned_turns == 1
+eventos = ag.processar_turno(1)
+assert [(t, d) for _, t, d in eventos] == [(SANGRAMENTO, 5)]
+assert ag.ativo(orc, ATORDOAMENTO)
+ag.processar_turno(2)
+assert not ag.ativo(orc, ATORDOAMENTO) and orc.stunned_turns == 0
+assert orc.hp == hp - 10
+# Reaplicar renova a duração em vez de duplicar o efeito
+ag.aplicar(orc, SANGRAMENTO, 2, turno=2, dano=5)
+ag.processar_turno(3)
+assert ag.ativo(orc, SANGRAMENTO) and len(ag) == 1
+ag.processar_turno(4)
+assert len(ag) == 0 and orc.sangramento_turns == 0
+print('OK')
+
+print('\n--- Caçador no combate ---')
+random.seed(3)
+atordoamentos = sangramentos = 0
+for _ in range(200):
+    a = Arqueiro('Caçador')
+    a.aplicar_subclasse('Caçador')
+    combate = Combate(a, Goblin())
+    while not combate.encerrado():
+        combate.executar_turno('atacar')
+        atordoamentos += combate.efeitos.ativo(combate.inimigo, ATORDOAMENTO)
+        sangramentos += combate.efeitos.ativo(combate.inimigo, SANGRAMENTO)
+assert atordoamentos and sangramentos
+print('turnos com inimigo atordoado:', atordoamentos, 'sangrando:', sangramentos)
+
+print('\n--- Combate com mensagens ---')
+m = Mago('Fogo')
+m.aplicar_subclasse('Piromante')
+m.chance_queimadura = 1.0
+Combate(m, Orc(), saida=print).resolver(PoliticaAtacar())
+
+print('\n--- Simulação com sub-classe ---')
+base = simular_missoes(500, classe='Arqueiro', semente=1, processos=1)
+cacador = simular_missoes(500, classe='Arqueiro', semente=1, processos=1, subclasse='Caçador')
+print('Arqueiro:', base['taxa_vitoria'], 'Caçador:', cacador['taxa_vitoria'])
+assert cacador != base
+
+print('\nOK - script terminou sem exceções')
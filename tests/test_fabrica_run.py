@@ -0,0 +1,61 @@
+"""Smoke test for the enemy factory.
+Damages, stuns and bleeds pooled enemies, releases them and checks that the
+recycled instances come back with the template's attributes, and that
+missions return their enemies to the factory when the combat ends.
+"""
+import random
+
+from models.classes import Guerreiro
+from models.combate import PoliticaAtacar
+from models.efeitos import AgendadorEfeitos, ATORDOAMENTO, SANGRAMENTO
+from models.inimigo import Chefao, FabricaInimigos, Goblin, Orc
+from models.missão import Missao
+
+print('--- Inimigo reciclado volta ao modelo ---')
+fabrica = FabricaInimigos()
+for classe in (Goblin, Orc, Chefao):
+    novo = classe()
+    inimigo = fabrica.criar(classe, random.Random(1))
+    inimigo.receber_dano(inimigo.hp - 1)
+    if classe is Chefao:
+        inimigo.mana -= Chefao.CUSTO_ESPECIAL
+    efeitos = AgendadorEfeitos()
+    efeitos.aplicar(inimigo, ATORDOAMENTO, 2, turno=1)
+    efeitos.aplicar(inimigo, SANGRAMENTO, 3, turno=1, dano=4)
+    assert inimigo.stunned_turns and inimigo.sangramento_turns and inimigo.hp == 1
+    fabrica.liberar(inimigo)
+
+    rng = random.Random(2)
+    reciclado = fabrica.criar(classe, rng)
+    assert reciclado is inimigo and reciclado.rng is rng
+    assert (reciclado.hp, reciclado.hp_maximo) == (novo.hp, novo.hp_maximo)
+    assert (reciclado.stunned_turns, reciclado.sangramento_turns, reciclado.queimadura_turns) == (0, 0, 0)
+    assert getattr(reciclado, 'mana', None) == getattr(novo, 'mana', None)
+    assert reciclado.nome == novo.nome and reciclado.dano == novo.dano and reciclado.defesa == novo.defesa
+    print(classe.__name__, 'OK')
+
+print('\n--- Missão devolve os inimigos à fábrica ---')
+fabrica = FabricaInimigos()
+rng = random.Random(3)
+missao = Missao('Teste', rng=rng, fabrica=fabrica, ondas=[[Goblin, Goblin], [Orc]])
+personagem = Guerreiro('Conan')
+personagem.rng = rng
+usados = set(map(id, missao.inimigos))
+missao.executar_combate(personagem, politica=PoliticaAtacar(), saida=None)
+reservas = [inimigo for reserva in fabrica._reservas.values() for inimigo in reserva]
+assert sorted(map(id, reservas)) == sorted(usados)
+# A missão não guarda os inimigos devolvidos nem pode ser executada de novo
+assert missao.inimigo is None and missao.inimigos == [] and missao.ondas == []
+try:
+    missao.executar_combate(personagem, politica=PoliticaAtacar(), saida=None)
+    raise AssertionError('uma missão já executada não deveria combater de novo')
+except ValueError:
+    pass
+missao.liberar_inimigos()  # a segunda chamada não devolve de novo
+assert len([inimigo for reserva in fabrica._reservas.values() for inimigo in reserva]) == 3
+proxima = Missao('Teste', rng=rng, fabrica=fabrica, ondas=[[Goblin, Goblin, Orc]])
+assert {id(inimigo) for inimigo in proxima.inimigos} == usados
+assert all(inimigo.hp == inimigo.hp_maximo for inimigo in proxima.inimigos)
+print('OK')
+
+print('\nOK - script terminou sem exceções')
@@ -0,0 +1,49 @@
+"""Smoke test for startup.
+Checks that reaching the menu loads no model, repository or SQLite module,
+that the log file is only created on the first write, and that
+main.py --profile-startup runs.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+from utils.logger import Logger
+
+print('--- Importações até o menu ---')
+codigo = (
+    "import sys\n"
+    "from utils.saida import definir_saida\n"
+    "from utils.logger import Logger\n"
+    "from jogo import Jogo\n"
+    "definir_saida('nula')\n"
+    "jogo = Jogo(logger=Logger(None))\n"
+    "jogo.exibir_menu()\n"
+    "print(sorted(m for m in sys.modules if m.startswith(('models', 'utils.', 'sqlite3'))))\n"
+)
+carregados = subprocess.run([sys.executable, '-c', codigo], capture_output=True, text=True, check=True).stdout
+print(carregados.strip())
+assert eval(carregados) == ['utils.logger', 'utils.saida']
+
+print('\n--- Log criado só na primeira gravação ---')
+pasta = tempfile.mkdtemp()
+arquivo = os.path.join(pasta, 'jogo.log')
+logger = Logger(arquivo, buffer=True)
+assert not os.path.exists(arquivo) and logger._thread is None
+logger.registrar('primeira mensagem')
+logger.fechar()
+with open(arquivo, encoding='utf-8') as f:
+    conteudo = f.read()
+assert conteudo.startswith('=== Log do Jogo RPG ===') and 'primeira mensagem' in conteudo
+logger.registrar('depois de fechar')
+assert logger._thread is None
+print('OK')
+
+print('\n--- main.py --profile-startup ---')
+# Roda fora do repositório: o jogo grava jogo.log na pasta atual
+perfil = subprocess.run([sys.executable, os.path.abspath('main.py'), '--profile-startup'],
+                        cwd=pasta, capture_output=True, text=True, check=True).stdout
+print(perfil.splitlines()[0])
+assert perfil.startswith('Até o menu') and 'módulo' in perfil
+
+print('\nOK - script terminou sem exceções')
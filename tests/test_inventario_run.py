@@ -0,0 +1,92 @@
+"""Smoke test for the stacked inventory.
+Checks stacking, use, display order, the save format with counts and
+the shared item catalogue.
+"""
+import os
+import tempfile
+
+from models.classes import Guerreiro
+from models.inventario import Inventario, Item, obter_item
+from models.missão import Missao
+from utils.repositorio import Repositorio
+
+print('--- Pilhas ---')
+inv = Inventario()
+for nome in ('poção', 'elixir', 'poção', 'cristal', 'poção'):
+    inv.adicionar_item(nome)
+inv.adicionar_item(Item('elixir', 'Restaura tudo'))
+assert inv.to_dict() == {'poção': 3, 'elixir': 2, 'cristal': 1}
+assert len(inv) == 6 and 'poção' in inv and 'espada' not in inv
+assert inv.resumo() == 'poção x3, elixir x2, cristal'
+assert inv.remover('cristal') and 'cristal' not in inv
+assert not inv.remover('elixir', 3)
+assert inv.resumo() == 'poção x3, elixir x2'
+inv.listar_itens()
+
+# Quantidades menores que 1 não alteram o inventário
+for operacao, quantidade in ((inv.adicionar_item, -2), (inv.adicionar_item, 0),
+                             (inv.remover, -5), (inv.remover, 0)):
+    for nome in ('elixir', 'espada'):
+        try:
+            operacao(nome, quantidade)
+            raise AssertionError(f'quantidade {quantidade} deveria falhar')
+        except ValueError:
+            pass
+assert inv.to_dict() == {'poção': 3, 'elixir': 2} and len(inv) == 5
+assert [(str(item), n) for item, n in inv.pilhas()] == [('poção', 3), ('elixir', 2)]
+vazio = Inventario()
+try:
+    vazio.remover('elixir', -5)
+    raise AssertionError('quantidade negativa deveria falhar')
+except ValueError:
+    pass
+assert not vazio and len(vazio) == 0 and vazio.to_dict() == {} and vazio.pilhas() == []
+
+print('\n--- Personagem ---')
+g = Guerreiro('Conan')
+g.hp = 50
+for _ in range(300):
+    g.adicionar_item('poção')
+assert len(g.inventario) == 300 and len(g.inventario.pilhas()) == 1
+assert g.usar_item('poção') and g.hp == 80
+assert g.inventario.quantidade('poção') == 299
+assert not g.usar_item('cristal')
+g.adicionar_item('cristal')
+assert not g.usar_item('cristal') and g.inventario.quantidade('cristal') == 1
+print(g.inventario.resumo())
+
+print('\n--- Save com quantidades ---')
+pasta = tempfile.mkdtemp()
+repo = Repositorio(os.path.join(pasta, 'save.json'))
+assert repo.salvar(g)
+carregado = Repositorio(repo.arquivo_save).carregar()
+assert carregado.inventario.to_dict() == {'poção': 299, 'cristal': 1}
+# Saves antigos guardavam uma entrada por item
+antigo = Inventario.from_dict(['poção', 'poção', 'elixir'])
+assert antigo.to_dict() == {'poção': 2, 'elixir': 1}
+for invalido in ({'poção': 0}, {'poção': 2, 'elixir': -1}):
+    try:
+        Inventario.from_dict(invalido)
+        raise AssertionError('quantidade não positiva deveria falhar')
+    except ValueError:
+        pass
+print('Carregado:', carregado.inventario.resumo())
+
+print('\n--- Catálogo compartilhado ---')
+pocao = obter_item('poção')
+assert pocao.efeito == 'cura' and pocao.valor == 30
+assert carregado.inventario.obter('poção') is pocao is g.inventario.obter('poção')
+assert all(item is obter_item(item.nome) for item in Missao('Teste').itens_recompensa)
+assert obter_item('espada lendária') is obter_item('espada lendária')
+try:
+    pocao.valor = 999
+    raise AssertionError('item do catálogo deveria ser imutável')
+except AttributeError:
+    pass
+m = Guerreiro('Merlin')
+m.mana = 0
+m.adicionar_item('poção de mana')
+assert m.usar_item(obter_item('poção de mana')) and m.mana == 25
+print('OK')
+
+print('\nOK - script terminou sem exceções')
@@ -0,0 +1,83 @@
+"""Smoke test for the buffered Logger.
+Checks that every message reaches the file when the batch fills up, when
+the interval expires, on fechar() and at interpreter exit, including
+messages logged concurrently by many threads.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from utils.logger import Logger
+
+pasta = tempfile.mkdtemp()
+
+
+def mensagens(arquivo):
+    with open(arquivo, encoding='utf-8') as f:
+        return [linha.split('] ', 1)[1].rstrip('\n') for linha in f if linha.startswith('[')]
+
+
+def esperar(condicao, limite=5.0):
+    fim = time.monotonic() + limite
+    while not condicao():
+        assert time.monotonic() < fim, 'tempo esgotado'
+        time.sleep(0.01)
+
+
+print('--- Várias threads, depois fechar() ---')
+arquivo = os.path.join(pasta, 'threads.log')
+logger = Logger(arquivo, buffer=True, tamanho_lote=7, intervalo=60)
+N, THREADS = 500, 8
+
+
+def escrever(indice):
+    for i in range(N):
+        logger.registrar(f't{indice} m{i}')
+
+
+threads = [threading.Thread(target=escrever, args=(t,)) for t in range(THREADS)]
+for thread in threads:
+    thread.start()
+# fechar() no meio das gravações: o que chega depois é gravado diretamente
+time.sleep(0.005)
+logger.fechar()
+for thread in threads:
+    thread.join()
+gravadas = mensagens(arquivo)
+assert sorted(gravadas) == sorted(f't{t} m{i}' for t in range(THREADS) for i in range(N))
+for t in range(THREADS):
+    assert [m for m in gravadas if m.startswith(f't{t} ')] == [f't{t} m{i}' for i in range(N)]
+print(len(gravadas), 'mensagens, ordem de cada thread preservada')
+
+print('\n--- Lote cheio e intervalo ---')
+arquivo = os.path.join(pasta, 'lote.log')
+logger = Logger(arquivo, buffer=True, tamanho_lote=10, intervalo=60)
+for i in range(10):
+    logger.registrar(f'lote {i}')
+esperar(lambda: os.path.exists(arquivo) and len(mensagens(arquivo)) == 10)
+logger.fechar()
+
+arquivo = os.path.join(pasta, 'intervalo.log')
+logger = Logger(arquivo, buffer=True, tamanho_lote=1000, intervalo=0.05)
+logger.registrar('sozinha')
+esperar(lambda: os.path.exists(arquivo) and mensagens(arquivo) == ['sozinha'])
+logger.descarregar()
+logger.fechar()
+print('OK')
+
+print('\n--- Saída do interpretador sem fechar() ---')
+arquivo = os.path.join(pasta, 'atexit.log')
+codigo = (
+    "from utils.logger import Logger\n"
+    f"logger = Logger({arquivo!r}, buffer=True, tamanho_lote=1000, intervalo=60)\n"
+    "for i in range(300):\n"
+    "    logger.registrar(f'saida {i}')\n"
+)
+subprocess.run([sys.executable, '-c', codigo], check=True)
+assert mensagens(arquivo) == [f'saida {i}' for i in range(300)]
+print('OK')
+
+print('\nOK - script terminou sem exceções')
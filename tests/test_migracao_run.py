@@ -0,0 +1,127 @@
+"""Smoke test for save schema versions and the bulk migrator.
+Loads legacy (unversioned) saves, checks that the next save upgrades
+them, and migrates a folder and a SQLite database in parallel.
+"""
+import json
+import os
+import tempfile
+
+from models.classes import Guerreiro, Mago
+from models.personagem import VERSAO_SAVE
+from utils.migracao import MIGRACOES, migrar, migrar_banco, migrar_pasta
+from utils.repositorio import Repositorio, RepositorioSQLite, personagem_de_dados
+
+# Save da versão 1: sem "versao", campos faltando e inventário em lista
+ANTIGO = {"nome": "Merlin", "classe": "Mago", "hp": 500, "nivel": 3, "xp": 40,
+          "inventario": ["poção", "poção", "elixir"]}
+
+
+def gravar(caminho, dados):
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(dados, f, ensure_ascii=False)
+
+
+def ler_json(caminho):
+    with open(caminho, encoding='utf-8') as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    pasta = tempfile.mkdtemp()
+
+    print('--- Migração da versão 1 ---')
+    migrado = migrar(ANTIGO)
+    padrao = Mago('Merlin')
+    assert migrado['versao'] == VERSAO_SAVE and list(migrado) == list(padrao.to_dict())
+    assert migrado['hp'] == padrao.hp_maximo  # limitado ao máximo
+    assert migrado['inventario'] == {'poção': 2, 'elixir': 1}
+    assert migrado['mana'] == padrao.mana_maxima and migrado['sub_classe'] is None
+    assert migrar(migrado) is migrado
+    m = personagem_de_dados(ANTIGO)
+    assert m.to_dict() == migrado
+    # Todos os caminhos de carregamento passam pela mesma migração
+    assert type(m) is Mago and Mago.from_dict(ANTIGO).to_dict() == migrado
+    print(migrado)
+
+    for invalido, texto in (({**migrado, 'versao': VERSAO_SAVE + 1}, 'mais nova'),
+                            ({**migrado, 'versao': 0}, 'não há migração')):
+        try:
+            migrar(invalido)
+            raise AssertionError('versão inválida deveria falhar')
+        except ValueError as e:
+            assert texto in str(e)
+    assert set(MIGRACOES) == set(range(1, VERSAO_SAVE))
+
+    print('\n--- Repositório regrava saves antigos ---')
+    repo = Repositorio(os.path.join(pasta, 'antigo.json'))
+    gravar(repo.arquivo_save, ANTIGO)
+    with open(repo.arquivo_deltas, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({"xp": 55}) + "\n")
+    carregado = repo.carregar()
+    assert carregado.xp == 55 and carregado.inventario.quantidade('poção') == 2
+    carregado.hp -= 1
+    assert repo.salvar(carregado)
+    assert not os.path.exists(repo.arquivo_deltas)
+    assert ler_json(repo.arquivo_save) == carregado.to_dict()
+    carregado.xp += 1
+    assert repo.salvar(carregado) and os.path.exists(repo.arquivo_deltas)
+    assert Repositorio(repo.arquivo_save).carregar().to_dict() == carregado.to_dict()
+    print('OK')
+
+    print('\n--- Migração em lote de uma pasta ---')
+    saves = os.path.join(pasta, 'saves')
+    os.makedirs(saves)
+    esperados = {}
+    for i in range(600):
+        nome = f'Jogador {i:03d}'
+        if i % 3 == 0:
+            dados = {**ANTIGO, 'nome': nome, 'xp': i}
+        else:
+            dados = Guerreiro(nome).to_dict()
+        gravar(os.path.join(saves, f'{nome}.json'), dados)
+        esperados[nome] = personagem_de_dados(dados).to_dict()
+    # Save atual com deltas pendentes e um arquivo corrompido
+    with open(os.path.join(saves, 'Jogador 001.json.delta'), 'w', encoding='utf-8') as f:
+        f.write(json.dumps({"xp": 7}) + "\n")
+    esperados['Jogador 001']['xp'] = 7
+    with open(os.path.join(saves, 'quebrado.json'), 'w', encoding='utf-8') as f:
+        f.write('{"nome": ')
+
+    copia = os.path.join(pasta, 'saves_v2')
+    resumo = migrar_pasta(saves, destino=copia, processos=2)
+    assert (resumo['migrados'], resumo['atuais'], resumo['falhas']) == (200, 400, 1)
+    assert resumo['erros'][0].startswith('quebrado.json')
+    assert ler_json(os.path.join(saves, 'Jogador 000.json')) == {**ANTIGO, 'nome': 'Jogador 000', 'xp': 0}
+    for nome, dados in esperados.items():
+        assert ler_json(os.path.join(copia, f'{nome}.json')) == dados, nome
+
+    resumo = migrar_pasta(saves, processos=2)
+    assert (resumo['migrados'], resumo['atuais'], resumo['falhas']) == (200, 400, 1)
+    assert not os.path.exists(os.path.join(saves, 'Jogador 001.json.delta'))
+    assert ler_json(os.path.join(saves, 'Jogador 001.json')) == esperados['Jogador 001']
+    resumo = migrar_pasta(saves, processos=1)
+    assert (resumo['migrados'], resumo['atuais']) == (0, 600)
+    print(resumo)
+
+    print('\n--- Migração em lote de um banco SQLite ---')
+    arquivo_banco = os.path.join(pasta, 'saves.db')
+    banco = RepositorioSQLite(arquivo_banco)
+    banco.salvar_varios(Guerreiro(f'Atual {i:03d}') for i in range(300))
+    with banco.conexao:
+        banco.conexao.executemany(
+            "INSERT INTO personagens (nome, classe, nivel, salvo_em, dados) VALUES (?, ?, ?, ?, ?)",
+            [(f'Antigo {i:03d}', 'Mago', 3, 1000 + i, json.dumps({**ANTIGO, 'nome': f'Antigo {i:03d}'}))
+             for i in range(300)],
+        )
+    banco.fechar()
+    resumo = migrar_banco(arquivo_banco, processos=2)
+    assert (resumo['migrados'], resumo['atuais'], resumo['falhas']) == (300, 300, 0)
+    banco = RepositorioSQLite(arquivo_banco)
+    assert banco.carregar().nome == 'Antigo 299'  # ordem de último salvo preservada
+    versoes = {json.loads(dados)['versao'] for (dados,) in banco.conexao.execute("SELECT dados FROM personagens")}
+    assert versoes == {VERSAO_SAVE}
+    assert len(banco.carregar_varios(classe='Mago')) == 300
+    banco.fechar()
+    print(resumo)
+
+    print('\nOK - script terminou sem exceções')
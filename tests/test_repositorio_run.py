@@ -0,0 +1,94 @@
+"""Smoke test for the JSON and SQLite repositories.
+Saves characters, loads them back and checks the restored attributes.
+"""
+import os
+import sqlite3
+import tempfile
+
+from models.classes import Guerreiro, Mago, Arqueiro
+from utils.repositorio import Repositorio, RepositorioSQLite
+
+pasta = tempfile.mkdtemp()
+
+print('--- Repositório JSON ---')
+repo = Repositorio(os.path.join(pasta, 'save.json'))
+g = Guerreiro('Conan')
+g.nivel = 3
+g.adicionar_item('poção')
+assert repo.salvar(g)
+c = repo.carregar()
+assert (c.nome, c.classe, c.nivel, c.hp) == ('Conan', 'Guerreiro', 3, 150)
+print('Carregado:', c.nome, c.classe, c.nivel, [str(i) for i in c.inventario])
+
+print('\n--- Saves incrementais ---')
+c.hp -= 40
+c.xp += 15
+assert c.alteracoes() == {'hp': 110, 'xp': 15}
+assert repo.salvar(c)
+assert os.path.exists(repo.arquivo_deltas)
+assert c.alteracoes() == {}
+c.adicionar_item('elixir')
+assert repo.salvar(c)
+recarregado = Repositorio(repo.arquivo_save).carregar()
+assert (recarregado.hp, recarregado.xp) == (110, 15)
+assert [str(i) for i in recarregado.inventario] == ['poção', 'elixir']
+print('Deltas aplicados:', recarregado.hp, recarregado.xp, [str(i) for i in recarregado.inventario])
+
+# Só os campos alterados são serializados: o save incremental não chama to_dict()
+chamadas = []
+to_dict = type(c).to_dict
+type(c).to_dict = lambda self: chamadas.append(1) or to_dict(self)
+c.hp = c.hp  # atribuído, mas com o mesmo valor
+assert c.alteracoes() == {}
+c.mana -= 5
+c.inventario.remover('poção')
+assert c.alteracoes() == {'inventario': {'elixir': 1}, 'mana': c.mana}
+assert repo.salvar(c) and c.alteracoes() == {} and not chamadas
+type(c).to_dict = to_dict
+assert Repositorio(repo.arquivo_save).carregar().to_dict() == c.to_dict()
+
+compacto = Repositorio(os.path.join(pasta, 'compacto.json'), compactar_a_cada=3)
+compacto.salvar(g)
+for _ in range(5):
+    g.xp += 1
+    compacto.salvar(g)
+assert Repositorio(compacto.arquivo_save).carregar().xp == g.xp
+print('Compactação periódica OK, xp =', g.xp)
+
+# Um save em outro repositório não pode esconder alterações deste
+outro = Repositorio(os.path.join(pasta, 'outro.json'))
+g.xp += 10
+outro.salvar(g)
+compacto.salvar(g)
+assert Repositorio(compacto.arquivo_save).carregar().xp == g.xp
+
+print('\n--- Repositório SQLite ---')
+banco = RepositorioSQLite(os.path.join(pasta, 'saves.db'))
+personagens = []
+for i in range(300):
+    classe = (Guerreiro, Mago, Arqueiro)[i % 3]
+    p = classe(f'Heroi{i:03d}')
+    p.nivel = 1 + i % 10
+    personagens.append(p)
+assert banco.salvar_varios(personagens)
+assert banco.existe_save('Heroi007') and not banco.existe_save('Ninguem')
+
+magos = banco.carregar_varios(classe='Mago', nivel_min=5)
+assert magos and all(m.classe == 'Mago' and m.nivel >= 5 for m in magos)
+print('Magos nível >= 5:', len(magos))
+
+# Mais nomes do que o SQLite aceita de parâmetros em uma consulta
+limite = banco.conexao.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+procurados = [f'Heroi{i:03d}' for i in range(0, 100, 2)] + [f'Fantasma{i}' for i in range(limite)]
+encontrados = banco.carregar_varios(nomes=procurados)
+assert [p.nome for p in encontrados] == sorted(f'Heroi{i:03d}' for i in range(0, 100, 2))
+assert banco.carregar_varios(nomes=[]) == []
+
+m = banco.carregar('Heroi001')
+m.nivel = 42
+assert banco.salvar(m)
+assert banco.carregar().nome == 'Heroi001' and banco.carregar('Heroi001').nivel == 42
+print('Listagem:', banco.listar(nivel_min=42))
+banco.fechar()
+
+print('\nOK - script terminou sem exceções')
@@ -0,0 +1,54 @@
+"""Smoke test for the output sinks.
+Runs the same seeded mission with the console, buffered and null sinks
+and checks what reaches the stream.
+"""
+import io
+import random
+
+from models.classes import Arqueiro
+from models.combate import PoliticaHabilidade
+from models.missão import Missao
+from utils.saida import SaidaConsole, SaidaBuffer, SaidaNula, definir_saida, exibir
+
+
+class FluxoContado(io.StringIO):
+    """StringIO que conta as escritas."""
+
+    escritas = 0
+
+    def write(self, texto):
+        self.escritas += 1
+        return super().write(texto)
+
+
+def jogar(saida):
+    definir_saida(saida)
+    try:
+        p = Arqueiro('Legolas')
+        p.rng = random.Random(11)
+        return Missao('Teste', 'médio', rng=random.Random(11)).executar_combate(p, politica=PoliticaHabilidade())
+    finally:
+        definir_saida(SaidaConsole())
+
+
+console = FluxoContado()
+buffer = FluxoContado()
+r_console = jogar(SaidaConsole(console))
+r_buffer = jogar(SaidaBuffer(buffer))
+r_nula = jogar(SaidaNula())
+
+print('--- Mesmo combate nas três saídas ---')
+assert r_console == r_buffer == r_nula
+assert console.getvalue() == buffer.getvalue()
+assert buffer.escritas < console.escritas
+print(f'console: {console.escritas} escritas, buffer: {buffer.escritas} escritas')
+print('turnos:', r_console['turnos'])
+
+print('\n--- Saída nula ---')
+definir_saida('nula')
+assert not exibir
+exibir('não deve aparecer')
+definir_saida('console')
+assert exibir
+
+print('\nOK - script terminou sem exceções')
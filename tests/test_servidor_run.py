@@ -0,0 +1,142 @@
+"""Smoke test for the asyncio game server.
+Runs many concurrent sessions against one server, each creating, saving
+and showing its own character, and checks that sessions are isolated,
+that saves land in per-player files and that dropped connections end
+their session. Sessions are coroutines: idle players hold no threads, and
+the async menu, combat and level-up match the console versions.
+"""
+import asyncio
+import os
+import random
+import tempfile
+import threading
+
+from models.classes import Guerreiro
+from models.missão import Missao
+from utils.logger import Logger
+from utils.saida import definir_entrada, definir_saida
+from utils.servidor import ServidorJogo
+
+SESSOES = 200
+
+
+async def jogador(porta, nome, linhas):
+    leitor, escritor = await asyncio.open_connection('127.0.0.1', porta)
+    escritor.write(''.join(f'{linha}\n' for linha in [nome] + linhas).encode('utf-8'))
+    await escritor.drain()
+    texto = (await leitor.read()).decode('utf-8')
+    escritor.close()
+    return texto
+
+
+def roteiro(respostas):
+    """Funções de entrada síncrona e assíncrona que devolvem as mesmas respostas."""
+    sincronas, assincronas = iter(respostas), iter(respostas)
+
+    async def ler(mensagem=''):
+        return next(assincronas)
+
+    return lambda mensagem='': next(sincronas), ler
+
+
+def conferir_versoes_assincronas():
+    print('--- Combate e nível pelas versões assíncronas ---')
+    definir_saida('nula')
+    subclasses = set()
+    for semente in range(30):
+        resultados = []
+        for assincrono in (False, True):
+            ler_sincrono, ler = roteiro(['2', '1'] * 100)
+            definir_entrada(ler_sincrono)
+            personagem = Guerreiro('Conan')
+            personagem.rng = random.Random(semente)
+            personagem.ganhar_xp(250)  # nível 3: a próxima vitória pode passar pelo 4
+            missao = Missao('Teste', rng=random.Random(semente), ondas=[[Missao.TIPOS_INIMIGOS['médio'][semente % 2]]])
+            missao.xp_recompensa = 1000
+            if assincrono:
+                resultado = asyncio.run(missao.executar_combate_async(personagem, ler))
+            else:
+                resultado = missao.executar_combate(personagem)
+            resultados.append((resultado, personagem.to_dict()))
+        assert resultados[0] == resultados[1], semente
+        subclasses.add(resultados[0][1]['sub_classe'])
+    assert {'Berserker', 'Paladino'} <= subclasses, subclasses
+    definir_saida('console')
+    print('OK')
+
+
+async def principal():
+    pasta = tempfile.mkdtemp()
+    servidor = ServidorJogo(pasta, logger=Logger(os.path.join(pasta, 'servidor.log'), buffer=True))
+    aberto = await servidor.iniciar('127.0.0.1', 0)
+    porta = aberto.sockets[0].getsockname()[1]
+    try:
+        print(f'--- {SESSOES} sessões simultâneas ---')
+        # Criar personagem (Arqueiro), salvar, ver status e sair
+        saidas = await asyncio.gather(*(
+            jogador(porta, f'jogador{i}', ['1', f'Heroi{i}', '3', '4', '3', '0']) for i in range(SESSOES)
+        ))
+        for i, texto in enumerate(saidas):
+            assert 'Jogo salvo com sucesso!' in texto and f'=== Status de Heroi{i} ===' in texto, texto
+            assert 'Obrigado por jogar!' in texto
+            assert f'Heroi{(i + 1) % SESSOES} ' not in texto
+            assert os.path.exists(os.path.join(pasta, f'jogador{i}.json'))
+        print(saidas[0].splitlines()[-1])
+
+        print('\n--- Sessões paradas não ocupam threads ---')
+        threads, pilha = threading.active_count(), threading.stack_size()
+        conexoes = []
+        for i in range(300):
+            leitor, escritor = await asyncio.open_connection('127.0.0.1', porta)
+            escritor.write(f'parado{i}\n'.encode('utf-8'))
+            conexoes.append((leitor, escritor))
+        for leitor, _ in conexoes:
+            await leitor.readuntil(b'\n> ')  # menu
+        assert len(servidor.sessoes) == 300
+        assert threading.active_count() <= threads and threading.stack_size() == pilha
+        for _, escritor in conexoes:
+            escritor.close()
+        print('sessões:', len(servidor.sessoes), 'threads:', threading.active_count())
+
+        print('\n--- Missão pela conexão ---')
+        # Respostas de sobra para o combate; o fim do envio encerra a sessão
+        leitor, escritor = await asyncio.open_connection('127.0.0.1', porta)
+        escritor.write(''.join(f'{linha}\n' for linha in ['lutador', '1', 'Conan', '1', '2'] + ['1'] * 200).encode('utf-8'))
+        escritor.write_eof()
+        texto = (await leitor.read()).decode('utf-8')
+        escritor.close()
+        assert '=== Missão:' in texto and '=== Resultado da Missão ===' in texto
+        assert '--- Turno 1 ---' in texto and 'Escolha sua ação:' in texto
+        print('OK')
+
+        print('\n--- Save reaproveitado pelo mesmo jogador ---')
+        texto = await jogador(porta, 'jogador7', ['5', '3', '0'])
+        assert 'Jogo carregado com sucesso!' in texto and '=== Status de Heroi7 ===' in texto
+        print('OK')
+
+        print('\n--- Nome inválido e conexão derrubada ---')
+        assert 'Nome inválido!' in await jogador(porta, '../etc', [])
+        # Nome maior que o limite de linha do StreamReader (64 KiB)
+        erros = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, contexto: erros.append(contexto))
+        assert 'Nome inválido!' in await jogador(porta, 'a' * 100000, [])
+        assert not erros, erros
+        leitor, escritor = await asyncio.open_connection('127.0.0.1', porta)
+        escritor.write('caiu\n1\nMerlin\n'.encode('utf-8'))
+        await escritor.drain()
+        await leitor.readuntil(b'> ')  # pergunta da classe
+        assert 'caiu' in servidor.sessoes
+        escritor.close()
+        for _ in range(100):
+            if not servidor.sessoes:
+                break
+            await asyncio.sleep(0.01)
+        assert not servidor.sessoes
+        print('sessões ativas:', len(servidor.sessoes))
+    finally:
+        await servidor.encerrar()
+
+
+conferir_versoes_assincronas()
+asyncio.run(principal())
+print('\nOK - script terminou sem exceções')
@@ -0,0 +1,62 @@
+"""Smoke test for session record and replay.
+Records a scripted session, replays it and checks the final state, then
+checks that a tampered session is reported as divergent.
+"""
+import io
+import json
+import os
+import tempfile
+
+from utils.logger import Logger
+from utils.repositorio import Repositorio
+from utils.saida import SaidaBuffer, definir_saida
+from utils.sessao import gravar_sessao, carregar_sessao, reproduzir_sessao, reproduzir_sessoes
+
+pasta = tempfile.mkdtemp()
+arquivo = os.path.join(pasta, 'sessao.json')
+
+# Cria um Arqueiro, enfrenta duas missões atacando sempre, mostra o status e sai
+menu = iter(['1', '2', '2', '3', '0'])
+respostas = {'Nome do personagem: ': 'Legolas', 'Escolha: ': '1'}
+classe = ['3']
+
+
+def teclado(mensagem=''):
+    if mensagem == '\n> ':
+        return next(menu)
+    if mensagem == '> ':
+        # A primeira pergunta '> ' é a classe; as demais são ações de combate
+        return classe.pop() if classe else '1'
+    return respostas.get(mensagem, '0')
+
+
+# A saída precisa ser verdadeira para que as perguntas cheguem ao teclado
+definir_saida(SaidaBuffer(io.StringIO()))
+try:
+    gravar_sessao(arquivo, semente=1234, logger=Logger(None),
+                  repositorio=Repositorio(os.path.join(pasta, 'save.json')), entrada=teclado)
+finally:
+    definir_saida('console')
+
+print('--- Sessão gravada ---')
+sessao = carregar_sessao(arquivo)
+final = sessao['final']
+assert sessao['semente'] == 1234 and sessao['entradas'][-1] == '0'
+assert final['nome'] == 'Legolas' and final['classe'] == 'Arqueiro' and (final['xp'] or final['nivel'] > 1)
+print(len(sessao['entradas']), 'entradas; estado final: nível', sessao['final']['nivel'], 'xp', sessao['final']['xp'])
+
+print('\n--- Reprodução ---')
+resultado = reproduzir_sessao(arquivo)
+assert resultado['igual'], resultado
+print('OK')
+
+print('\n--- Sessão adulterada ---')
+sessao['semente'] += 1
+adulterada = os.path.join(pasta, 'adulterada.json')
+with open(adulterada, 'w', encoding='utf-8') as f:
+    json.dump(sessao, f)
+resultados = reproduzir_sessoes([arquivo, adulterada], processos=1)
+assert [r['igual'] for r in resultados] == [True, False]
+print('divergência detectada')
+
+print('\nOK - script terminou sem exceções')
@@ -0,0 +1,17 @@
+"""Smoke test for the multi-process simulation runner.
+Checks that the merged results do not depend on the number of processes.
+"""
+from utils.simulacao import simular_missoes
+
+if __name__ == "__main__":
+    print('--- Mesma semente, número de processos diferente ---')
+    um = simular_missoes(2000, classe='Arqueiro', dificuldade='médio', semente=42, processos=1)
+    quatro = simular_missoes(2000, classe='Arqueiro', dificuldade='médio', semente=42, processos=4)
+    assert um == quatro, (um, quatro)
+    print('Taxa de vitória:', um['taxa_vitoria'], 'turnos médios:', um['turnos_medio'])
+    print('Por inimigo:', um['por_inimigo'])
+
+    outra = simular_missoes(2000, classe='Arqueiro', dificuldade='médio', semente=43, processos=1)
+    assert outra != um
+
+    print('\nOK - script terminou sem exceções')
@@ -0,0 +1,34 @@
+"""Smoke test for the exact matchup solver.
+Compares the exact win probability with a quick Monte Carlo estimate.
+"""
+import random
+
+from models.classes import Guerreiro, Mago, Arqueiro
+from models.inimigo import Goblin, Lobo, Orc, Chefao
+from models.combate import resolver_combate, PoliticaAtacar, PoliticaHabilidade
+from utils.solucionador import resolver_confronto
+
+rng = random.Random(11)
+N = 4000
+
+print('--- Exato vs Monte Carlo ---')
+for classe, inimigo, politica in ((Mago, Orc, PoliticaAtacar()), (Arqueiro, Lobo, PoliticaHabilidade()),
+                                  (Mago, Chefao, PoliticaHabilidade()), (Guerreiro, Goblin, PoliticaAtacar())):
+    exato = resolver_confronto(classe('x'), inimigo(), politica)
+    assert abs(sum(exato['distribuicao_hp'].values()) - 1) < 1e-9
+
+    vitorias = turnos = 0
+    for _ in range(N):
+        p = classe('x')
+        p.rng = rng
+        i = inimigo()
+        i.rng = rng
+        r = resolver_combate(p, i, politica)
+        vitorias += r.vitoria
+        turnos += r.turnos
+    assert abs(vitorias / N - exato['prob_vitoria']) < 0.03
+    assert abs(turnos / N - exato['turnos_esperados']) < 0.25
+    print(f"{classe.__name__:10}{inimigo.__name__:8} exato={exato['prob_vitoria']:.4f} "
+          f"mc={vitorias / N:.4f} turnos={exato['turnos_esperados']:.2f}/{turnos / N:.2f}")
+
+print('\nOK - script terminou sem exceções')
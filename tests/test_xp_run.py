@@ -0,0 +1,74 @@
+"""Smoke test for the XP curve.
+Compares bulk XP grants with the old one-level-at-a-time loop, checks
+that the level-4 sub-class menu is offered exactly once and jumps a
+character straight to level 500.
+"""
+import random
+
+from models.classes import Guerreiro
+from models.personagem import custo_nivel, xp_acumulado, nivel_por_xp
+from utils.saida import definir_entrada, definir_saida
+
+
+def ganhar_xp_nivel_a_nivel(p, quantidade):
+    """Implementação anterior de ganhar_xp, sem o menu de sub-classe."""
+    p.xp += quantidade
+    subiu = False
+    while p.xp >= p.xp_proximo_nivel:
+        p.xp -= p.xp_proximo_nivel
+        p.nivel += 1
+        p.xp_proximo_nivel = int(p.xp_proximo_nivel * 1.5)
+        p.hp_maximo += 20
+        p.hp = p.hp_maximo
+        p.dano_base += 2
+        p.defesa += 1
+        subiu = True
+    return subiu
+
+
+print('--- Curva ---')
+assert [custo_nivel(n) for n in range(1, 6)] == [100, 150, 225, 337, 505]
+assert xp_acumulado(4) == 475 and nivel_por_xp(474) == 3 and nivel_por_xp(475) == 4
+print('custos:', [custo_nivel(n) for n in range(1, 8)])
+
+print('\n--- Em lote == nível a nível ---')
+rng = random.Random(19)
+for _ in range(200):
+    novo, antigo = Guerreiro('A'), Guerreiro('B')
+    novo.sub_classe = antigo.sub_classe = 'Paladino'  # sem menu
+    novo.hp = antigo.hp = 1
+    for _ in range(rng.randint(1, 6)):
+        quantidade = rng.choice([0, 1, 50, 99, 100, 475, rng.randint(0, 200000)])
+        assert novo.ganhar_xp(quantidade) == ganhar_xp_nivel_a_nivel(antigo, quantidade)
+        estado_novo, estado_antigo = novo.to_dict(), antigo.to_dict()
+        del estado_novo['nome'], estado_antigo['nome']
+        assert estado_novo == estado_antigo, (estado_novo, estado_antigo)
+print('OK')
+
+print('\n--- Menu de sub-classe uma única vez ---')
+perguntas = []
+anterior_entrada = definir_entrada(lambda mensagem='': perguntas.append(mensagem) or '2')
+anterior_saida = definir_saida('nula')
+try:
+    p = Guerreiro('Conan')
+    p.ganhar_xp(10 ** 6)
+    p.ganhar_xp(10 ** 6)
+    q = Guerreiro('Arthur')
+    q.ganhar_xp(475)
+finally:
+    definir_entrada(anterior_entrada)
+    definir_saida(anterior_saida)
+assert len(perguntas) == 2 and p.sub_classe == q.sub_classe == 'Paladino'
+# O Paladino é escolhido no nível 4 e os níveis seguintes restauram o HP com o bônus
+assert p.hp == p.hp_maximo == 150 + 30 + 20 * (p.nivel - 1)
+print('nível', p.nivel, 'sub-classe', p.sub_classe)
+
+print('\n--- Nível 500 de uma vez ---')
+admin = Guerreiro('Admin')
+admin.sub_classe = 'Berserker'
+assert admin.ganhar_xp(xp_acumulado(500))
+assert admin.nivel == 500 and admin.xp == 0 and admin.xp_proximo_nivel == custo_nivel(500)
+assert admin.dano_base == Guerreiro('X').dano_base + 2 * 499
+print('dano_base no nível 500:', admin.dano_base)
+
+print('\nOK - script terminou sem exceções')
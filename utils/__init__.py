@@ -1,8 +1,15 @@
 """
 Pacote utils contendo utilitários do jogo (repositório e logger).
+
+As funções de crítico são carregadas só no primeiro acesso: importar
+utils.saida (o que todo o jogo faz) não traz junto utils.critico.
 """
 
-from .critico import calcular_critico, is_critico
+__all__ = ["calcular_critico", "is_critico", "calcular_critico_lote", "is_critico_lote"]
 
-__all__ = ["calcular_critico", "is_critico"]
 
+def __getattr__(nome):
+    if nome in __all__:
+        from . import critico
+        return getattr(critico, nome)
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
@@ -0,0 +1,296 @@
+"""
+Módulo que extrai estatísticas do jogo.log de forma incremental.
+
+A análise guarda em um arquivo de estado (JSON pequeno) a posição em bytes
+até onde o log já foi lido e os agregados acumulados: missões iniciadas,
+vencidas e perdidas por inimigo, dano causado e recebido por turno, XP e
+itens ganhos. Cada atualização lê só o que foi acrescentado ao log desde
+a anterior. Se o log foi limpo (Logger.limpar_log) ou substituído, a
+leitura recomeça do início do arquivo novo, mantendo os agregados.
+
+As linhas do servidor (com o prefixo "[jogador]") são separadas por
+sessão: cada sessão tem sua missão em andamento, com o nome do personagem
+registrado no início dela, usado para saber se um "Turno N: X causou D de
+dano" é do jogador ou do inimigo. Linhas que não seguem o formato
+esperado são ignoradas.
+
+Uso:
+    python -m utils.analise_log                     # jogo.log, estado em jogo.log.analise.json
+    python -m utils.analise_log --log servidor.log --estado analise.json
+"""
+
+import argparse
+import json
+import os
+import re
+
+
+# Versão do formato do arquivo de estado
+VERSAO_ESTADO = 1
+# Bytes lidos do log por vez
+TAMANHO_BLOCO = 1 << 20
+# Bytes lidos entre gravações do estado (retomada após interrupção)
+SALVAR_A_CADA = 64 << 20
+
+# "Turno 3: Conan causou 12 de dano", "Turno 3: Goblin sofreu 4 de dano de sangramento", ...
+_TURNO = re.compile(
+    r"Turno (\d+): (.+?) (causou|sofreu|usou habilidade especial causando|inimigo\(s\) causaram) (\d+) de dano"
+)
+# Quantidade no fim do nome de um inimigo repetido (ver missão._descrever)
+_REPETICAO = re.compile(r" x\d+$")
+# Nome do personagem no fim de "Iniciou missão: ..." (logs antigos não têm)
+_PERSONAGEM = " (personagem: "
+
+
+def _estado_vazio():
+    return {
+        "versao": VERSAO_ESTADO,
+        "posicao": 0,
+        "cabecalho": "",
+        "linhas": 0,
+        "missoes": {},
+        "dano_por_turno": {},
+        "xp": 0,
+        "vitorias_com_xp": 0,
+        "itens": {},
+        "sessoes": {},
+    }
+
+
+class AnaliseLog:
+    """
+    Agregados de um arquivo de log, atualizados incrementalmente.
+    """
+
+    def __init__(self, arquivo_log="jogo.log", arquivo_estado=None):
+        """
+        Args:
+            arquivo_log (str): Arquivo de log analisado
+            arquivo_estado (str, optional): Arquivo do estado da análise.
+                Padrão: <arquivo_log>.analise.json
+        """
+        self.arquivo_log = arquivo_log
+        self.arquivo_estado = arquivo_estado or arquivo_log + ".analise.json"
+        self.estado = self._carregar_estado()
+
+    def _carregar_estado(self):
+        """Lê o estado salvo; sem estado (ou inválido), começa do zero."""
+        if not os.path.exists(self.arquivo_estado):
+            return _estado_vazio()
+        try:
+            with open(self.arquivo_estado, 'r', encoding='utf-8') as f:
+                estado = json.load(f)
+            if estado.get("versao") != VERSAO_ESTADO:
+                raise ValueError(f"versão do estado não suportada: {estado.get('versao')}")
+            return estado
+        except Exception as e:
+            print(f"Erro ao carregar o estado da análise: {e}")
+            return _estado_vazio()
+
+    def salvar_estado(self):
+        """
+        Grava o estado da análise (sem nunca deixar o arquivo pela metade).
+
+        Returns:
+            bool: True se salvou com sucesso, False caso contrário
+        """
+        try:
+            temporario = self.arquivo_estado + ".tmp"
+            with open(temporario, 'w', encoding='utf-8') as f:
+                json.dump(self.estado, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(temporario, self.arquivo_estado)
+            return True
+        except Exception as e:
+            print(f"Erro ao salvar o estado da análise: {e}")
+            return False
+
+    def reiniciar(self):
+        """Descarta os agregados e volta a ler o log do início."""
+        self.estado = _estado_vazio()
+
+    def atualizar(self):
+        """
+        Lê as linhas acrescentadas ao log desde a última atualização,
+        atualiza os agregados e grava o estado.
+
+        Uma linha só é lida quando está completa (termina em quebra de
+        linha); o resto fica para a próxima atualização.
+
+        Returns:
+            int: Número de bytes lidos
+        """
+        if not os.path.exists(self.arquivo_log):
+            return 0
+        estado = self.estado
+        with open(self.arquivo_log, 'rb') as f:
+            # O cabeçalho traz a data de criação/limpeza: se mudou, é outro log
+            cabecalho = (f.readline() + f.readline()).decode("utf-8", errors="replace")
+            tamanho = os.fstat(f.fileno()).st_size
+            if cabecalho != estado["cabecalho"] or tamanho < estado["posicao"]:
+                estado["cabecalho"] = cabecalho
+                estado["posicao"] = 0
+                estado["sessoes"] = {}
+
+            inicio = estado["posicao"]
+            f.seek(inicio)
+            pendente = b""
+            desde_gravacao = 0
+            while bloco := f.read(TAMANHO_BLOCO):
+                bloco = pendente + bloco
+                fim = bloco.rfind(b"\n") + 1
+                pendente = bloco[fim:]
+                if not fim:
+                    continue
+                for linha in bloco[:fim].decode("utf-8", errors="replace").split("\n"):
+                    self._processar(linha)
+                estado["posicao"] += fim
+                desde_gravacao += fim
+                if desde_gravacao >= SALVAR_A_CADA:
+                    self.salvar_estado()
+                    desde_gravacao = 0
+
+        self.salvar_estado()
+        return estado["posicao"] - inicio
+
+    def _processar(self, linha):
+        """Atualiza os agregados com uma linha do log."""
+        # "[2024-01-01 12:00:00] mensagem"; o cabeçalho e linhas vazias são ignorados
+        if not linha.startswith("["):
+            return
+        _, separador, mensagem = linha.partition("] ")
+        if not separador:
+            return
+        estado = self.estado
+        estado["linhas"] += 1
+
+        # Linhas do servidor: "[jogador] mensagem"
+        jogador = ""
+        if mensagem.startswith("["):
+            nome, separador, resto = mensagem[1:].partition("] ")
+            if separador:
+                jogador, mensagem = nome, resto
+
+        if mensagem.startswith("Turno "):
+            self._turno(jogador, mensagem)
+        elif mensagem.startswith("Iniciou missão: "):
+            # "Iniciou missão: Caverna Sombria contra Goblin x2, Lobo (personagem: Conan)"
+            personagem = None
+            if mensagem.endswith(")") and _PERSONAGEM in mensagem:
+                mensagem, _, personagem = mensagem[:-1].rpartition(_PERSONAGEM)
+            inimigos = mensagem.rpartition(" contra ")[2]
+            self._missao(inimigos)["iniciadas"] += 1
+            estado["sessoes"][jogador] = {
+                "personagem": personagem,
+                "inimigos": [_REPETICAO.sub("", nome) for nome in inimigos.split(", ")],
+                "turno": 0,
+            }
+        elif mensagem.startswith("Missão concluída: "):
+            self._missao(mensagem.rpartition(" venceu ")[2])["vencidas"] += 1
+            estado["sessoes"].pop(jogador, None)
+        elif mensagem.startswith("Missão falhou: "):
+            self._missao(mensagem.rpartition(" foi derrotado por ")[2])["perdidas"] += 1
+            estado["sessoes"].pop(jogador, None)
+        elif mensagem.startswith("XP ganho: "):
+            # "XP ganho: 50, Itens: poção, elixir"
+            xp, _, itens = mensagem[len("XP ganho: "):].partition(", Itens: ")
+            try:
+                xp = int(xp)
+            except ValueError:
+                return
+            estado["xp"] += xp
+            estado["vitorias_com_xp"] += 1
+            for item in itens.split(", ") if itens else ():
+                estado["itens"][item] = estado["itens"].get(item, 0) + 1
+
+    def _missao(self, inimigos):
+        """Contadores das missões contra um inimigo (ou grupo, ex.: "Goblin x3, Lobo")."""
+        missoes = self.estado["missoes"]
+        if inimigos not in missoes:
+            missoes[inimigos] = {"iniciadas": 0, "vencidas": 0, "perdidas": 0}
+        return missoes[inimigos]
+
+    def _turno(self, jogador, mensagem):
+        """Soma o dano de uma linha de turno ao turno correspondente."""
+        encontrado = _TURNO.match(mensagem)
+        if encontrado is None:
+            return
+        turno, nome, verbo, dano = encontrado.groups()
+        sessao = self.estado["sessoes"].setdefault(jogador, {"personagem": None, "inimigos": [], "turno": 0})
+        if sessao.get("personagem") is not None:
+            do_personagem = nome == sessao["personagem"]
+        else:
+            # Log antigo, sem o nome do personagem: decide pelos inimigos da missão
+            do_personagem = nome not in sessao["inimigos"]
+        if verbo == "causou":
+            recebido = not do_personagem
+        elif verbo == "sofreu":
+            recebido = do_personagem
+        else:
+            recebido = verbo == "inimigo(s) causaram"
+
+        turnos = self.estado["dano_por_turno"]
+        if turno not in turnos:
+            turnos[turno] = {"combates": 0, "causado": 0, "recebido": 0}
+        contagem = turnos[turno]
+        # Primeira linha deste turno no combate da sessão
+        if sessao["turno"] != int(turno):
+            sessao["turno"] = int(turno)
+            contagem["combates"] += 1
+        contagem["recebido" if recebido else "causado"] += int(dano)
+
+    def relatorio(self):
+        """
+        Resumo dos agregados.
+
+        Returns:
+            dict: Linhas lidas, missões por inimigo (com a taxa de vitória),
+            XP e itens ganhos e dano médio por turno dos combates que
+            chegaram a cada turno
+        """
+        estado = self.estado
+        missoes = {}
+        for inimigos, contagem in sorted(estado["missoes"].items(), key=lambda par: -par[1]["iniciadas"]):
+            finalizadas = contagem["vencidas"] + contagem["perdidas"]
+            missoes[inimigos] = {
+                **contagem,
+                "taxa_vitoria": contagem["vencidas"] / finalizadas if finalizadas else None,
+            }
+        dano = {}
+        for turno in sorted(estado["dano_por_turno"], key=int):
+            contagem = estado["dano_por_turno"][turno]
+            combates = contagem["combates"] or 1
+            dano[turno] = {
+                "combates": contagem["combates"],
+                "causado_medio": contagem["causado"] / combates,
+                "recebido_medio": contagem["recebido"] / combates,
+            }
+        return {
+            "linhas": estado["linhas"],
+            "bytes_lidos": estado["posicao"],
+            "missoes": missoes,
+            "xp": {
+                "total": estado["xp"],
+                "por_vitoria": estado["xp"] / estado["vitorias_com_xp"] if estado["vitorias_com_xp"] else 0.0,
+            },
+            "itens": dict(sorted(estado["itens"].items(), key=lambda par: -par[1])),
+            "dano_por_turno": dano,
+        }
+
+
+def main():
+    """Ponto de entrada de linha de comando."""
+    parser = argparse.ArgumentParser(description="Estatísticas incrementais do log do jogo")
+    parser.add_argument("--log", default="jogo.log", help="arquivo de log (padrão: jogo.log)")
+    parser.add_argument("--estado", default=None, help="arquivo de estado (padrão: <log>.analise.json)")
+    parser.add_argument("--reiniciar", action="store_true", help="descarta o estado e relê o log inteiro")
+    args = parser.parse_args()
+
+    analise = AnaliseLog(args.log, args.estado)
+    if args.reiniciar:
+        analise.reiniciar()
+    analise.atualizar()
+    print(json.dumps(analise.relatorio(), indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+"""
+Módulo que ajusta os atributos base das classes e os bônus das
+sub-classes para atingir taxas de vitória alvo por dificuldade.
+
+Os candidatos são sorteados em torno dos valores atuais e avaliados por
+simulação com successive halving: todos começam com poucas lutas por
+dificuldade, só a melhor fração segue para a rodada seguinte, que tem o
+dobro de lutas, e assim por diante até restar um. Todos os candidatos
+lutam com as mesmas sementes, e as lutas de uma rodada são reaproveitadas
+nas seguintes.
+
+Cada dificuldade é avaliada com o personagem no nível em que o jogo
+passa a oferecê-la (ver Missao.dificuldade_por_nivel), e com sub-classe
+pelo menos no nível em que ela é escolhida.
+
+Uso:
+    python -m utils.balanceamento --classe Guerreiro --alvo fácil=0.95 médio=0.75 difícil=0.4
+    python -m utils.balanceamento --classe Mago --subclasse Piromante --candidatos 64 --lutas 200
+    python -m utils.balanceamento --classe Arqueiro --nivel 8
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from models.combate import POLITICAS
+from models.inimigo import FabricaInimigos
+from models.missão import Missao
+from models.personagem import MODIFICADORES_SUBCLASSE, NIVEL_SUBCLASSE, SUBCLASSES, xp_acumulado
+from utils.saida import definir_entrada, definir_saida
+from utils.simulacao import CLASSES, gerar_sementes
+
+
+# Atributos base ajustáveis (definidos no __init__ de cada classe)
+ATRIBUTOS_BASE = ("hp_maximo", "mana_maxima", "dano_base", "defesa")
+
+# Taxas de vitória alvo padrão por dificuldade (ver Missao.TIPOS_INIMIGOS)
+ALVOS_PADRAO = {"fácil": 0.95, "médio": 0.75, "difícil": 0.40}
+
+# Nível em que cada dificuldade passa a ser sorteada (ver Missao.dificuldade_por_nivel)
+NIVEIS_DIFICULDADE = {"fácil": 1, "médio": 3, "difícil": 6}
+
+
+def parametros_atuais(classe, subclasse=None):
+    """
+    Valores atuais dos parâmetros ajustáveis.
+
+    Returns:
+        dict: Atributos base e, com sub-classe, seus bônus como
+        "Sub-classe.atributo" (ex.: "Berserker.dano_base")
+    """
+    personagem = CLASSES[classe]("Balanceamento")
+    parametros = {atributo: getattr(personagem, atributo) for atributo in ATRIBUTOS_BASE}
+    if subclasse:
+        for atributo, delta in MODIFICADORES_SUBCLASSE[subclasse].items():
+            parametros[f"{subclasse}.{atributo}"] = delta
+    return parametros
+
+
+def espaco_busca(parametros):
+    """
+    Faixa de busca de cada parâmetro: de 50% a 150% dos atributos base e de
+    0 ao dobro dos bônus de sub-classe.
+
+    Returns:
+        dict: Parâmetro -> (mínimo, máximo)
+    """
+    espaco = {}
+    for nome, valor in parametros.items():
+        if "." in nome:
+            espaco[nome] = tuple(sorted((0 * valor, 2 * valor)))
+        else:
+            espaco[nome] = (max(1, valor // 2), valor * 3 // 2)
+    return espaco
+
+
+def sortear_parametros(espaco, rng):
+    """Sorteia um candidato no espaço de busca (inteiros continuam inteiros)."""
+    parametros = {}
+    for nome, (minimo, maximo) in espaco.items():
+        if isinstance(minimo, int):
+            parametros[nome] = rng.randint(minimo, maximo)
+        else:
+            parametros[nome] = round(rng.uniform(minimo, maximo), 2)
+    return parametros
+
+
+def nivel_avaliacao(dificuldade, subclasse=None):
+    """
+    Nível do personagem nas lutas de uma dificuldade: o primeiro em que o
+    jogo a oferece, ou o da escolha da sub-classe, se for maior.
+
+    Returns:
+        int: Nível usado na avaliação
+    """
+    nivel = NIVEIS_DIFICULDADE[dificuldade]
+    return max(nivel, NIVEL_SUBCLASSE) if subclasse else nivel
+
+
+def criar_personagem(classe, subclasse, parametros, nivel=1):
+    """
+    Cria um personagem com os atributos base de um candidato, sobe até o
+    nível informado com os ganhos normais de cada nível e aplica os
+    bônus de sub-classe do candidato.
+
+    Args:
+        classe (str): Nome da classe (ver simulacao.CLASSES)
+        subclasse (str): Sub-classe aplicada (ou None)
+        parametros (dict): Parâmetros do candidato (ver parametros_atuais)
+        nivel (int): Nível do personagem
+
+    Returns:
+        Personagem: Personagem como no jogo ao chegar a esse nível
+    """
+    personagem = CLASSES[classe]("Balanceamento")
+    for atributo in ATRIBUTOS_BASE:
+        if atributo in parametros:
+            setattr(personagem, atributo, parametros[atributo])
+    personagem.hp = personagem.hp_maximo
+    personagem.mana = personagem.mana_maxima
+    if nivel > 1:
+        # Sem mensagens e recusando o menu do nível 4: os bônus vêm depois
+        saida_anterior = definir_saida("nula")
+        entrada_anterior = definir_entrada(lambda mensagem="": "0")
+        try:
+            personagem.ganhar_xp(xp_acumulado(nivel))
+        finally:
+            definir_entrada(entrada_anterior)
+            definir_saida(saida_anterior)
+    if subclasse:
+        prefixo = f"{subclasse}."
+        modificadores = {
+            nome[len(prefixo):]: valor for nome, valor in parametros.items() if nome.startswith(prefixo)
+        }
+        personagem.aplicar_subclasse(subclasse, modificadores)
+        if personagem.nivel > NIVEL_SUBCLASSE:
+            # No jogo, os níveis ganhos depois da escolha restauram o HP
+            personagem.hp = personagem.hp_maximo
+    return personagem
+
+
+def _avaliar_lote(args):
+    """Simula um lote de lutas de um candidato e retorna o número de vitórias."""
+    classe, subclasse, parametros, dificuldade, nivel, nome_politica, sementes = args
+    politica = POLITICAS[nome_politica]()
+    fabrica = FabricaInimigos()
+    vitorias = 0
+    for semente in sementes:
+        rng = random.Random(semente)
+        personagem = criar_personagem(classe, subclasse, parametros, nivel)
+        personagem.rng = rng
+        missao = Missao("Balanceamento", dificuldade, rng=rng, fabrica=fabrica)
+        vitorias += missao.executar_combate(personagem, politica=politica, saida=None)["vitoria"]
+    return vitorias
+
+
+def _erro(vitorias, lutas, alvos):
+    """Soma dos quadrados das diferenças entre as taxas de vitória e os alvos."""
+    return sum((vitorias[dificuldade] / lutas - alvo) ** 2 for dificuldade, alvo in alvos.items())
+
+
+def otimizar(classe, alvos=None, subclasse=None, candidatos=32, lutas_iniciais=100, fator=2,
+             politica="habilidade", semente=0, processos=None, nivel=None):
+    """
+    Procura os parâmetros cujas taxas de vitória mais se aproximam dos alvos.
+
+    Args:
+        classe (str): Nome da classe (ver simulacao.CLASSES)
+        alvos (dict, optional): Dificuldade -> taxa de vitória alvo (padrão: ALVOS_PADRAO)
+        subclasse (str, optional): Sub-classe cujos bônus também são ajustados
+        candidatos (int): Número de candidatos iniciais (o primeiro é a configuração atual)
+        lutas_iniciais (int): Lutas por dificuldade na primeira rodada
+        fator (int): A cada rodada, fica 1/fator dos candidatos e as lutas são multiplicadas por fator
+        politica (str): Nome da política de ações (ver models.combate.POLITICAS)
+        semente (int): Semente mestra (candidatos e lutas)
+        processos (int, optional): Número de processos. Se None, usa todos os
+            núcleos; com 1, roda no processo atual.
+        nivel (int, optional): Nível do personagem em todas as dificuldades.
+            Se None, usa nivel_avaliacao() de cada uma.
+
+    Returns:
+        dict: Melhor candidato, configuração atual, níveis avaliados,
+        histórico das rodadas e lutas simuladas comparadas com o orçamento
+        sem corte
+    """
+    alvos = dict(alvos or ALVOS_PADRAO)
+    if classe not in CLASSES:
+        raise ValueError(f"classe inválida: {classe}")
+    if subclasse and subclasse not in SUBCLASSES[classe]:
+        raise ValueError(f"sub-classe inválida para {classe}: {subclasse}")
+    if politica not in POLITICAS:
+        raise ValueError(f"política inválida: {politica}")
+    for dificuldade, alvo in alvos.items():
+        if dificuldade not in Missao.TIPOS_INIMIGOS or not 0.0 <= alvo <= 1.0:
+            raise ValueError(f"alvo inválido: {dificuldade}={alvo}")
+    if candidatos < 1 or lutas_iniciais < 1 or fator < 2:
+        raise ValueError("candidatos e lutas devem ser positivos e o fator pelo menos 2")
+    if nivel is not None and nivel < (NIVEL_SUBCLASSE if subclasse else 1):
+        raise ValueError(f"nível inválido: {nivel} (sub-classes começam no nível {NIVEL_SUBCLASSE})")
+    niveis = {
+        dificuldade: nivel if nivel is not None else nivel_avaliacao(dificuldade, subclasse)
+        for dificuldade in alvos
+    }
+
+    rng = random.Random(semente)
+    atuais = parametros_atuais(classe, subclasse)
+    espaco = espaco_busca(atuais)
+    parametros = [atuais] + [sortear_parametros(espaco, rng) for _ in range(candidatos - 1)]
+
+    # Lutas da última rodada: define quantas sementes cada dificuldade precisa
+    rodadas = 0
+    restantes = candidatos
+    while restantes > 1:
+        restantes = math.ceil(restantes / fator)
+        rodadas += 1
+    lutas_finais = lutas_iniciais * fator ** rodadas
+    sementes = {
+        dificuldade: gerar_sementes(rng.getrandbits(64), lutas_finais) for dificuldade in alvos
+    }
+
+    vitorias = [dict.fromkeys(alvos, 0) for _ in parametros]
+    feitas = [0] * len(parametros)
+    vivos = list(range(len(parametros)))
+    historico = []
+    lutas_total = 0
+    lutas = lutas_iniciais
+    processos = processos or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=processos) if processos > 1 else None
+    try:
+        while True:
+            # Só as lutas que o candidato ainda não fez nas rodadas anteriores
+            tarefas = [
+                (indice, dificuldade,
+                 (classe, subclasse, parametros[indice], dificuldade, niveis[dificuldade], politica,
+                  sementes[dificuldade][feitas[indice]:lutas]))
+                for indice in vivos for dificuldade in alvos
+            ]
+            argumentos = [tarefa for _, _, tarefa in tarefas]
+            if executor is None:
+                resultados = map(_avaliar_lote, argumentos)
+            else:
+                resultados = executor.map(_avaliar_lote, argumentos)
+            for (indice, dificuldade, tarefa), ganhas in zip(tarefas, resultados):
+                vitorias[indice][dificuldade] += ganhas
+                lutas_total += len(tarefa[-1])
+            for indice in vivos:
+                feitas[indice] = lutas
+
+            vivos.sort(key=lambda indice: (_erro(vitorias[indice], lutas, alvos), indice))
+            historico.append({
+                "candidatos": len(vivos),
+                "lutas": lutas,
+                "melhor_erro": _erro(vitorias[vivos[0]], lutas, alvos),
+            })
+            if len(vivos) == 1:
+                break
+            vivos = vivos[:math.ceil(len(vivos) / fator)]
+            lutas *= fator
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    def resumo(indice):
+        return {
+            "parametros": parametros[indice],
+            "lutas": feitas[indice],
+            "taxas": {d: vitorias[indice][d] / feitas[indice] for d in alvos},
+            "erro": _erro(vitorias[indice], feitas[indice], alvos),
+        }
+
+    return {
+        "classe": classe,
+        "subclasse": subclasse,
+        "alvos": alvos,
+        "niveis": niveis,
+        "melhor": resumo(vivos[0]),
+        "atual": resumo(0),
+        "rodadas": historico,
+        "lutas_total": lutas_total,
+        "lutas_sem_corte": len(parametros) * lutas_finais * len(alvos),
+    }
+
+
+def _ler_alvos(textos):
+    """Converte ["fácil=0.95", ...] em {"fácil": 0.95, ...}."""
+    alvos = {}
+    for texto in textos:
+        dificuldade, _, taxa = texto.partition("=")
+        alvos[dificuldade] = float(taxa)
+    return alvos
+
+
+def main():
+    """Ponto de entrada de linha de comando."""
+    parser = argparse.ArgumentParser(description="Balanceamento de atributos por simulação")
+    parser.add_argument("--classe", default="Guerreiro", choices=sorted(CLASSES))
+    parser.add_argument("--subclasse", default=None, help="ajusta também os bônus desta sub-classe")
+    parser.add_argument("--alvo", nargs="+", metavar="DIFICULDADE=TAXA",
+                        help="taxas de vitória alvo (padrão: fácil=0.95 médio=0.75 difícil=0.4)")
+    parser.add_argument("--candidatos", type=int, default=32)
+    parser.add_argument("--lutas", type=int, default=100, help="lutas por dificuldade na primeira rodada")
+    parser.add_argument("--fator", type=int, default=2, help="fator de corte entre rodadas")
+    parser.add_argument("--politica", default="habilidade", choices=sorted(POLITICAS))
+    parser.add_argument("--semente", type=int, default=0, help="semente mestra")
+    parser.add_argument("--processos", type=int, default=None, help="padrão: todos os núcleos")
+    parser.add_argument("--nivel", type=int, default=None,
+                        help="nível do personagem em todas as dificuldades (padrão: o nível em que cada uma aparece)")
+    args = parser.parse_args()
+
+    resultado = otimizar(
+        args.classe, _ler_alvos(args.alvo) if args.alvo else None, args.subclasse, args.candidatos,
+        args.lutas, args.fator, args.politica, args.semente, args.processos, args.nivel,
+    )
+    print(json.dumps(resultado, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
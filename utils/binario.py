@@ -0,0 +1,214 @@
+"""
+Módulo que define o formato binário compacto do estado de um personagem,
+para snapshots e transferência de sessões (o save em disco continua em
+JSON, ver utils/repositorio.py).
+
+Layout da versão 1 (little-endian):
+    fixo        "RPG", versão, classe, sub-classe (B, índices nas tabelas
+                abaixo), hp, hp_maximo, nivel, mana, mana_maxima,
+                dano_base, defesa, cura_base (int32) e crit_chance,
+                stun_chance, dot_sangramento, buff_dano, chance_queimadura
+                (float64, sem perda)
+    xp          xp e xp_proximo_nivel: tamanho (B) + inteiro com sinal
+                (no nível 500 o custo de XP passa de 64 bits)
+    textos      nome e, fora das tabelas, classe/sub-classe: tamanho (H) + UTF-8
+    inventário  número de pilhas (H); cada pilha: índice do item (B) +
+                quantidade (I), com o nome logo após o índice se o item
+                não estiver na tabela
+
+As tabelas de classes, sub-classes e itens fazem parte da versão: só
+podem crescer no fim, porque o índice é o que vai gravado.
+
+Uso:
+    dados = codificar(personagem)
+    personagem = decodificar(dados)
+"""
+
+import struct
+
+from models.personagem import VERSAO_SAVE
+from utils.repositorio import personagem_de_dados
+
+
+MAGICO = b"RPG"
+VERSAO_BINARIO = 1
+
+# Tabelas internadas da versão 1
+CLASSES_V1 = ("Guerreiro", "Mago", "Arqueiro")
+SUBCLASSES_V1 = ("Berserker", "Paladino", "Caçador", "Patrulheiro", "Piromante", "Clerigo")
+ITENS_V1 = ("poção", "poção de mana", "elixir", "cristal")
+
+# Índices especiais: valor ausente (sub-classe) e texto gravado por extenso
+_NENHUM = 254
+_POR_EXTENSO = 255
+
+_FIXO = struct.Struct("<3sBBB8i5d")
+_TAMANHO = struct.Struct("<B")
+_TEXTO = struct.Struct("<H")
+_PILHA = struct.Struct("<BI")
+
+_INDICE_CLASSE = {nome: indice for indice, nome in enumerate(CLASSES_V1)}
+_INDICE_SUBCLASSE = {nome: indice for indice, nome in enumerate(SUBCLASSES_V1)}
+_INDICE_ITEM = {nome: indice for indice, nome in enumerate(ITENS_V1)}
+
+
+def _texto(texto):
+    dados = texto.encode("utf-8")
+    return _TEXTO.pack(len(dados)) + dados
+
+
+def _inteiro(valor):
+    dados = valor.to_bytes(valor.bit_length() // 8 + 1, "little", signed=True)
+    return _TAMANHO.pack(len(dados)) + dados
+
+
+def codificar(personagem):
+    """
+    Codifica o estado do personagem (o mesmo de Personagem.to_dict).
+
+    Args:
+        personagem: Instância do personagem
+
+    Returns:
+        bytes: Estado no formato binário da versão atual
+
+    Raises:
+        ValueError: Se um valor não couber no formato (atributos em 32 bits,
+            XP até 255 bytes, quantidades de 0 a 2**32 - 1, textos e número
+            de pilhas até 65535)
+    """
+    classe = _INDICE_CLASSE.get(personagem.classe, _POR_EXTENSO)
+    sub_classe = personagem.sub_classe
+    indice_sub = _NENHUM if sub_classe is None else _INDICE_SUBCLASSE.get(sub_classe, _POR_EXTENSO)
+    try:
+        fixo = _FIXO.pack(
+            MAGICO, VERSAO_BINARIO, classe, indice_sub,
+            personagem.hp, personagem.hp_maximo, personagem.nivel, personagem.mana,
+            personagem.mana_maxima, personagem.dano_base, personagem.defesa, personagem.cura_base,
+            personagem.crit_chance, personagem.stun_chance, personagem.dot_sangramento,
+            personagem.buff_dano, personagem.chance_queimadura,
+        )
+        partes = [fixo, _inteiro(personagem.xp), _inteiro(personagem.xp_proximo_nivel), _texto(personagem.nome)]
+        if classe == _POR_EXTENSO:
+            partes.append(_texto(personagem.classe))
+        if indice_sub == _POR_EXTENSO:
+            partes.append(_texto(sub_classe))
+
+        pilhas = personagem.inventario.to_dict()
+        partes.append(_TEXTO.pack(len(pilhas)))
+        for nome, quantidade in pilhas.items():
+            indice = _INDICE_ITEM.get(nome, _POR_EXTENSO)
+            partes.append(_PILHA.pack(indice, quantidade))
+            if indice == _POR_EXTENSO:
+                partes.append(_texto(nome))
+    except struct.error as e:
+        raise ValueError(f"atributo fora do formato binário: {e}") from e
+    return b"".join(partes)
+
+
+def _ler_texto(dados, posicao):
+    tamanho, = _TEXTO.unpack_from(dados, posicao)
+    posicao += _TEXTO.size
+    return dados[posicao:posicao + tamanho].decode("utf-8"), posicao + tamanho
+
+
+def _ler_inteiro(dados, posicao):
+    tamanho = dados[posicao]
+    posicao += _TAMANHO.size
+    return int.from_bytes(dados[posicao:posicao + tamanho], "little", signed=True), posicao + tamanho
+
+
+def _decodificar_v1(dados):
+    (_, _, classe, indice_sub, hp, hp_maximo, nivel, mana, mana_maxima, dano_base, defesa, cura_base,
+     crit_chance, stun_chance, dot_sangramento, buff_dano, chance_queimadura) = _FIXO.unpack_from(dados)
+    posicao = _FIXO.size
+    xp, posicao = _ler_inteiro(dados, posicao)
+    xp_proximo_nivel, posicao = _ler_inteiro(dados, posicao)
+    nome, posicao = _ler_texto(dados, posicao)
+    if classe == _POR_EXTENSO:
+        classe, posicao = _ler_texto(dados, posicao)
+    else:
+        classe = CLASSES_V1[classe]
+    if indice_sub == _POR_EXTENSO:
+        sub_classe, posicao = _ler_texto(dados, posicao)
+    else:
+        sub_classe = None if indice_sub == _NENHUM else SUBCLASSES_V1[indice_sub]
+
+    inventario = {}
+    num_pilhas, = _TEXTO.unpack_from(dados, posicao)
+    posicao += _TEXTO.size
+    for _ in range(num_pilhas):
+        indice, quantidade = _PILHA.unpack_from(dados, posicao)
+        posicao += _PILHA.size
+        if indice == _POR_EXTENSO:
+            item, posicao = _ler_texto(dados, posicao)
+        else:
+            item = ITENS_V1[indice]
+        inventario[item] = quantidade
+    if posicao != len(dados):
+        raise ValueError("tamanho dos dados não confere com o conteúdo")
+
+    return {
+        # O layout acompanha o esquema do save: mudar to_dict() exige uma
+        # nova versão do formato binário
+        "versao": VERSAO_SAVE,
+        "nome": nome,
+        "classe": classe,
+        "sub_classe": sub_classe,
+        "hp": hp,
+        "hp_maximo": hp_maximo,
+        "nivel": nivel,
+        "xp": xp,
+        "xp_proximo_nivel": xp_proximo_nivel,
+        "inventario": inventario,
+        "mana": mana,
+        "mana_maxima": mana_maxima,
+        "dano_base": dano_base,
+        "defesa": defesa,
+        "crit_chance": crit_chance,
+        "stun_chance": stun_chance,
+        "dot_sangramento": dot_sangramento,
+        "buff_dano": buff_dano,
+        "chance_queimadura": chance_queimadura,
+        "cura_base": cura_base,
+    }
+
+
+# Decodificador de cada versão do formato
+_DECODIFICADORES = {
+    1: _decodificar_v1,
+}
+
+
+def decodificar_dados(dados):
+    """
+    Decodifica o formato binário (qualquer versão conhecida).
+
+    Args:
+        dados (bytes): Estado codificado por codificar()
+
+    Returns:
+        dict: Dados do personagem no formato de Personagem.to_dict
+
+    Raises:
+        ValueError: Se os dados não estão no formato ou a versão é desconhecida
+    """
+    if dados[:len(MAGICO)] != MAGICO or len(dados) <= len(MAGICO):
+        raise ValueError("dados não estão no formato binário de personagem")
+    versao = dados[len(MAGICO)]
+    if versao not in _DECODIFICADORES:
+        raise ValueError(f"versão do formato binário não suportada: {versao}")
+    try:
+        return _DECODIFICADORES[versao](dados)
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise ValueError(f"dados binários truncados ou inválidos: {e}") from e
+
+
+def decodificar(dados):
+    """
+    Reconstrói um personagem a partir do formato binário.
+
+    Returns:
+        Personagem: Instância da classe correspondente
+    """
+    return personagem_de_dados(decodificar_dados(dados))
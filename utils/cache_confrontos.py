@@ -0,0 +1,213 @@
+"""
+Módulo que implementa um cache persistente (LRU) de resultados de confrontos.
+
+A chave é uma assinatura canônica dos atributos e do inventário do
+personagem, do tipo de inimigo, da política de ações (com os parâmetros) e
+da função que calcula o resultado. O arquivo de cache guarda também uma
+versão calculada a partir dos modelos de inimigo e do código das regras de
+combate; se algum deles mudar, o cache antigo é descartado ao carregar.
+"""
+
+import copy
+import hashlib
+import importlib
+import json
+import os
+from collections import OrderedDict
+from functools import lru_cache
+
+from models.combate import PoliticaAtacar
+from models.inimigo import MODELOS_INIMIGOS
+from utils.solucionador import resolver_confronto
+
+
+# Atributos do personagem que influenciam o resultado de um combate
+CAMPOS_ASSINATURA = (
+    "hp", "hp_maximo", "mana", "mana_maxima", "dano_base", "defesa",
+    "crit_chance", "stun_chance", "dot_sangramento", "buff_dano",
+    "chance_queimadura", "cura_base",
+)
+
+# Constantes de classe dos inimigos que entram na versão dos modelos
+_CONSTANTES_INIMIGO = (
+    "FAIXA_ATAQUE", "CHANCE_ATAQUE_DUPLO", "CHANCE_ESPECIAL", "CUSTO_ESPECIAL",
+    "FAIXA_ESPECIAL", "CHANCE_REGENERACAO", "CURA_REGENERACAO",
+)
+
+# Módulos com as regras que decidem um confronto (ataques, habilidades,
+# críticos, efeitos de status e o próprio solucionador)
+_MODULOS_REGRAS = (
+    "models.base", "models.personagem", "models.classes", "models.inimigo",
+    "models.efeitos", "models.combate", "utils.critico", "utils.solucionador",
+)
+
+
+@lru_cache(maxsize=None)
+def _versao_codigo():
+    """Hash do código-fonte dos módulos de regras (não muda durante a execução)."""
+    resumo = hashlib.sha1()
+    for nome in _MODULOS_REGRAS:
+        with open(importlib.import_module(nome).__file__, 'rb') as f:
+            resumo.update(nome.encode("utf-8") + b"\0" + f.read())
+    return resumo.hexdigest()
+
+
+def versao_modelos():
+    """
+    Calcula uma impressão digital dos modelos de inimigo.
+
+    Returns:
+        str: Hash que muda sempre que atributos ou constantes de algum
+        inimigo mudam, ou o código das regras de combate (_MODULOS_REGRAS)
+    """
+    partes = [_versao_codigo()]
+    for classe in sorted(MODELOS_INIMIGOS, key=lambda c: c.__name__):
+        constantes = [(nome, getattr(classe, nome, None)) for nome in _CONSTANTES_INIMIGO]
+        partes.append([classe.__name__, list(MODELOS_INIMIGOS[classe]), constantes])
+    texto = json.dumps(partes, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(texto.encode("utf-8")).hexdigest()
+
+
+def _descrever_politica(politica):
+    """Classe e parâmetros da política, incluindo políticas aninhadas (ex.: base)."""
+    if not hasattr(politica, "__dict__"):
+        return politica
+    parametros = {nome: _descrever_politica(valor) for nome, valor in sorted(vars(politica).items())}
+    return [type(politica).__name__, parametros]
+
+
+def assinatura(personagem, tipo_inimigo, politica=None, calcular=None):
+    """
+    Monta a chave canônica de um confronto.
+
+    Args:
+        personagem: Instância do personagem
+        tipo_inimigo: Classe do inimigo (ex.: Orc)
+        politica: Política de ações (padrão: PoliticaAtacar)
+        calcular: Função que calcula o resultado (padrão: solucionador exato)
+
+    Returns:
+        str: Chave do cache
+    """
+    politica = politica if politica is not None else PoliticaAtacar()
+    calcular = calcular or resolver_confronto
+    valores = [type(personagem).__name__, personagem.sub_classe]
+    valores.extend(getattr(personagem, campo) for campo in CAMPOS_ASSINATURA)
+    valores.append(sorted(personagem.inventario.to_dict().items()))
+    valores.extend([tipo_inimigo.__name__, _descrever_politica(politica)])
+    valores.append(f"{calcular.__module__}.{calcular.__qualname__}")
+    return json.dumps(valores, ensure_ascii=False, separators=(",", ":"), default=repr)
+
+
+class CacheConfrontos:
+    """
+    Cache LRU de resultados de confrontos, com tamanho limitado e
+    persistência em arquivo JSON.
+    """
+
+    def __init__(self, arquivo="confrontos.json", capacidade=10000):
+        """
+        Inicializa o cache, carregando o arquivo se ele existir e ainda
+        corresponder aos modelos de inimigo atuais.
+
+        Args:
+            arquivo (str): Arquivo de persistência (None para não persistir)
+            capacidade (int): Número máximo de entradas
+        """
+        self.arquivo = arquivo
+        self.capacidade = capacidade
+        self.versao = versao_modelos()
+        self.acertos = 0
+        self.falhas = 0
+        self._entradas = OrderedDict()
+        self._carregar()
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def _carregar(self):
+        """Lê o arquivo de cache, ignorando-o se a versão dos modelos mudou."""
+        if not self.arquivo or not os.path.exists(self.arquivo):
+            return
+        try:
+            with open(self.arquivo, 'r', encoding='utf-8') as f:
+                dados = json.load(f)
+        except Exception as e:
+            print(f"Erro ao carregar o cache de confrontos: {e}")
+            return
+        if dados.get("versao") != self.versao:
+            return
+        for chave, valor in dados.get("entradas", [])[-self.capacidade:]:
+            # JSON grava as chaves da distribuição como texto
+            if "distribuicao_hp" in valor:
+                valor["distribuicao_hp"] = {int(hp): p for hp, p in valor["distribuicao_hp"].items()}
+            self._entradas[chave] = valor
+
+    def salvar(self):
+        """
+        Grava o cache em disco, do menos para o mais recentemente usado.
+
+        Returns:
+            bool: True se salvou com sucesso, False caso contrário
+        """
+        if not self.arquivo:
+            return False
+        try:
+            temporario = self.arquivo + ".tmp"
+            with open(temporario, 'w', encoding='utf-8') as f:
+                json.dump({"versao": self.versao, "entradas": list(self._entradas.items())},
+                          f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(temporario, self.arquivo)
+            return True
+        except Exception as e:
+            print(f"Erro ao salvar o cache de confrontos: {e}")
+            return False
+
+    def obter(self, personagem, tipo_inimigo, politica=None, calcular=None):
+        """
+        Retorna o resultado do confronto, calculando-o apenas se não estiver no cache.
+
+        Args:
+            personagem: Instância do personagem
+            tipo_inimigo: Classe do inimigo (ex.: Orc)
+            politica: Política de ações (padrão: PoliticaAtacar)
+            calcular: Função (personagem, inimigo, politica) -> dict usada em
+                caso de falha. Padrão: solucionador exato.
+
+        Returns:
+            dict: Cópia do resultado do confronto (alterá-la não muda o cache)
+        """
+        calcular = calcular or resolver_confronto
+        chave = assinatura(personagem, tipo_inimigo, politica, calcular)
+        valor = self._entradas.get(chave)
+        if valor is not None:
+            self._entradas.move_to_end(chave)
+            self.acertos += 1
+            return copy.deepcopy(valor)
+
+        self.falhas += 1
+        valor = calcular(personagem, tipo_inimigo(), politica)
+        self._entradas[chave] = valor
+        if len(self._entradas) > self.capacidade:
+            self._entradas.popitem(last=False)
+        return copy.deepcopy(valor)
+
+    def verificar_modelos(self):
+        """
+        Confere se os modelos de inimigo mudaram desde que o cache foi
+        criado (ex.: ajustes feitos em tempo de execução) e, nesse caso,
+        descarta as entradas.
+
+        Returns:
+            bool: True se o cache foi invalidado
+        """
+        versao = versao_modelos()
+        if versao == self.versao:
+            return False
+        self.versao = versao
+        self.limpar()
+        return True
+
+    def limpar(self):
+        """Descarta todas as entradas."""
+        self._entradas.clear()
@@ -0,0 +1,308 @@
+"""
+Módulo que simula campanhas completas, do nível 1 até um nível alvo.
+
+Cada campanha joga como o menu do jogo (Jogo.encarar_missao): missão
+sorteada pelo nível, XP, itens e, no nível 4, a escolha de sub-classe,
+tudo com um random.Random semeado a partir de uma semente mestra. Os
+resultados são produzidos um a um (simular_campanhas é um gerador) e
+agregados em EstatisticasCampanha, cujo tamanho depende só do nível alvo,
+nunca do número de campanhas ou de missões.
+
+Uso:
+    python -m utils.campanha --campanhas 5000 --nivel 10 --classe Mago --subclasse todas
+"""
+
+import argparse
+import json
+import os
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from models.combate import POLITICAS
+from models.inimigo import FabricaInimigos
+from models.missão import Missao
+from models.personagem import SUBCLASSES
+from utils.saida import definir_entrada, definir_saida
+from utils.simulacao import CLASSES
+
+
+# Limite de missões por campanha (evita laços sem fim com políticas ruins)
+MAX_MISSOES = 10000
+# Campanhas por lote enviado a um processo
+TAMANHO_LOTE = 32
+
+
+def simular_campanha(classe, nivel_alvo, politica, semente, subclasse=None, fabrica=None,
+                     max_missoes=MAX_MISSOES):
+    """
+    Joga uma campanha com um personagem novo até `nivel_alvo`.
+
+    A sub-classe é escolhida pelo menu do nível 4, como no jogo: quem chama
+    deve direcionar as entradas (ver _simular_lote).
+
+    Args:
+        classe (str): Nome da classe do personagem (ver simulacao.CLASSES)
+        nivel_alvo (int): Nível em que a campanha termina
+        politica: Política de ações do combate
+        semente (int): Semente do random.Random da campanha
+        subclasse (str, optional): Sub-classe escolhida no nível 4 (só registrada aqui)
+        fabrica (FabricaInimigos, optional): Fábrica que recicla os inimigos
+        max_missoes (int): Número máximo de missões
+
+    Returns:
+        dict: Resumo da campanha. As listas são indexadas pelo nível
+        (índice 0 = nível 1) e vão até o nível anterior ao alvo.
+    """
+    rng = random.Random(semente)
+    personagem = CLASSES[classe]("Simulado")
+    personagem.rng = rng
+
+    niveis = nivel_alvo - 1
+    missoes_por_nivel = [0] * niveis
+    derrotas_por_nivel = [0] * niveis
+    # Unidades no inventário ao chegar em cada nível (nível 1: início)
+    itens_por_nivel = [0] * niveis
+    missoes = 0
+    while personagem.nivel < nivel_alvo and missoes < max_missoes:
+        nivel = personagem.nivel
+        missao = Missao.sortear(nivel, rng, fabrica)
+        resultado = missao.executar_combate(personagem, politica=politica, saida=None)
+        missoes += 1
+        missoes_por_nivel[nivel - 1] += 1
+        derrotas_por_nivel[nivel - 1] += not resultado["vitoria"]
+        # Uma missão pode render vários níveis de uma vez
+        for alcancado in range(nivel + 1, min(personagem.nivel, niveis) + 1):
+            itens_por_nivel[alcancado - 1] = len(personagem.inventario)
+
+    return {
+        "classe": classe,
+        "subclasse": personagem.sub_classe if subclasse else None,
+        "nivel": personagem.nivel,
+        "concluida": personagem.nivel >= nivel_alvo,
+        "missoes": missoes,
+        "missoes_por_nivel": missoes_por_nivel,
+        "derrotas_por_nivel": derrotas_por_nivel,
+        "itens_por_nivel": itens_por_nivel,
+        "itens": len(personagem.inventario),
+    }
+
+
+def _resposta_subclasse(classe, subclasse):
+    """Entrada que responde ao menu de sub-classe com a opção desejada."""
+    escolha = str(SUBCLASSES[classe].index(subclasse) + 1) if subclasse else "0"
+    return lambda mensagem="": escolha
+
+
+def _simular_lote(args):
+    """Executa um lote de campanhas (no processo atual ou em um do pool)."""
+    classe, subclasse, nivel_alvo, nome_politica, sementes, max_missoes = args
+    politica = POLITICAS[nome_politica]()
+    fabrica = FabricaInimigos()
+    # Sem mensagens e com o menu de sub-classe respondido automaticamente
+    saida_anterior = definir_saida("nula")
+    entrada_anterior = definir_entrada(_resposta_subclasse(classe, subclasse))
+    try:
+        return [
+            simular_campanha(classe, nivel_alvo, politica, semente, subclasse, fabrica, max_missoes)
+            for semente in sementes
+        ]
+    finally:
+        definir_entrada(entrada_anterior)
+        definir_saida(saida_anterior)
+
+
+def _lotes(classe, subclasse, nivel_alvo, politica, semente, quantidade, max_missoes):
+    """
+    Gera os lotes de campanhas sob demanda. As sementes são as mesmas de
+    simulacao.gerar_sementes, sem materializar a lista inteira.
+    """
+    rng = random.Random(semente)
+    restantes = quantidade
+    while restantes > 0:
+        tamanho = min(TAMANHO_LOTE, restantes)
+        restantes -= tamanho
+        sementes = [rng.getrandbits(64) for _ in range(tamanho)]
+        yield (classe, subclasse, nivel_alvo, politica, sementes, max_missoes)
+
+
+def simular_campanhas(quantidade, classe="Guerreiro", nivel_alvo=10, politica="pocao",
+                      semente=0, processos=None, subclasse=None, max_missoes=MAX_MISSOES):
+    """
+    Simula várias campanhas, entregando o resumo de cada uma assim que o
+    lote dela termina, na ordem das sementes.
+
+    Só alguns lotes ficam em andamento por vez: a memória usada não cresce
+    com o número de campanhas.
+
+    Args:
+        quantidade (int): Número de campanhas
+        classe (str): Nome da classe do personagem (ver simulacao.CLASSES)
+        nivel_alvo (int): Nível em que cada campanha termina
+        politica (str): Nome da política de ações (ver models.combate.POLITICAS)
+        semente (int): Semente mestra
+        processos (int, optional): Número de processos. Se None, usa todos os
+            núcleos; com 1, roda no processo atual.
+        subclasse (str, optional): Sub-classe escolhida no nível 4
+
+    Yields:
+        dict: Resumo de cada campanha (ver simular_campanha)
+    """
+    if classe not in CLASSES:
+        raise ValueError(f"classe inválida: {classe}")
+    if politica not in POLITICAS:
+        raise ValueError(f"política inválida: {politica}")
+    if subclasse and subclasse not in SUBCLASSES[classe]:
+        raise ValueError(f"sub-classe inválida para {classe}: {subclasse}")
+    if nivel_alvo < 2:
+        raise ValueError("o nível alvo deve ser pelo menos 2")
+
+    processos = processos or os.cpu_count() or 1
+    lotes = _lotes(classe, subclasse, nivel_alvo, politica, semente, quantidade, max_missoes)
+    if processos == 1:
+        for lote in lotes:
+            yield from _simular_lote(lote)
+        return
+
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        pendentes = deque()
+        for lote in lotes:
+            pendentes.append(executor.submit(_simular_lote, lote))
+            if len(pendentes) >= processos * 2:
+                yield from pendentes.popleft().result()
+        while pendentes:
+            yield from pendentes.popleft().result()
+
+
+class EstatisticasCampanha:
+    """
+    Agrega resumos de campanhas em contagens de tamanho fixo (por nível e
+    por faixa de níveis) e em um histograma de missões até o nível alvo.
+    """
+
+    def __init__(self, nivel_alvo, largura_faixa=5):
+        """
+        Args:
+            nivel_alvo (int): Nível alvo das campanhas
+            largura_faixa (int): Quantos níveis cada faixa de derrotas agrupa
+        """
+        niveis = nivel_alvo - 1
+        self.nivel_alvo = nivel_alvo
+        self.largura_faixa = largura_faixa
+        self.campanhas = 0
+        self.concluidas = 0
+        # Missões até o nível alvo -> número de campanhas concluídas
+        self.histograma = {}
+        self.missoes_por_nivel = [0] * niveis
+        self.derrotas_por_nivel = [0] * niveis
+        self.itens_por_nivel = [0] * niveis
+        # Campanhas que chegaram a cada nível (para as médias de itens)
+        self.alcancaram = [0] * niveis
+
+    def adicionar(self, campanha):
+        """Soma o resumo de uma campanha (ver simular_campanha)."""
+        self.campanhas += 1
+        if campanha["concluida"]:
+            self.concluidas += 1
+            self.histograma[campanha["missoes"]] = self.histograma.get(campanha["missoes"], 0) + 1
+        for indice in range(len(self.missoes_por_nivel)):
+            self.missoes_por_nivel[indice] += campanha["missoes_por_nivel"][indice]
+            self.derrotas_por_nivel[indice] += campanha["derrotas_por_nivel"][indice]
+            if indice < campanha["nivel"]:
+                self.alcancaram[indice] += 1
+                self.itens_por_nivel[indice] += campanha["itens_por_nivel"][indice]
+
+    def _percentil(self, fracao):
+        """Percentil das missões até o nível alvo, pelo histograma."""
+        limite = fracao * self.concluidas
+        acumulado = 0
+        for missoes in sorted(self.histograma):
+            acumulado += self.histograma[missoes]
+            if acumulado >= limite:
+                return missoes
+        return None
+
+    def relatorio(self):
+        """
+        Returns:
+            dict: Distribuição de missões até o nível alvo, taxa de derrota
+            por faixa de níveis e crescimento do inventário por nível
+        """
+        total = sum(missoes * campanhas for missoes, campanhas in self.histograma.items())
+        distribuicao = {
+            "media": total / self.concluidas if self.concluidas else None,
+            "p10": self._percentil(0.10),
+            "p50": self._percentil(0.50),
+            "p90": self._percentil(0.90),
+            "max": max(self.histograma) if self.histograma else None,
+        }
+
+        faixas = {}
+        for indice, missoes in enumerate(self.missoes_por_nivel):
+            inicio = indice // self.largura_faixa * self.largura_faixa + 1
+            fim = min(inicio + self.largura_faixa - 1, len(self.missoes_por_nivel))
+            faixa = faixas.setdefault(f"{inicio}-{fim}", {"missoes": 0, "derrotas": 0})
+            faixa["missoes"] += missoes
+            faixa["derrotas"] += self.derrotas_por_nivel[indice]
+        for faixa in faixas.values():
+            faixa["taxa_derrota"] = faixa["derrotas"] / faixa["missoes"] if faixa["missoes"] else 0.0
+
+        return {
+            "campanhas": self.campanhas,
+            "concluidas": self.concluidas,
+            "missoes_ate_nivel": distribuicao,
+            "missoes_por_nivel": {
+                str(indice + 1): missoes / self.alcancaram[indice]
+                for indice, missoes in enumerate(self.missoes_por_nivel) if self.alcancaram[indice]
+            },
+            "derrotas_por_faixa": faixas,
+            "itens_por_nivel": {
+                str(indice + 1): itens / self.alcancaram[indice]
+                for indice, itens in enumerate(self.itens_por_nivel) if self.alcancaram[indice]
+            },
+        }
+
+
+def main():
+    """Ponto de entrada de linha de comando."""
+    parser = argparse.ArgumentParser(description="Simulação de campanhas do nível 1 ao nível alvo")
+    parser.add_argument("--campanhas", type=int, default=1000, help="campanhas por classe/sub-classe")
+    parser.add_argument("--nivel", type=int, default=10, help="nível alvo")
+    parser.add_argument("--classe", nargs="+", default=sorted(CLASSES), choices=sorted(CLASSES))
+    parser.add_argument("--subclasse", default=None,
+                        help="sub-classe escolhida no nível 4 (ex.: Caçador) ou 'todas'")
+    parser.add_argument("--politica", default="pocao", choices=sorted(POLITICAS))
+    parser.add_argument("--faixa", type=int, default=5, help="largura das faixas de nível")
+    parser.add_argument("--semente", type=int, default=0, help="semente mestra")
+    parser.add_argument("--processos", type=int, default=None, help="padrão: todos os núcleos")
+    parser.add_argument("--registros", metavar="ARQUIVO",
+                        help="grava o resumo de cada campanha em JSON Lines, à medida que terminam")
+    args = parser.parse_args()
+
+    configuracoes = []
+    for classe in args.classe:
+        if args.subclasse == "todas":
+            configuracoes.extend((classe, subclasse) for subclasse in SUBCLASSES[classe])
+        else:
+            configuracoes.append((classe, args.subclasse))
+
+    registros = open(args.registros, 'w', encoding='utf-8') if args.registros else None
+    relatorios = []
+    try:
+        for classe, subclasse in configuracoes:
+            estatisticas = EstatisticasCampanha(args.nivel, args.faixa)
+            for campanha in simular_campanhas(args.campanhas, classe, args.nivel, args.politica,
+                                              args.semente, args.processos, subclasse):
+                estatisticas.adicionar(campanha)
+                if registros:
+                    registros.write(json.dumps(campanha, ensure_ascii=False) + "\n")
+            relatorios.append({"classe": classe, "subclasse": subclasse, "nivel_alvo": args.nivel,
+                               **estatisticas.relatorio()})
+    finally:
+        if registros:
+            registros.close()
+    print(json.dumps(relatorios, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@ import random
 import time
 from typing import Optional, Tuple
 
+from utils.saida import exibir
+
 
 def is_critico(chance: float, rng: Optional[random.Random] = None) -> bool:
     """
@@ -56,7 +58,7 @@ def calcular_critico(
     - `rng`: objeto `random.Random` para testes determinísticos.
     - `animacao`: se True, mostra uma pequena animação em caso de crítico.
     - `anim_speed`: velocidade da animação (segundos por frame).
-    - `verbose`: se True, exibe mensagens informativas no console.
+    - `verbose`: se True, exibe mensagens informativas (ver utils.saida).
 
     Retorna uma tupla `(dano_final, foi_critico)`.
     """
@@ -69,13 +71,19 @@ def calcular_critico(
 
     crit = is_critico(chance, rng=rng)
 
+    # Com a saída nula (utils.saida) não há mensagens nem animação
+    verbose = verbose and bool(exibir)
+    animacao = animacao and bool(exibir)
+
     if not crit:
         if verbose:
-            print(f"Dano: {dano_base} (não crítico)")
+            exibir(f"Dano: {dano_base} (não crítico)")
         return dano_base, False
 
     # crítico
     if animacao:
+        # A animação escreve direto no terminal: mensagens pendentes vão antes
+        exibir.descarregar()
         _animacao_critico(speed=anim_speed)
 
     if mode == "multiply":
@@ -84,12 +92,99 @@ def calcular_critico(
         dano_final = dano_base + int(multiplicador)
 
     if verbose:
-        print(f"\n🔥 ATAQUE CRÍTICO! 🔥")
-        print(f"💥 Dano amplificado de {dano_base} → {dano_final}!")
+        exibir(f"\n🔥 ATAQUE CRÍTICO! 🔥")
+        exibir(f"💥 Dano amplificado de {dano_base} → {dano_final}!")
 
     return dano_final, True
 
 
+def _importar_numpy():
+    """
+    Importa o NumPy sob demanda. O modo em lote é opcional: o restante do
+    jogo funciona sem o NumPy instalado.
+    """
+
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("o modo em lote requer o NumPy (pip install numpy)") from e
+    return np
+
+
+def is_critico_lote(chance, tamanho: Optional[int] = None, rng=None):
+    """
+    Versão vetorizada de `is_critico`: sorteia vários críticos de uma vez.
+
+    - `chance` pode ser um escalar ou um array com a chance de cada golpe.
+    - `tamanho` é o número de sorteios quando `chance` é escalar.
+    - `rng` pode ser um `numpy.random.Generator` para testes determinísticos.
+
+    Retorna um array booleano com `True` onde houve crítico.
+    """
+
+    np = _importar_numpy()
+    chance = np.asarray(chance, dtype=np.float64)
+
+    if chance.size and (chance.min() < 0.0 or chance.max() > 1.0):
+        raise ValueError("chance deve estar entre 0.0 e 1.0")
+
+    rng = rng if rng is not None else np.random.default_rng()
+    forma = chance.shape if tamanho is None else np.broadcast_shapes(chance.shape, (tamanho,))
+    # Mesmo critério da versão escalar: random() <= chance
+    return rng.random(forma) <= chance
+
+
+def calcular_critico_lote(
+    dano_base,
+    chance=0.20,
+    multiplicador=1.8,
+    mode: str = "multiply",
+    rng=None,
+):
+    """
+    Versão vetorizada de `calcular_critico` para avaliar milhões de golpes.
+
+    Parâmetros:
+    - `dano_base`: array de danos antes de crit (>= 0). Danos inteiros
+      produzem um array de inteiros; danos fracionários são mantidos como
+      na versão escalar (só o dano crítico é truncado).
+    - `chance`: escalar ou array com a probabilidade de crítico de cada golpe.
+    - `multiplicador`: escalar ou array; mesmo significado da versão escalar.
+    - `mode`: "multiply" ou "add".
+    - `rng`: `numpy.random.Generator` para testes determinísticos.
+
+    Não há animação nem mensagens. Retorna uma tupla
+    `(danos_finais, foram_criticos)` de arrays com o formato de `dano_base`.
+    """
+
+    np = _importar_numpy()
+    dano_base = np.asarray(dano_base)
+    if dano_base.dtype.kind in "biu":
+        dano_base = dano_base.astype(np.int64)
+    elif dano_base.dtype.kind == "f":
+        dano_base = dano_base.astype(np.float64)
+    else:
+        raise ValueError("dano_base deve ser numérico")
+
+    if dano_base.size and dano_base.min() < 0:
+        raise ValueError("dano_base deve ser >= 0")
+
+    if mode not in ("multiply", "add"):
+        raise ValueError("mode deve ser 'multiply' ou 'add'")
+
+    crit = is_critico_lote(np.broadcast_to(chance, dano_base.shape), rng=rng)
+    multiplicador = np.asarray(multiplicador, dtype=np.float64)
+
+    # trunc arredonda em direção a zero, como int() na versão escalar
+    if mode == "multiply":
+        dano_critico = np.trunc(dano_base * multiplicador)
+    else:  # add
+        dano_critico = dano_base + np.trunc(multiplicador)
+    dano_critico = dano_critico.astype(dano_base.dtype)
+
+    return np.where(crit, dano_critico, dano_base), crit
+
+
 if __name__ == "__main__":
     # Demo rápido quando executado diretamente
     print("Demo: calcular_critico")
@@ -3,53 +3,177 @@ Módulo que implementa o sistema de logging do jogo.
 Registra eventos importantes em um arquivo .log
 """
 
+import atexit
 import os
-from datetime import datetime
+import queue
+import threading
+import time
+
+
+def _agora():
+    """Data e hora atuais no formato do log (sem importar datetime)."""
+    return time.strftime('%Y-%m-%d %H:%M:%S')
 
 
 class Logger:
     """
     Classe responsável por registrar eventos do jogo em arquivo de log.
+
+    No modo com buffer (`buffer=True`) as mensagens vão para uma fila e uma
+    thread em segundo plano as grava em lotes, abrindo o arquivo uma vez por
+    lote em vez de uma vez por mensagem.
+
+    Nada é feito no disco ao criar o logger: o arquivo é criado na primeira
+    gravação e a thread de escrita é iniciada no primeiro registro.
+
+    Pode ser compartilhado entre threads (ex.: as sessões do servidor): o
+    início e o encerramento da thread de escrita e a entrega à fila são
+    protegidos por uma trava.
     """
-    
-    def __init__(self, arquivo_log="jogo.log"):
+
+    # Marcador que encerra a thread de escrita
+    _FIM = object()
+
+    def __init__(self, arquivo_log="jogo.log", buffer=False, tamanho_lote=100, intervalo=1.0):
         """
         Inicializa o logger.
-        
+
         Args:
-            arquivo_log (str): Nome do arquivo de log
+            arquivo_log (str): Nome do arquivo de log (None desativa o log)
+            buffer (bool): Se True, grava em segundo plano, em lotes
+            tamanho_lote (int): Número de mensagens que força a gravação do lote
+            intervalo (float): Tempo máximo (segundos) que uma mensagem espera na fila
         """
         self.arquivo_log = arquivo_log
-        self._criar_arquivo_se_nao_existir()
-    
+        self.buffer = buffer
+        self.tamanho_lote = tamanho_lote
+        self.intervalo = intervalo
+        self._fila = None
+        self._thread = None
+        self._arquivo_criado = False
+        self._fechado = False
+        self._trava = threading.Lock()
+
+    def _iniciar_escritor(self):
+        """Inicia a thread de escrita do modo com buffer (com a trava obtida)."""
+        self._fila = queue.Queue()
+        self._thread = threading.Thread(target=self._escritor, name="Logger", daemon=True)
+        self._thread.start()
+        # Garante a gravação do que estiver na fila mesmo se o jogo encerrar por erro
+        atexit.register(self.fechar)
+
     def _criar_arquivo_se_nao_existir(self):
         """Cria o arquivo de log se ele não existir."""
         if not os.path.exists(self.arquivo_log):
             with open(self.arquivo_log, 'w', encoding='utf-8') as f:
                 f.write(f"=== Log do Jogo RPG ===\n")
-                f.write(f"Iniciado em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                f.write(f"Iniciado em: {_agora()}\n")
                 f.write("=" * 50 + "\n\n")
-    
+        self._arquivo_criado = True
+
     def registrar(self, mensagem):
         """
         Registra uma mensagem no arquivo de log.
-        
+
         Args:
             mensagem (str): Mensagem a ser registrada
         """
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        log_entry = f"[{timestamp}] {mensagem}\n"
-        
+        if self.arquivo_log is None:
+            return
+        log_entry = f"[{_agora()}] {mensagem}\n"
+
+        if self.buffer:
+            with self._trava:
+                if self._fila is None and not self._fechado:
+                    self._iniciar_escritor()
+                if self._fila is not None:
+                    self._fila.put(log_entry)
+                    return
+
+        self._gravar(log_entry)
+
+    def _gravar(self, texto):
+        """Acrescenta um texto ao arquivo de log."""
         try:
+            if not self._arquivo_criado:
+                self._criar_arquivo_se_nao_existir()
             with open(self.arquivo_log, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
+                f.write(texto)
         except Exception as e:
             print(f"Erro ao escrever no log: {e}")
-    
+
+    def _escritor(self):
+        """
+        Loop da thread de escrita: acumula mensagens e grava o lote quando ele
+        atinge `tamanho_lote`, quando passa `intervalo` segundos ou ao fechar.
+        """
+        lote = []
+        limite = None
+        while True:
+            espera = None if limite is None else max(0.0, limite - time.monotonic())
+            try:
+                entrada = self._fila.get(timeout=espera)
+            except queue.Empty:
+                entrada = None
+
+            fim = entrada is self._FIM
+            if isinstance(entrada, threading.Event):
+                # Pedido de descarga síncrona (ver descarregar)
+                if lote:
+                    self._gravar("".join(lote))
+                lote = []
+                limite = None
+                entrada.set()
+                continue
+            if isinstance(entrada, str):
+                if not lote:
+                    limite = time.monotonic() + self.intervalo
+                lote.append(entrada)
+
+            if lote and (fim or len(lote) >= self.tamanho_lote or time.monotonic() >= limite):
+                self._gravar("".join(lote))
+                lote = []
+                limite = None
+            if fim:
+                return
+
+    def descarregar(self):
+        """Grava imediatamente as mensagens pendentes (modo com buffer)."""
+        concluido = threading.Event()
+        with self._trava:
+            if self._thread is None or not self._thread.is_alive():
+                return
+            # Entregue antes de um eventual fechar(): o escritor ainda o atende
+            self._fila.put(concluido)
+        concluido.wait()
+
+    def fechar(self):
+        """
+        Grava as mensagens pendentes e encerra a thread de escrita.
+        Pode ser chamado mais de uma vez; no modo direto não faz nada.
+        Depois de fechado, o logger grava cada mensagem diretamente.
+        """
+        # Com a trava obtida até o fim: mensagens registradas enquanto isso
+        # esperam e depois são gravadas diretamente, na ordem
+        with self._trava:
+            self._fechado = True
+            if self._thread is None:
+                return
+            thread = self._thread
+            self._thread = None
+            if thread.is_alive():
+                self._fila.put(self._FIM)
+                thread.join()
+            self._fila = None
+        atexit.unregister(self.fechar)
+
     def limpar_log(self):
         """Limpa o arquivo de log."""
+        if self.arquivo_log is None:
+            return
+        self.descarregar()
         with open(self.arquivo_log, 'w', encoding='utf-8') as f:
             f.write(f"=== Log do Jogo RPG ===\n")
-            f.write(f"Log limpo em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"Log limpo em: {_agora()}\n")
             f.write("=" * 50 + "\n\n")
-
+        self._arquivo_criado = True
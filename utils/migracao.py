@@ -0,0 +1,318 @@
+"""
+Módulo que migra saves de versões antigas do esquema para a atual.
+
+Todo save traz o campo "versao" (ver models.personagem.VERSAO_SAVE); os
+gravados antes dele existir são da versão 1. migrar() aplica em sequência
+as funções registradas em MIGRACOES (cada uma converte a versão N na
+N + 1) até chegar à versão atual, e só então o carregamento lê os campos,
+sem valores padrão espalhados pelo código.
+
+O migrador em lote converte uma pasta de saves JSON (Repositorio) ou um
+banco SQLite (RepositorioSQLite): os saves são lidos em lotes sob demanda
+e convertidos em vários processos, com poucos lotes em andamento por vez,
+então a memória usada não cresce com o número de saves.
+
+Uso:
+    python -m utils.migracao saves/
+    python -m utils.migracao saves/ --destino saves_v2/ --processos 8
+    python -m utils.migracao saves.db
+"""
+
+import argparse
+import json
+import os
+from collections import deque
+from itertools import islice
+
+from models.classes import Guerreiro, Mago, Arqueiro
+from models.inventario import Inventario
+from models.personagem import Personagem, VERSAO_SAVE, custo_nivel
+
+
+# Saves por lote enviado a um processo
+TAMANHO_LOTE = 256
+# Erros listados no resumo do migrador em lote (os demais só são contados)
+MAX_ERROS_LISTADOS = 20
+
+_CLASSES = {"Guerreiro": Guerreiro, "Mago": Mago, "Arqueiro": Arqueiro}
+
+
+def _v1_para_v2(dados):
+    """
+    Saves sem versão: completa os campos ausentes com os valores iniciais
+    da classe e converte o inventário antigo (lista de nomes).
+    """
+    classe = dados.get("classe", "Guerreiro")
+    if classe in _CLASSES:
+        inicial = _CLASSES[classe](dados["nome"])
+    else:
+        inicial = Personagem(dados["nome"], classe)
+    hp_maximo = dados.get("hp_maximo", inicial.hp_maximo)
+    nivel = dados.get("nivel", 1)
+    return {
+        "versao": 2,
+        "nome": dados["nome"],
+        "classe": classe,
+        "sub_classe": dados.get("sub_classe", inicial.sub_classe),
+        # Garante que o HP atual não exceda o máximo (caso o save esteja inconsistente)
+        "hp": min(dados.get("hp", inicial.hp), hp_maximo),
+        "hp_maximo": hp_maximo,
+        "nivel": nivel,
+        "xp": dados.get("xp", 0),
+        "xp_proximo_nivel": dados.get("xp_proximo_nivel", custo_nivel(nivel)),
+        "inventario": Inventario.from_dict(dados.get("inventario", [])).to_dict(),
+        "mana": dados.get("mana", inicial.mana_maxima),
+        "mana_maxima": dados.get("mana_maxima", inicial.mana_maxima),
+        "dano_base": dados.get("dano_base", inicial.dano_base),
+        "defesa": dados.get("defesa", inicial.defesa),
+        "crit_chance": dados.get("crit_chance", inicial.crit_chance),
+        "stun_chance": dados.get("stun_chance", inicial.stun_chance),
+        "dot_sangramento": dados.get("dot_sangramento", inicial.dot_sangramento),
+        "buff_dano": dados.get("buff_dano", inicial.buff_dano),
+        "chance_queimadura": dados.get("chance_queimadura", inicial.chance_queimadura),
+        "cura_base": dados.get("cura_base", inicial.cura_base),
+    }
+
+
+# Versão de origem -> função que converte os dados para a versão seguinte
+MIGRACOES = {
+    1: _v1_para_v2,
+}
+
+
+def versao_dos_dados(dados):
+    """Versão do esquema de um save (1 se não tiver o campo "versao")."""
+    return dados.get("versao", 1)
+
+
+def migrar(dados):
+    """
+    Converte os dados de um save para a versão atual do esquema.
+
+    Args:
+        dados (dict): Save em qualquer versão conhecida
+
+    Returns:
+        dict: Dados no formato atual de Personagem.to_dict (o próprio
+        dicionário recebido, se já estiver na versão atual)
+
+    Raises:
+        ValueError: Se a versão é mais nova que a atual ou não há migração
+            a partir dela
+    """
+    versao = versao_dos_dados(dados)
+    if versao > VERSAO_SAVE:
+        raise ValueError(f"save da versão {versao}, mais nova que a suportada ({VERSAO_SAVE})")
+    while versao < VERSAO_SAVE:
+        if versao not in MIGRACOES:
+            raise ValueError(f"não há migração a partir da versão {versao} do save")
+        dados = MIGRACOES[versao](dados)
+        versao += 1
+    return dados
+
+
+def _lotes(itens, tamanho=TAMANHO_LOTE):
+    """Agrupa um iterável em listas de até `tamanho` itens, sob demanda."""
+    itens = iter(itens)
+    while lote := list(islice(itens, tamanho)):
+        yield lote
+
+
+def _executar(funcao, lotes, processos):
+    """
+    Aplica `funcao` a cada lote, entregando os resultados na ordem dos
+    lotes. Com vários processos, só 2 lotes por processo ficam em andamento.
+    """
+    if processos == 1:
+        yield from map(funcao, lotes)
+        return
+
+    # Importado aqui: carregar um save não paga pelo pool de processos
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        pendentes = deque()
+        for lote in lotes:
+            pendentes.append(executor.submit(funcao, lote))
+            if len(pendentes) >= processos * 2:
+                yield pendentes.popleft().result()
+        while pendentes:
+            yield pendentes.popleft().result()
+
+
+def _resumo_vazio():
+    return {"migrados": 0, "atuais": 0, "falhas": 0, "erros": []}
+
+
+def _mesclar(total, parcial):
+    """Soma o resumo de um lote ao total (só os primeiros erros são listados)."""
+    for campo in ("migrados", "atuais", "falhas"):
+        total[campo] += parcial[campo]
+    total["erros"].extend(parcial["erros"][:MAX_ERROS_LISTADOS - len(total["erros"])])
+
+
+def _gravar_json(caminho, dados):
+    """Grava o save completo sem nunca deixar o arquivo pela metade."""
+    temporario = caminho + ".tmp"
+    with open(temporario, 'w', encoding='utf-8') as f:
+        json.dump(dados, f, indent=2, ensure_ascii=False)
+    os.replace(temporario, caminho)
+
+
+def _migrar_arquivos(args):
+    """Migra um lote de saves JSON (no processo atual ou em um do pool)."""
+    pasta, destino, nomes = args
+    resumo = _resumo_vazio()
+    for nome in nomes:
+        caminho = os.path.join(pasta, nome)
+        try:
+            with open(caminho, 'r', encoding='utf-8') as f:
+                dados = json.load(f)
+            # Os deltas estão na versão do save completo: aplicados antes da migração
+            arquivo_deltas = caminho + ".delta"
+            tem_deltas = os.path.exists(arquivo_deltas)
+            if tem_deltas:
+                with open(arquivo_deltas, 'r', encoding='utf-8') as f:
+                    for linha in f:
+                        if linha.strip():
+                            dados.update(json.loads(linha))
+
+            atual = versao_dos_dados(dados) == VERSAO_SAVE
+            if atual and not tem_deltas and destino is None:
+                resumo["atuais"] += 1
+                continue
+            _gravar_json(os.path.join(destino or pasta, nome), migrar(dados))
+            if tem_deltas and destino is None:
+                os.remove(arquivo_deltas)
+            resumo["atuais" if atual else "migrados"] += 1
+        except Exception as e:
+            resumo["falhas"] += 1
+            if len(resumo["erros"]) < MAX_ERROS_LISTADOS:
+                resumo["erros"].append(f"{nome}: {e}")
+    return resumo
+
+
+def migrar_pasta(pasta, destino=None, processos=None):
+    """
+    Migra todos os saves JSON de uma pasta para a versão atual. Os deltas
+    de cada save (ver Repositorio) são incorporados ao save completo.
+
+    Args:
+        pasta (str): Pasta com os saves (*.json)
+        destino (str, optional): Pasta onde gravar os saves migrados (todos,
+            inclusive os já atuais). Se None, migra no lugar e remove os deltas.
+        processos (int, optional): Número de processos. Se None, usa todos os
+            núcleos; com 1, roda no processo atual.
+
+    Returns:
+        dict: Saves migrados, já atuais, falhas e os primeiros erros
+    """
+    if destino is not None:
+        os.makedirs(destino, exist_ok=True)
+
+    def nomes():
+        with os.scandir(pasta) as entradas:
+            for entrada in entradas:
+                if entrada.name.endswith(".json") and entrada.is_file():
+                    yield entrada.name
+
+    processos = processos or os.cpu_count() or 1
+    lotes = ((pasta, destino, lote) for lote in _lotes(nomes()))
+    total = _resumo_vazio()
+    for parcial in _executar(_migrar_arquivos, lotes, processos):
+        _mesclar(total, parcial)
+    return total
+
+
+def _migrar_linhas(linhas):
+    """
+    Migra um lote de linhas (nome, dados) do banco SQLite.
+
+    Returns:
+        tuple: Resumo do lote e parâmetros do UPDATE das linhas migradas
+    """
+    resumo = _resumo_vazio()
+    alteradas = []
+    for nome, texto in linhas:
+        try:
+            dados = json.loads(texto)
+            if versao_dos_dados(dados) == VERSAO_SAVE:
+                resumo["atuais"] += 1
+                continue
+            dados = migrar(dados)
+            texto = json.dumps(dados, ensure_ascii=False, separators=(",", ":"))
+            alteradas.append((dados["classe"], dados["nivel"], texto, nome))
+            resumo["migrados"] += 1
+        except Exception as e:
+            resumo["falhas"] += 1
+            if len(resumo["erros"]) < MAX_ERROS_LISTADOS:
+                resumo["erros"].append(f"{nome}: {e}")
+    return resumo, alteradas
+
+
+def migrar_banco(arquivo_banco, processos=None):
+    """
+    Migra os personagens de um banco de RepositorioSQLite para a versão
+    atual. A ordem de "último salvo" (salvo_em) é preservada.
+
+    Args:
+        arquivo_banco (str): Caminho do arquivo SQLite
+        processos (int, optional): Número de processos. Se None, usa todos os
+            núcleos; com 1, roda no processo atual.
+
+    Returns:
+        dict: Personagens migrados, já atuais, falhas e os primeiros erros
+    """
+    # Importado aqui: quem usa só o save em JSON não paga pelo sqlite3
+    import sqlite3
+
+    if not os.path.exists(arquivo_banco):
+        raise ValueError(f"banco não encontrado: {arquivo_banco}")
+    conexao = sqlite3.connect(arquivo_banco)
+
+    def paginas():
+        # Paginação pelo nome (chave primária): cada página é uma consulta
+        # curta, intercalada com as gravações dos lotes já migrados
+        ultimo = ""
+        while True:
+            linhas = conexao.execute(
+                "SELECT nome, dados FROM personagens WHERE nome > ? ORDER BY nome LIMIT ?",
+                (ultimo, TAMANHO_LOTE),
+            ).fetchall()
+            if not linhas:
+                return
+            ultimo = linhas[-1][0]
+            yield linhas
+
+    processos = processos or os.cpu_count() or 1
+    total = _resumo_vazio()
+    try:
+        for parcial, alteradas in _executar(_migrar_linhas, paginas(), processos):
+            with conexao:
+                conexao.executemany(
+                    "UPDATE personagens SET classe = ?, nivel = ?, dados = ? WHERE nome = ?", alteradas
+                )
+            _mesclar(total, parcial)
+    finally:
+        conexao.close()
+    return total
+
+
+def main():
+    """Ponto de entrada de linha de comando."""
+    parser = argparse.ArgumentParser(description="Migração de saves para a versão atual do esquema")
+    parser.add_argument("alvo", help="pasta de saves JSON ou banco SQLite")
+    parser.add_argument("--destino", default=None,
+                        help="pasta onde gravar os saves migrados (padrão: migra no lugar)")
+    parser.add_argument("--processos", type=int, default=None, help="padrão: todos os núcleos")
+    args = parser.parse_args()
+
+    if os.path.isdir(args.alvo):
+        resumo = migrar_pasta(args.alvo, args.destino, args.processos)
+    else:
+        resumo = migrar_banco(args.alvo, args.processos)
+    print(json.dumps({"versao": VERSAO_SAVE, **resumo}, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
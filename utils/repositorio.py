@@ -1,28 +1,66 @@
 """
 Módulo que implementa o sistema de persistência de dados.
-Salva e carrega o progresso do jogo em arquivos JSON.
+Salva e carrega o progresso do jogo em arquivos JSON ou em um banco SQLite.
 """
 
 import json
 import os
-from models.personagem import Personagem
-from models.inventario import Item
+from models.personagem import Personagem, VERSAO_SAVE
 from models.classes import Guerreiro, Mago, Arqueiro
+from utils.migracao import migrar, versao_dos_dados
+
+
+_CLASSES = {"Guerreiro": Guerreiro, "Mago": Mago, "Arqueiro": Arqueiro}
+
+
+def personagem_de_dados(dados):
+    """
+    Reconstrói um personagem a partir do dicionário salvo (ver Personagem.to_dict).
+    
+    Args:
+        dados (dict): Dados do personagem, em qualquer versão do esquema
+            (saves antigos são migrados antes, ver utils/migracao.py)
+        
+    Returns:
+        Personagem: Instância da classe correspondente com os atributos restaurados
+        
+    Raises:
+        ValueError: Se a versão do save não é suportada
+    """
+    dados = migrar(dados)
+    # Classe do personagem; outras classes usam o Personagem genérico
+    return _CLASSES.get(dados["classe"], Personagem).from_dict(dados)
 
 
 class Repositorio:
     """
     Classe responsável por salvar e carregar dados do jogo em formato JSON.
+    
+    O save completo traz a versão do esquema (campo "versao"); saves de
+    versões antigas são migrados ao carregar e regravados na versão atual
+    no salvamento seguinte.
+    
+    Depois do primeiro salvamento completo, os saves seguintes do mesmo
+    personagem gravam apenas os campos alterados (uma linha JSON por save)
+    em um arquivo de deltas ao lado do save. A cada `compactar_a_cada`
+    deltas o save completo é regravado e os deltas são descartados.
     """
     
-    def __init__(self, arquivo_save="save.json"):
+    def __init__(self, arquivo_save="save.json", compactar_a_cada=50):
         """
         Inicializa o repositório.
         
         Args:
             arquivo_save (str): Nome do arquivo de save
+            compactar_a_cada (int): Número de deltas acumulados que força a
+                regravação do save completo
         """
         self.arquivo_save = arquivo_save
+        self.arquivo_deltas = arquivo_save + ".delta"
+        self.compactar_a_cada = compactar_a_cada
+        # Personagem cujo estado está no arquivo (só ele pode gravar deltas)
+        self._personagem = None
+        self._num_deltas = 0
     
     def salvar(self, personagem):
         """
@@ -35,16 +73,50 @@ class Repositorio:
             bool: True se salvou com sucesso, False caso contrário
         """
         try:
-            dados = personagem.to_dict()
+            # Deltas só valem sobre um save deste mesmo personagem feito por este repositório
+            if (personagem is not self._personagem or personagem._salvo_em is not self
+                    or not os.path.exists(self.arquivo_save)):
+                return self._salvar_completo(personagem)
             
-            with open(self.arquivo_save, 'w', encoding='utf-8') as f:
-                json.dump(dados, f, indent=2, ensure_ascii=False)
+            delta = personagem.alteracoes()
+            if not delta:
+                return True
+            if self._num_deltas + 1 >= self.compactar_a_cada:
+                return self._salvar_completo(personagem)
             
+            with open(self.arquivo_deltas, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(delta, ensure_ascii=False, separators=(",", ":")) + "\n")
+            self._num_deltas += 1
+            personagem.marcar_salvo(delta, origem=self)
             return True
         except Exception as e:
             print(f"Erro ao salvar o jogo: {e}")
             return False
     
+    def _salvar_completo(self, personagem):
+        """
+        Grava o estado completo do personagem e descarta os deltas.
+        
+        Returns:
+            bool: True se salvou com sucesso
+        """
+        dados = personagem.to_dict()
+        
+        # Grava em arquivo temporário e substitui, para nunca deixar o save pela metade
+        temporario = self.arquivo_save + ".tmp"
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(dados, f, indent=2, ensure_ascii=False)
+        os.replace(temporario, self.arquivo_save)
+        # Os deltas já estão no save completo; se o processo parar aqui,
+        # reaplicá-los sobre ele produz o mesmo estado
+        if os.path.exists(self.arquivo_deltas):
+            os.remove(self.arquivo_deltas)
+        
+        self._personagem = personagem
+        self._num_deltas = 0
+        personagem.marcar_salvo(dados, origem=self)
+        return True
+    
     def carregar(self):
         """
         Carrega o estado do personagem de um arquivo JSON.
@@ -59,43 +131,20 @@ class Repositorio:
             with open(self.arquivo_save, 'r', encoding='utf-8') as f:
                 dados = json.load(f)
             
-            # Cria o personagem baseado na classe
-            classe = dados.get("classe", "Guerreiro")
-            
-            if classe == "Guerreiro":
-                personagem = Guerreiro(dados["nome"])
-            elif classe == "Mago":
-                personagem = Mago(dados["nome"])
-            elif classe == "Arqueiro":
-                personagem = Arqueiro(dados["nome"])
-            else:
-                # Fallback para Personagem genérico
-                personagem = Personagem(dados["nome"], classe)
-            
-            # Restaura os atributos do dicionário
-            personagem.hp = dados.get("hp", personagem.hp)
-            personagem.hp_maximo = dados.get("hp_maximo", personagem.hp_maximo)
-            # Garante que o HP atual não exceda o máximo (caso o save esteja inconsistente)
-            if personagem.hp > personagem.hp_maximo:
-                personagem.hp = personagem.hp_maximo
-            personagem.nivel = dados.get("nivel", 1)
-            personagem.xp = dados.get("xp", 0)
-            personagem.xp_proximo_nivel = dados.get("xp_proximo_nivel", 100)
-            # Converte inventário salvo (lista de nomes) para objetos Item
-            personagem.inventario = [Item(nome, "") for nome in dados.get("inventario", [])]
-            personagem.mana = dados.get("mana", personagem.mana_maxima)
-            personagem.mana_maxima = dados.get("mana_maxima", personagem.mana_maxima)
-            personagem.dano_base = dados.get("dano_base", personagem.dano_base)
-            personagem.defesa = dados.get("defesa", personagem.defesa)
-            # Restaura sub-classe e atributos específicos de subclasses, se presentes
-            personagem.sub_classe = dados.get("sub_classe", personagem.sub_classe if hasattr(personagem, 'sub_classe') else None)
-            personagem.crit_chance = dados.get("crit_chance", getattr(personagem, 'crit_chance', 0.05))
-            personagem.stun_chance = dados.get("stun_chance", getattr(personagem, 'stun_chance', 0.0))
-            personagem.dot_sangramento = dados.get("dot_sangramento", getattr(personagem, 'dot_sangramento', 0.0))
-            personagem.buff_dano = dados.get("buff_dano", getattr(personagem, 'buff_dano', 1.0))
-            personagem.chance_queimadura = dados.get("chance_queimadura", getattr(personagem, 'chance_queimadura', 0.0))
-            personagem.cura_base = dados.get("cura_base", getattr(personagem, 'cura_base', 0))
+            # Reaplica os deltas gravados depois do último save completo
+            num_deltas = 0
+            if os.path.exists(self.arquivo_deltas):
+                with open(self.arquivo_deltas, 'r', encoding='utf-8') as f:
+                    for linha in f:
+                        if linha.strip():
+                            dados.update(json.loads(linha))
+                            num_deltas += 1
             
+            personagem = personagem_de_dados(dados)
+            personagem.marcar_salvo(origem=self)
+            # Save de versão antiga: o próximo save é completo, já na versão atual
+            self._personagem = personagem if versao_dos_dados(dados) == VERSAO_SAVE else None
+            self._num_deltas = num_deltas
             return personagem
         except Exception as e:
             print(f"Erro ao carregar o jogo: {e}")
@@ -110,3 +159,212 @@ class Repositorio:
         """
         return os.path.exists(self.arquivo_save)
 
+
+class RepositorioSQLite:
+    """
+    Repositório que guarda vários personagens em um único banco SQLite.
+    
+    Mantém a mesma interface de Repositorio (salvar/carregar/existe_save),
+    com o nome do personagem como chave, e acrescenta operações em lote
+    (salvar_varios/carregar_varios) executadas em uma única transação.
+    """
+    
+    _ESQUEMA = """
+        CREATE TABLE IF NOT EXISTS personagens (
+            nome TEXT PRIMARY KEY,
+            classe TEXT NOT NULL,
+            nivel INTEGER NOT NULL,
+            salvo_em INTEGER NOT NULL,
+            dados TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_personagens_classe ON personagens (classe, nivel);
+        CREATE INDEX IF NOT EXISTS idx_personagens_nivel ON personagens (nivel);
+        CREATE INDEX IF NOT EXISTS idx_personagens_salvo_em ON personagens (salvo_em);
+    """
+    
+    _UPSERT = """
+        INSERT INTO personagens (nome, classe, nivel, salvo_em, dados)
+        VALUES (?, ?, ?, (SELECT COALESCE(MAX(salvo_em), 0) + 1 FROM personagens), ?)
+        ON CONFLICT (nome) DO UPDATE SET
+            classe = excluded.classe,
+            nivel = excluded.nivel,
+            salvo_em = excluded.salvo_em,
+            dados = excluded.dados
+    """
+    
+    # Nomes por consulta em carregar_varios (o SQLite antigo aceita só 999 parâmetros)
+    MAX_NOMES_CONSULTA = 500
+    
+    def __init__(self, arquivo_banco="saves.db"):
+        """
+        Inicializa o repositório e cria as tabelas se necessário.
+        
+        Args:
+            arquivo_banco (str): Caminho do arquivo SQLite
+        """
+        # Importado aqui: quem usa só o save em JSON não paga pelo sqlite3
+        import sqlite3
+
+        self.arquivo_banco = arquivo_banco
+        self.conexao = sqlite3.connect(arquivo_banco)
+        with self.conexao:
+            self.conexao.executescript(self._ESQUEMA)
+    
+    @staticmethod
+    def _linha(personagem):
+        """Converte um personagem nos parâmetros do INSERT."""
+        dados = personagem.to_dict()
+        texto = json.dumps(dados, ensure_ascii=False, separators=(",", ":"))
+        return (dados["nome"], dados["classe"], dados["nivel"], texto)
+    
+    def salvar(self, personagem):
+        """
+        Salva (ou atualiza) um personagem no banco.
+        
+        Args:
+            personagem: Instância do personagem a ser salva
+            
+        Returns:
+            bool: True se salvou com sucesso, False caso contrário
+        """
+        return self.salvar_varios([personagem])
+    
+    def salvar_varios(self, personagens):
+        """
+        Salva vários personagens em uma única transação.
+        
+        Args:
+            personagens: Iterável de personagens
+            
+        Returns:
+            bool: True se salvou com sucesso, False caso contrário
+        """
+        try:
+            with self.conexao:
+                self.conexao.executemany(self._UPSERT, (self._linha(p) for p in personagens))
+            return True
+        except Exception as e:
+            print(f"Erro ao salvar o jogo: {e}")
+            return False
+    
+    def carregar(self, nome=None):
+        """
+        Carrega um personagem do banco.
+        
+        Args:
+            nome (str, optional): Nome do personagem. Se None, carrega o
+                último personagem salvo.
+            
+        Returns:
+            Personagem: Instância do personagem carregada, ou None se não
+            existir ou houver erro
+        """
+        try:
+            if nome is None:
+                linha = self.conexao.execute(
+                    "SELECT dados FROM personagens ORDER BY salvo_em DESC LIMIT 1"
+                ).fetchone()
+            else:
+                linha = self.conexao.execute(
+                    "SELECT dados FROM personagens WHERE nome = ?", (nome,)
+                ).fetchone()
+            if linha is None:
+                return None
+            return personagem_de_dados(json.loads(linha[0]))
+        except Exception as e:
+            print(f"Erro ao carregar o jogo: {e}")
+            return None
+    
+    def _filtros(self, nomes=None, classe=None, nivel_min=None, nivel_max=None):
+        """Monta a cláusula WHERE e os parâmetros das consultas em lote."""
+        condicoes = []
+        parametros = []
+        if nomes is not None:
+            nomes = list(nomes)
+            condicoes.append(f"nome IN ({', '.join('?' * len(nomes))})")
+            parametros.extend(nomes)
+        if classe is not None:
+            condicoes.append("classe = ?")
+            parametros.append(classe)
+        if nivel_min is not None:
+            condicoes.append("nivel >= ?")
+            parametros.append(nivel_min)
+        if nivel_max is not None:
+            condicoes.append("nivel <= ?")
+            parametros.append(nivel_max)
+        where = f" WHERE {' AND '.join(condicoes)}" if condicoes else ""
+        return where, parametros
+    
+    def carregar_varios(self, nomes=None, classe=None, nivel_min=None, nivel_max=None):
+        """
+        Carrega vários personagens de uma vez.
+        
+        Os nomes são consultados em blocos de `MAX_NOMES_CONSULTA` (o SQLite
+        limita o número de parâmetros por consulta), todos dentro da mesma
+        transação de leitura.
+        
+        Args:
+            nomes (list, optional): Nomes dos personagens
+            classe (str, optional): Filtra pela classe
+            nivel_min (int, optional): Nível mínimo
+            nivel_max (int, optional): Nível máximo
+            
+        Returns:
+            list: Personagens encontrados, ordenados por nome
+        """
+        if nomes is None:
+            blocos = [None]
+        else:
+            nomes = list(nomes)
+            blocos = [nomes[i:i + self.MAX_NOMES_CONSULTA]
+                      for i in range(0, len(nomes), self.MAX_NOMES_CONSULTA)] or [[]]
+        try:
+            linhas = []
+            # Uma única transação: todos os personagens vêm do mesmo estado do banco
+            self.conexao.execute("BEGIN")
+            try:
+                for bloco in blocos:
+                    where, parametros = self._filtros(bloco, classe, nivel_min, nivel_max)
+                    linhas.extend(self.conexao.execute(
+                        f"SELECT nome, dados FROM personagens{where}", parametros
+                    ))
+            finally:
+                self.conexao.execute("COMMIT")
+            linhas.sort()
+            return [personagem_de_dados(json.loads(dados)) for _, dados in linhas]
+        except Exception as e:
+            print(f"Erro ao carregar o jogo: {e}")
+            return []
+    
+    def listar(self, classe=None, nivel_min=None, nivel_max=None):
+        """
+        Lista os personagens salvos sem reconstruí-los (usa apenas os índices).
+        
+        Returns:
+            list: Tuplas (nome, classe, nivel) ordenadas por nome
+        """
+        where, parametros = self._filtros(None, classe, nivel_min, nivel_max)
+        return self.conexao.execute(
+            f"SELECT nome, classe, nivel FROM personagens{where} ORDER BY nome", parametros
+        ).fetchall()
+    
+    def existe_save(self, nome=None):
+        """
+        Verifica se existe um personagem salvo.
+        
+        Args:
+            nome (str, optional): Nome do personagem. Se None, verifica se
+                existe qualquer personagem.
+            
+        Returns:
+            bool: True se existe save, False caso contrário
+        """
+        if nome is None:
+            linha = self.conexao.execute("SELECT 1 FROM personagens LIMIT 1").fetchone()
+        else:
+            linha = self.conexao.execute("SELECT 1 FROM personagens WHERE nome = ?", (nome,)).fetchone()
+        return linha is not None
+    
+    def fechar(self):
+        """Fecha a conexão com o banco."""
+        self.conexao.close()
@@ -0,0 +1,162 @@
+"""
+Módulo que define para onde vão as mensagens do jogo.
+
+Há três saídas: console (escreve cada linha), buffer (acumula e escreve
+tudo de uma vez, uma vez por turno) e nula (descarta tudo). A saída é
+escolhida uma única vez, no início (ver definir_saida), e todas as
+camadas escrevem por meio de `exibir`, que encaminha para ela.
+
+A saída nula é falsa em contexto booleano: os trechos que testam
+`if saida:` antes de montar uma mensagem deixam de formatá-la.
+
+A saída e a fonte das entradas ficam em variáveis de contexto
+(contextvars): cada thread ou tarefa asyncio que as redefine tem as suas,
+o que permite várias sessões de jogo no mesmo processo (ver
+utils/servidor.py). Threads novas começam com a saída console e input().
+"""
+
+import sys
+from contextvars import ContextVar
+
+
+class SaidaConsole:
+    """Escreve cada mensagem imediatamente, como print()."""
+
+    def __init__(self, fluxo=None):
+        """
+        Args:
+            fluxo (optional): Arquivo de destino. Se None, usa o sys.stdout
+                atual a cada escrita.
+        """
+        self.fluxo = fluxo
+
+    def __call__(self, texto=""):
+        (self.fluxo or sys.stdout).write(f"{texto}\n")
+
+    def descarregar(self):
+        (self.fluxo or sys.stdout).flush()
+
+
+class SaidaBuffer:
+    """
+    Acumula as mensagens e escreve todas de uma vez em descarregar().
+    O combate descarrega ao fim de cada turno e ler() antes de cada entrada.
+    """
+
+    def __init__(self, fluxo=None):
+        """
+        Args:
+            fluxo (optional): Arquivo de destino. Se None, usa o sys.stdout atual.
+        """
+        self.fluxo = fluxo
+        self._linhas = []
+
+    def __call__(self, texto=""):
+        self._linhas.append(texto)
+
+    def descarregar(self):
+        if not self._linhas:
+            return
+        fluxo = self.fluxo or sys.stdout
+        fluxo.write("\n".join(map(str, self._linhas)) + "\n")
+        fluxo.flush()
+        self._linhas.clear()
+
+
+class SaidaNula:
+    """Descarta todas as mensagens."""
+
+    def __call__(self, texto=""):
+        pass
+
+    def __bool__(self):
+        return False
+
+    def descarregar(self):
+        pass
+
+
+# Saídas disponíveis por nome (usado pela linha de comando)
+SAIDAS = {
+    "console": SaidaConsole,
+    "buffer": SaidaBuffer,
+    "nula": SaidaNula,
+}
+
+_saida = ContextVar("saida", default=SaidaConsole())
+# Fonte das entradas do jogador (trocada pela gravação/reprodução de sessões
+# e pelo servidor)
+_entrada = ContextVar("entrada", default=input)
+
+
+def definir_saida(saida):
+    """
+    Define a saída usada pelo jogo (no contexto atual).
+
+    Args:
+        saida: Nome em SAIDAS ("console", "buffer", "nula") ou uma instância
+
+    Returns:
+        A saída anterior (já descarregada)
+    """
+    if isinstance(saida, str):
+        if saida not in SAIDAS:
+            raise ValueError(f"saída inválida: {saida}")
+        saida = SAIDAS[saida]()
+    anterior = _saida.get()
+    anterior.descarregar()
+    _saida.set(saida)
+    return anterior
+
+
+def obter_saida():
+    """Retorna a saída definida atualmente."""
+    return _saida.get()
+
+
+class _SaidaAtual:
+    """Encaminha as mensagens para a saída definida com definir_saida()."""
+
+    __slots__ = ()
+
+    def __call__(self, texto=""):
+        _saida.get()(texto)
+
+    def __bool__(self):
+        return bool(_saida.get())
+
+    def descarregar(self):
+        _saida.get().descarregar()
+
+
+# Ponto único de escrita usado por todas as camadas do jogo
+exibir = _SaidaAtual()
+
+
+def definir_entrada(funcao):
+    """
+    Define de onde vêm as entradas lidas por ler() (no contexto atual).
+
+    Args:
+        funcao: Função com a assinatura de input(mensagem)
+
+    Returns:
+        A função anterior
+    """
+    anterior = _entrada.get()
+    _entrada.set(funcao)
+    return anterior
+
+
+def ler(mensagem=""):
+    """
+    Lê uma entrada do jogador, descarregando antes as mensagens pendentes
+    para que apareçam antes da pergunta.
+
+    Returns:
+        str: Texto digitado
+    """
+    saida = _saida.get()
+    saida.descarregar()
+    # Com a saída nula, nem a pergunta é escrita
+    return _entrada.get()(mensagem if saida else "")
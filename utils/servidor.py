@@ -0,0 +1,247 @@
+"""
+Módulo que hospeda várias sessões de jogo em um único processo.
+
+Um servidor asyncio aceita conexões TCP ou por socket Unix (ex.:
+`nc localhost 8765`). Cada conexão é uma sessão: o jogador informa seu
+nome e joga um Jogo normal, com o save em <pasta_saves>/<nome>.json.
+
+Cada sessão é uma corrotina no loop asyncio: o jogo roda pelas versões
+assíncronas do menu e do combate (Jogo.executar_async), e cada pergunta
+(menu, ação de combate, sub-classe) aguarda a próxima linha da conexão
+sem ocupar nenhuma thread. Só saves e carregamentos, que acessam o disco,
+rodam em threads do executor padrão. A saída de cada sessão fica no
+contexto da sua tarefa (ver utils/saida.py).
+
+Uso:
+    python -m utils.servidor --porta 8765
+    python -m utils.servidor --unix /tmp/rpg.sock
+    python main.py --servidor 0.0.0.0:8765
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import re
+
+from jogo import Jogo
+from utils.logger import Logger
+from utils.repositorio import Repositorio
+from utils.saida import SaidaBuffer, definir_saida, exibir
+
+
+# Sessões simultâneas aceitas
+MAX_SESSOES = 2000
+# Nomes de jogador aceitos (também usados no nome do arquivo de save)
+_NOME_VALIDO = re.compile(r"[\w\- ]{1,32}")
+
+
+class _FluxoConexao:
+    """
+    Arquivo de escrita usado pela SaidaBuffer da sessão: entrega o texto à
+    conexão. A saída só é descarregada pela corrotina da sessão, no loop.
+    """
+
+    def __init__(self, escritor):
+        self._escritor = escritor
+
+    def write(self, texto):
+        self._escritor.write(texto.encode("utf-8"))
+
+    def flush(self):
+        pass
+
+
+class _LoggerSessao:
+    """
+    Logger de uma sessão: registra no logger do servidor identificando o
+    jogador. fechar() não encerra o logger compartilhado.
+    """
+
+    def __init__(self, logger, jogador):
+        self._logger = logger
+        self._jogador = jogador
+
+    def registrar(self, mensagem):
+        self._logger.registrar(f"[{self._jogador}] {mensagem}")
+
+    def fechar(self):
+        pass
+
+
+class ServidorJogo:
+    """
+    Servidor asyncio de sessões de jogo.
+    """
+
+    def __init__(self, pasta_saves="saves", logger=None, max_sessoes=MAX_SESSOES):
+        """
+        Args:
+            pasta_saves (str): Pasta dos saves, um arquivo JSON por jogador
+            logger (Logger, optional): Logger compartilhado pelas sessões.
+                Se None, usa um Logger com buffer gravando em jogo.log.
+            max_sessoes (int): Número máximo de sessões simultâneas
+        """
+        self.pasta_saves = pasta_saves
+        self.logger = logger or Logger(buffer=True)
+        self.max_sessoes = max_sessoes
+        # Jogador -> escritor da conexão, das sessões em andamento
+        self.sessoes = {}
+        # Tarefas das conexões em andamento (aguardadas em encerrar)
+        self._tarefas = set()
+        self._servidor = None
+
+    async def iniciar(self, host="127.0.0.1", porta=8765, unix=None):
+        """
+        Começa a aceitar conexões.
+
+        Args:
+            host (str): Endereço TCP
+            porta (int): Porta TCP (0 escolhe uma livre)
+            unix (str, optional): Caminho de um socket Unix (no lugar do TCP)
+
+        Returns:
+            asyncio.Server: O servidor aberto
+        """
+        os.makedirs(self.pasta_saves, exist_ok=True)
+        self.logger.registrar("Servidor iniciado")
+        if unix:
+            self._servidor = await asyncio.start_unix_server(self._atender, path=unix)
+        else:
+            self._servidor = await asyncio.start_server(self._atender, host, porta)
+        return self._servidor
+
+    async def encerrar(self):
+        """Para de aceitar conexões e encerra as sessões em andamento."""
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+        # Fechar a conexão faz a próxima leitura da sessão falhar com EOFError
+        for escritor in list(self.sessoes.values()):
+            escritor.close()
+        # Espera as sessões terminarem (e gravarem o log) antes de fechar o logger
+        if self._tarefas:
+            await asyncio.gather(*self._tarefas, return_exceptions=True)
+        self.logger.fechar()
+
+    async def _atender(self, leitor, escritor):
+        """Atende uma conexão: identifica o jogador e roda a sessão."""
+        jogador = None
+        tarefa = asyncio.current_task()
+        self._tarefas.add(tarefa)
+        try:
+            escritor.write("Jogador: ".encode("utf-8"))
+            try:
+                jogador = (await leitor.readline()).decode("utf-8", errors="replace").strip()
+            except ValueError:
+                # Linha maior que o limite do StreamReader
+                jogador = ""
+            if not _NOME_VALIDO.fullmatch(jogador):
+                escritor.write("Nome inválido!\n".encode("utf-8"))
+                jogador = None
+            elif jogador in self.sessoes:
+                escritor.write("Jogador já conectado!\n".encode("utf-8"))
+                jogador = None
+            elif len(self.sessoes) >= self.max_sessoes:
+                escritor.write("Servidor cheio, tente mais tarde.\n".encode("utf-8"))
+                jogador = None
+            else:
+                self.sessoes[jogador] = escritor
+                await self._jogar(jogador, leitor, escritor)
+            await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._tarefas.discard(tarefa)
+            if jogador is not None:
+                self.sessoes.pop(jogador, None)
+            escritor.close()
+            try:
+                await escritor.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _jogar(self, jogador, leitor, escritor):
+        """
+        Roda o jogo de uma sessão. Cada conexão é atendida em uma tarefa
+        própria, com cópia do contexto: a saída definida aqui é só dela.
+        """
+        async def ler(mensagem=""):
+            # Mensagens pendentes antes da pergunta, como em utils.saida.ler
+            exibir.descarregar()
+            if mensagem:
+                escritor.write(mensagem.encode("utf-8"))
+            await escritor.drain()
+            linha = await leitor.readline()
+            if not linha:
+                # Conexão encerrada pelo jogador (ou pelo servidor)
+                raise EOFError
+            return linha.decode("utf-8", errors="replace").rstrip("\r\n")
+
+        definir_saida(SaidaBuffer(_FluxoConexao(escritor)))
+        logger = _LoggerSessao(self.logger, jogador)
+        repositorio = Repositorio(os.path.join(self.pasta_saves, f"{jogador}.json"))
+        jogo = Jogo(rng=random.Random(), logger=logger, repositorio=repositorio)
+        try:
+            await jogo.executar_async(ler)
+        except (EOFError, ConnectionError):
+            pass
+        except Exception as e:
+            logger.registrar(f"Erro na sessão: {e}")
+        finally:
+            logger.registrar("Sessão encerrada")
+
+
+def _ler_endereco(endereco):
+    """Converte "host:porta" ou "unix:/caminho" em (host, porta, unix)."""
+    if endereco.startswith("unix:"):
+        return None, None, endereco[len("unix:"):]
+    host, _, porta = endereco.rpartition(":")
+    return host or "127.0.0.1", int(porta), None
+
+
+async def _servir(host, porta, unix, pasta_saves, max_sessoes):
+    servidor = ServidorJogo(pasta_saves, max_sessoes=max_sessoes)
+    aberto = await servidor.iniciar(host, porta, unix)
+    enderecos = ", ".join(str(sock.getsockname()) for sock in aberto.sockets)
+    print(f"Servidor do RPG OO em {enderecos} (Ctrl+C para encerrar)")
+    try:
+        await aberto.serve_forever()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await servidor.encerrar()
+
+
+def servir(endereco="127.0.0.1:8765", pasta_saves="saves", max_sessoes=MAX_SESSOES):
+    """
+    Roda o servidor até Ctrl+C.
+
+    Args:
+        endereco (str): "host:porta" ou "unix:/caminho/do/socket"
+        pasta_saves (str): Pasta dos saves dos jogadores
+        max_sessoes (int): Número máximo de sessões simultâneas
+    """
+    host, porta, unix = _ler_endereco(endereco)
+    try:
+        asyncio.run(_servir(host, porta, unix, pasta_saves, max_sessoes))
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    """Ponto de entrada de linha de comando."""
+    parser = argparse.ArgumentParser(description="Servidor de sessões do RPG OO")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--unix", default=None, help="caminho de um socket Unix (no lugar do TCP)")
+    parser.add_argument("--saves", default="saves", help="pasta dos saves dos jogadores")
+    parser.add_argument("--max-sessoes", type=int, default=MAX_SESSOES)
+    args = parser.parse_args()
+
+    endereco = f"unix:{args.unix}" if args.unix else f"{args.host}:{args.porta}"
+    servir(endereco, args.saves, args.max_sessoes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+Módulo que grava e reproduz sessões de jogo.
+
+Uma sessão gravada guarda a semente do random.Random do Jogo, o save que
+existia no início e todas as entradas do jogador (menu, ações de combate,
+escolha de sub-classe...). Como toda a aleatoriedade do jogo vem desse
+random.Random, reproduzir as mesmas entradas refaz exatamente o mesmo
+jogo, sem interação, sem renderização e sem tocar nos saves reais.
+
+Uso:
+    python main.py --gravar sessao.json
+    python -m utils.sessao sessao.json outra.json ...
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from jogo import Jogo
+from utils.logger import Logger
+from utils.repositorio import Repositorio, RepositorioSQLite, personagem_de_dados
+from utils.saida import definir_entrada, definir_saida
+
+
+# Versão do formato dos arquivos de sessão
+VERSAO_SESSAO = 1
+
+
+def _estado_final(jogo):
+    """Estado do personagem ao fim da sessão (None se nenhum foi criado)."""
+    return jogo.personagem.to_dict() if jogo.personagem else None
+
+
+class GravadorSessao:
+    """
+    Registra as entradas do jogador enquanto elas são lidas do teclado.
+    """
+
+    def __init__(self, semente, save_inicial=None, entrada=input):
+        """
+        Args:
+            semente (int): Semente do random.Random da sessão
+            save_inicial (dict, optional): Save existente no início da sessão
+            entrada: Função que lê do jogador (padrão: input)
+        """
+        self.semente = semente
+        self.save_inicial = save_inicial
+        self.entradas = []
+        self.final = None
+        self._entrada = entrada
+
+    def ler(self, mensagem=""):
+        """Lê uma entrada do jogador e a registra."""
+        texto = self._entrada(mensagem)
+        self.entradas.append(texto)
+        return texto
+
+    def to_dict(self):
+        return {
+            "versao": VERSAO_SESSAO,
+            "semente": self.semente,
+            "save_inicial": self.save_inicial,
+            "entradas": self.entradas,
+            "final": self.final,
+        }
+
+    def salvar(self, arquivo):
+        """
+        Grava a sessão em um arquivo JSON.
+
+        Returns:
+            bool: True se salvou com sucesso, False caso contrário
+        """
+        try:
+            with open(arquivo, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+            return True
+        except Exception as e:
+            print(f"Erro ao salvar a sessão: {e}")
+            return False
+
+
+def gravar_sessao(arquivo, semente=None, repositorio=None, logger=None, entrada=input):
+    """
+    Joga uma sessão interativa normal, gravando-a em `arquivo` ao final
+    (inclusive se ela for interrompida).
+
+    Args:
+        arquivo (str): Arquivo de sessão a ser gravado
+        semente (int, optional): Semente da sessão. Se None, sorteia uma.
+        repositorio (optional): Repositório do jogo (padrão: Repositorio())
+        logger (Logger, optional): Logger do jogo
+        entrada: Função que lê do jogador (padrão: input)
+
+    Returns:
+        GravadorSessao: A sessão gravada
+    """
+    if semente is None:
+        semente = random.SystemRandom().getrandbits(63)
+    repositorio = repositorio or Repositorio()
+
+    save_inicial = None
+    if repositorio.existe_save():
+        personagem = repositorio.carregar()
+        save_inicial = personagem.to_dict() if personagem else None
+
+    gravador = GravadorSessao(semente, save_inicial, entrada)
+    jogo = Jogo(rng=random.Random(semente), logger=logger, repositorio=repositorio)
+    anterior = definir_entrada(gravador.ler)
+    try:
+        jogo.executar()
+    finally:
+        definir_entrada(anterior)
+        gravador.final = _estado_final(jogo)
+        gravador.salvar(arquivo)
+    return gravador
+
+
+def carregar_sessao(arquivo):
+    """
+    Lê um arquivo de sessão.
+
+    Returns:
+        dict: Dados da sessão
+    """
+    with open(arquivo, 'r', encoding='utf-8') as f:
+        sessao = json.load(f)
+    if sessao.get("versao") != VERSAO_SESSAO:
+        raise ValueError(f"versão de sessão não suportada: {sessao.get('versao')}")
+    return sessao
+
+
+def reproduzir_sessao(sessao):
+    """
+    Reexecuta uma sessão gravada com a saída nula, sem log e com um
+    repositório em memória.
+
+    Args:
+        sessao: Dados da sessão (dict) ou caminho do arquivo
+
+    Returns:
+        dict: Estado final obtido, estado final gravado e se são iguais
+    """
+    if isinstance(sessao, str):
+        sessao = carregar_sessao(sessao)
+
+    repositorio = RepositorioSQLite(":memory:")
+    if sessao.get("save_inicial"):
+        repositorio.salvar(personagem_de_dados(sessao["save_inicial"]))
+    jogo = Jogo(rng=random.Random(sessao["semente"]), logger=Logger(None), repositorio=repositorio)
+
+    entradas = iter(sessao["entradas"])
+
+    def ler(mensagem=""):
+        texto = next(entradas, None)
+        if texto is None:
+            # Fim das entradas gravadas: a sessão terminou ali
+            raise EOFError
+        return texto
+
+    entrada_anterior = definir_entrada(ler)
+    saida_anterior = definir_saida("nula")
+    try:
+        jogo.executar()
+    except EOFError:
+        pass
+    finally:
+        definir_entrada(entrada_anterior)
+        definir_saida(saida_anterior)
+        repositorio.fechar()
+
+    final = _estado_final(jogo)
+    return {"final": final, "esperado": sessao.get("final"), "igual": final == sessao.get("final")}
+
+
+def _reproduzir_arquivo(arquivo):
+    """Reproduz um arquivo de sessão dentro de um processo do pool."""
+    try:
+        resultado = reproduzir_sessao(arquivo)
+    except Exception as e:
+        resultado = {"igual": False, "erro": f"{type(e).__name__}: {e}"}
+    resultado["arquivo"] = arquivo
+    return resultado
+
+
+def reproduzir_sessoes(arquivos, processos=None):
+    """
+    Reproduz várias sessões gravadas, distribuindo-as entre processos.
+
+    Args:
+        arquivos (list): Arquivos de sessão
+        processos (int, optional): Número de processos. Se None, usa todos
+            os núcleos; com 1, roda no processo atual.
+
+    Returns:
+        list: Resultados (ver reproduzir_sessao) na ordem dos arquivos
+    """
+    processos = processos or os.cpu_count() or 1
+    if processos == 1 or len(arquivos) <= 1:
+        return [_reproduzir_arquivo(arquivo) for arquivo in arquivos]
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        tamanho_lote = max(1, len(arquivos) // (processos * 4))
+        return list(executor.map(_reproduzir_arquivo, arquivos, chunksize=tamanho_lote))
+
+
+def main():
+    """Ponto de entrada de linha de comando: reproduz sessões e aponta divergências."""
+    parser = argparse.ArgumentParser(description="Reprodução de sessões gravadas")
+    parser.add_argument("arquivos", nargs="+", help="arquivos de sessão (.json)")
+    parser.add_argument("--processos", type=int, default=None, help="padrão: todos os núcleos")
+    args = parser.parse_args()
+
+    resultados = reproduzir_sessoes(args.arquivos, args.processos)
+    divergentes = [r for r in resultados if not r["igual"]]
+    for resultado in divergentes:
+        motivo = resultado.get("erro") or "estado final diferente do gravado"
+        print(f"DIVERGENTE {resultado['arquivo']}: {motivo}")
+    print(f"{len(resultados)} sessões reproduzidas, {len(divergentes)} divergentes")
+    sys.exit(1 if divergentes else 0)
+
+
+if __name__ == "__main__":
+    main()
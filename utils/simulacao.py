@@ -0,0 +1,190 @@
+"""
+Módulo que executa simulações de missões em massa, em vários processos.
+Cada missão usa seu próprio random.Random semeado a partir de uma semente
+mestra, de modo que o resultado agregado é o mesmo para qualquer número
+de processos.
+
+Uso:
+    python -m utils.simulacao --missoes 100000 --classe Mago --semente 42
+"""
+
+import argparse
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from models.classes import Guerreiro, Mago, Arqueiro
+from models.combate import POLITICAS
+from models.inimigo import FabricaInimigos
+from models.missão import Missao
+from models.personagem import SUBCLASSES
+
+
+# Classes jogáveis disponíveis para simulação
+CLASSES = {
+    "Guerreiro": Guerreiro,
+    "Mago": Mago,
+    "Arqueiro": Arqueiro,
+}
+
+
+def gerar_sementes(semente_mestra, quantidade):
+    """
+    Deriva uma semente por missão a partir da semente mestra.
+
+    A semente de cada missão depende apenas do seu índice, nunca do
+    processo que a executa.
+
+    Returns:
+        list: Sementes (int) na ordem das missões
+    """
+    rng = random.Random(semente_mestra)
+    return [rng.getrandbits(64) for _ in range(quantidade)]
+
+
+def _resultado_vazio():
+    """Retorna um acumulador zerado de resultados."""
+    return {
+        "missoes": 0,
+        "vitorias": 0,
+        "turnos": 0,
+        "dano_causado": 0,
+        "dano_recebido": 0,
+        "por_inimigo": {},
+    }
+
+
+def _mesclar(total, parcial):
+    """Soma um resultado parcial ao acumulador total."""
+    for chave in ("missoes", "vitorias", "turnos", "dano_causado", "dano_recebido"):
+        total[chave] += parcial[chave]
+    for nome, dados in parcial["por_inimigo"].items():
+        atual = total["por_inimigo"].setdefault(nome, {"missoes": 0, "vitorias": 0})
+        atual["missoes"] += dados["missoes"]
+        atual["vitorias"] += dados["vitorias"]
+    return total
+
+
+def simular_missao(classe, dificuldade, politica, semente, acumulador=None, fabrica=None,
+                   subclasse=None):
+    """
+    Simula uma única missão com um personagem novo da classe informada.
+
+    Args:
+        classe (str): Nome da classe do personagem (ver CLASSES)
+        dificuldade (str): Dificuldade da missão
+        politica: Política de ações do combate
+        semente (int): Semente do random.Random desta missão
+        acumulador (dict, optional): Acumulador onde o resultado é somado
+        fabrica (FabricaInimigos, optional): Fábrica que recicla os inimigos
+        subclasse (str, optional): Sub-classe aplicada ao personagem (ver SUBCLASSES)
+
+    Returns:
+        dict: O acumulador atualizado
+    """
+    acumulador = acumulador if acumulador is not None else _resultado_vazio()
+    rng = random.Random(semente)
+
+    personagem = CLASSES[classe]("Simulado")
+    personagem.rng = rng
+    if subclasse:
+        personagem.aplicar_subclasse(subclasse)
+    missao = Missao("Simulação", dificuldade, rng=rng, fabrica=fabrica)
+    resultado = missao.executar_combate(personagem, politica=politica, saida=None)
+
+    acumulador["missoes"] += 1
+    acumulador["vitorias"] += resultado["vitoria"]
+    acumulador["turnos"] += resultado["turnos"]
+    acumulador["dano_causado"] += resultado["dano_causado"]
+    acumulador["dano_recebido"] += resultado["dano_recebido"]
+    por_inimigo = acumulador["por_inimigo"].setdefault(missao.descricao, {"missoes": 0, "vitorias": 0})
+    por_inimigo["missoes"] += 1
+    por_inimigo["vitorias"] += resultado["vitoria"]
+    return acumulador
+
+
+def _simular_lote(args):
+    """Executa um lote de missões dentro de um processo do pool."""
+    classe, dificuldade, nome_politica, sementes, subclasse = args
+    politica = POLITICAS[nome_politica]()
+    fabrica = FabricaInimigos()
+    acumulador = _resultado_vazio()
+    for semente in sementes:
+        simular_missao(classe, dificuldade, politica, semente, acumulador, fabrica, subclasse)
+    return acumulador
+
+
+def simular_missoes(quantidade, classe="Guerreiro", dificuldade="médio",
+                    politica="habilidade", semente=0, processos=None, subclasse=None):
+    """
+    Simula várias missões distribuindo-as entre processos.
+
+    Args:
+        quantidade (int): Número de missões
+        classe (str): Nome da classe do personagem (ver CLASSES)
+        dificuldade (str): Dificuldade das missões
+        politica (str): Nome da política de ações (ver models.combate.POLITICAS)
+        semente (int): Semente mestra
+        processos (int, optional): Número de processos. Se None, usa todos os
+            núcleos; com 1, roda no processo atual.
+        subclasse (str, optional): Sub-classe dos personagens (ex.: "Caçador")
+
+    Returns:
+        dict: Totais agregados, taxa de vitória e médias por missão
+    """
+    if classe not in CLASSES:
+        raise ValueError(f"classe inválida: {classe}")
+    if politica not in POLITICAS:
+        raise ValueError(f"política inválida: {politica}")
+    if subclasse and subclasse not in SUBCLASSES[classe]:
+        raise ValueError(f"sub-classe inválida para {classe}: {subclasse}")
+
+    processos = processos or os.cpu_count() or 1
+    sementes = gerar_sementes(semente, quantidade)
+
+    # Vários lotes por processo equilibram a carga entre os núcleos
+    tamanho_lote = max(1, -(-quantidade // (processos * 4)))
+    lotes = [
+        (classe, dificuldade, politica, sementes[i:i + tamanho_lote], subclasse)
+        for i in range(0, quantidade, tamanho_lote)
+    ]
+
+    total = _resultado_vazio()
+    if processos == 1:
+        for lote in lotes:
+            _mesclar(total, _simular_lote(lote))
+    else:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            for parcial in executor.map(_simular_lote, lotes):
+                _mesclar(total, parcial)
+
+    missoes = total["missoes"] or 1
+    total["taxa_vitoria"] = total["vitorias"] / missoes
+    total["turnos_medio"] = total["turnos"] / missoes
+    total["dano_causado_medio"] = total["dano_causado"] / missoes
+    total["dano_recebido_medio"] = total["dano_recebido"] / missoes
+    return total
+
+
+def main():
+    """Ponto de entrada de linha de comando."""
+    parser = argparse.ArgumentParser(description="Simulação de missões em massa")
+    parser.add_argument("--missoes", type=int, default=10000, help="número de missões")
+    parser.add_argument("--classe", default="Guerreiro", choices=sorted(CLASSES))
+    parser.add_argument("--dificuldade", default="médio", choices=sorted(Missao.TIPOS_INIMIGOS))
+    parser.add_argument("--politica", default="habilidade", choices=sorted(POLITICAS))
+    parser.add_argument("--subclasse", default=None, help="sub-classe do personagem (ex.: Caçador)")
+    parser.add_argument("--semente", type=int, default=0, help="semente mestra")
+    parser.add_argument("--processos", type=int, default=None, help="padrão: todos os núcleos")
+    args = parser.parse_args()
+
+    resultado = simular_missoes(
+        args.missoes, args.classe, args.dificuldade, args.politica, args.semente, args.processos,
+        args.subclasse,
+    )
+    print(json.dumps(resultado, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
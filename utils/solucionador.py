@@ -0,0 +1,294 @@
+"""
+Módulo que calcula de forma exata o resultado de um confronto entre um
+personagem e um inimigo, sem simulação.
+
+O combate é modelado como uma cadeia de Markov sobre o estado
+(HP do personagem, HP do inimigo, mana do personagem, mana do inimigo),
+usando as mesmas faixas de dano, chances de crítico e habilidades dos
+métodos atacar/habilidade_especial. Como o personagem perde pelo menos
+1 de HP a cada turno em que o inimigo sobrevive, a cadeia não tem ciclos:
+basta propagar a probabilidade dos estados em ordem decrescente de HP
+do personagem.
+"""
+
+from functools import lru_cache
+
+from models.personagem import Personagem
+from models.classes import Guerreiro, Mago, Arqueiro
+from models.combate import PoliticaAtacar, PoliticaHabilidade
+from models.inimigo import Inimigo, Lobo, Chefao
+
+
+def _distribuicao_uniforme(base, faixa):
+    """
+    Distribuição exata de int(base * U), com U uniforme em `faixa`.
+
+    Returns:
+        dict: valor inteiro -> probabilidade
+    """
+    a, b = faixa
+    if base <= 0:
+        return {0: 1.0}
+    largura = b - a
+    dist = {}
+    k = int(base * a)
+    while k <= base * b:
+        inicio = max(k / base, a)
+        fim = min((k + 1) / base, b)
+        if fim > inicio:
+            dist[k] = dist.get(k, 0.0) + (fim - inicio) / largura
+        k += 1
+    return dist
+
+
+def _mapear(dist, funcao):
+    """Aplica `funcao` a cada valor da distribuição, somando as colisões."""
+    resultado = {}
+    for valor, prob in dist.items():
+        novo = funcao(valor)
+        resultado[novo] = resultado.get(novo, 0.0) + prob
+    return resultado
+
+
+def _com_critico(dist, chance, multiplicador):
+    """Mistura a distribuição com a sua versão crítica (int(dano * mult))."""
+    resultado = {}
+    for valor, prob in dist.items():
+        resultado[valor] = resultado.get(valor, 0.0) + prob * (1 - chance)
+        critico = int(valor * multiplicador)
+        resultado[critico] = resultado.get(critico, 0.0) + prob * chance
+    return resultado
+
+
+def _somar(dist_a, dist_b):
+    """Distribuição da soma de duas variáveis independentes."""
+    resultado = {}
+    for a, pa in dist_a.items():
+        for b, pb in dist_b.items():
+            resultado[a + b] = resultado.get(a + b, 0.0) + pa * pb
+    return resultado
+
+
+def _modelo_personagem(personagem):
+    """
+    Extrai do personagem os parâmetros que determinam o seu dano.
+
+    Returns:
+        tuple: Chave imutável usada para memoizar as distribuições
+    """
+    classe = type(personagem)
+    if ((personagem.sub_classe == "Caçador" and (personagem.stun_chance or personagem.dot_sangramento))
+            or (personagem.sub_classe == "Piromante" and personagem.chance_queimadura)):
+        raise ValueError("efeitos de status (Caçador/Piromante) não são modelados pelo solucionador")
+    if classe.atacar is Personagem.atacar:
+        ataque = ("base", classe.FAIXA_ATAQUE, personagem.buff_dano,
+                  personagem.crit_chance, classe.MULT_CRITICO_ATAQUE)
+    elif classe.atacar in (Guerreiro.atacar, Mago.atacar):
+        ataque = ("classe", classe.FAIXA_ATAQUE, 1.0) + classe.CRITICO_ATAQUE
+    else:
+        raise ValueError(f"ataque de {classe.__name__} não suportado pelo solucionador")
+
+    if classe.habilidade_especial is Personagem.habilidade_especial:
+        habilidade = ("base", classe.FAIXA_HABILIDADE, personagem.buff_dano,
+                      personagem.crit_chance, classe.MULT_CRITICO_HABILIDADE)
+    elif classe.habilidade_especial in (Guerreiro.habilidade_especial, Mago.habilidade_especial,
+                                        Arqueiro.habilidade_especial):
+        habilidade = ("classe", classe.FAIXA_HABILIDADE, 1.0) + classe.CRITICO_HABILIDADE
+    else:
+        raise ValueError(f"habilidade de {classe.__name__} não suportada pelo solucionador")
+
+    return (personagem.dano_base, personagem.defesa, classe.CUSTO_HABILIDADE, ataque, habilidade)
+
+
+def _modelo_inimigo(inimigo):
+    """
+    Extrai do inimigo os parâmetros que determinam o seu comportamento.
+
+    Returns:
+        tuple: Chave imutável usada para memoizar as distribuições
+    """
+    classe = type(inimigo)
+    if classe.atacar is Inimigo.atacar:
+        especial = None
+    elif classe.atacar is Lobo.atacar:
+        especial = ("duplo", classe.CHANCE_ATAQUE_DUPLO)
+    elif classe.atacar is Chefao.atacar:
+        especial = ("especial", classe.CHANCE_ESPECIAL, classe.CUSTO_ESPECIAL, classe.FAIXA_ESPECIAL)
+    else:
+        raise ValueError(f"ataque de {classe.__name__} não suportado pelo solucionador")
+
+    if getattr(classe, "regenerar", None) is None:
+        regeneracao = None
+    elif classe.regenerar is Chefao.regenerar:
+        regeneracao = (classe.CHANCE_REGENERACAO, classe.CURA_REGENERACAO)
+    else:
+        raise ValueError(f"regeneração de {classe.__name__} não suportada pelo solucionador")
+
+    return (inimigo.dano, inimigo.defesa, inimigo.hp_maximo, classe.FAIXA_ATAQUE, especial, regeneracao)
+
+
+def _dist_golpe(dano_base, modelo):
+    """Distribuição do dano de um golpe do personagem (antes da defesa do alvo)."""
+    _, faixa, buff, chance, multiplicador = modelo
+    dist = _distribuicao_uniforme(dano_base, faixa)
+    if buff != 1.0:
+        # Ataque base: int(int(dano_base * U) * buff_dano)
+        dist = _mapear(dist, lambda d: int(d * buff))
+    dist = _com_critico(dist, chance, multiplicador)
+    return _mapear(dist, lambda d: max(1, d))
+
+
+def _dist_habilidade_base(dano_base, modelo):
+    """Habilidade base: int(dano_base * U * buff), com crítico pela chance do personagem."""
+    _, faixa, buff, chance, multiplicador = modelo
+    dist = _distribuicao_uniforme(dano_base * buff, faixa)
+    dist = _com_critico(dist, chance, multiplicador)
+    return _mapear(dist, lambda d: max(1, d))
+
+
+@lru_cache(maxsize=4096)
+def _resolver(modelo_p, modelo_i, usa_habilidade, hp, mana, hp_inimigo, mana_inimigo):
+    """
+    Resolve o confronto para uma combinação de atributos (memoizado).
+
+    Returns:
+        tuple: (prob_vitoria, rodadas_esperadas, distribuicao_hp como tupla de pares)
+    """
+    dano_base, defesa, custo, modelo_ataque, modelo_habilidade = modelo_p
+    dano_inimigo, defesa_inimigo, hp_max_inimigo, faixa_inimigo, especial, regeneracao = modelo_i
+
+    def aplicar_defesa(dist, defesa_alvo):
+        return _mapear(dist, lambda d: max(1, d - defesa_alvo))
+
+    ataque = aplicar_defesa(_dist_golpe(dano_base, modelo_ataque), defesa_inimigo)
+    if modelo_habilidade[0] == "base":
+        habilidade = _dist_habilidade_base(dano_base, modelo_habilidade)
+    else:
+        habilidade = _dist_golpe(dano_base, modelo_habilidade)
+    habilidade = aplicar_defesa(habilidade, defesa_inimigo)
+
+    # Dano do inimigo no personagem
+    golpe_inimigo = _mapear(_distribuicao_uniforme(dano_inimigo, faixa_inimigo), lambda d: max(1, d))
+    if especial is not None and especial[0] == "duplo":
+        chance = especial[1]
+        duplo = _somar(golpe_inimigo, golpe_inimigo)
+        normal = {d: p * (1 - chance) for d, p in golpe_inimigo.items()}
+        for d, p in duplo.items():
+            normal[d] = normal.get(d, 0.0) + p * chance
+        golpe_inimigo = normal
+    golpe_inimigo = aplicar_defesa(golpe_inimigo, defesa)
+    if especial is not None and especial[0] == "especial":
+        golpe_especial = _mapear(_distribuicao_uniforme(dano_inimigo, especial[3]), lambda d: max(1, d))
+        golpe_especial = aplicar_defesa(golpe_especial, defesa)
+
+    # Resultado da ação do personagem (e da regeneração) por HP do inimigo:
+    # chance de vitória imediata e distribuição do HP do inimigo que sobra
+    pos_golpe = {}
+
+    def golpear(hp_i, golpe, chave):
+        resultado = pos_golpe.get(chave)
+        if resultado is not None:
+            return resultado
+        vence = 0.0
+        sobreviventes = {}
+        for dano, prob in golpe.items():
+            restante = hp_i - min(hp_i, dano)
+            if restante == 0:
+                vence += prob
+            else:
+                sobreviventes[restante] = sobreviventes.get(restante, 0.0) + prob
+        if regeneracao is not None:
+            chance, cura = regeneracao
+            regenerados = {}
+            for hp_r, prob in sobreviventes.items():
+                regenerados[hp_r] = regenerados.get(hp_r, 0.0) + prob * (1 - chance)
+                curado = min(hp_r + cura, hp_max_inimigo)
+                regenerados[curado] = regenerados.get(curado, 0.0) + prob * chance
+            sobreviventes = regenerados
+        resultado = pos_golpe[chave] = (vence, tuple(sobreviventes.items()))
+        return resultado
+
+    golpe_inimigo = tuple(golpe_inimigo.items())
+    if especial is not None and especial[0] == "especial":
+        golpe_especial = tuple(golpe_especial.items())
+
+    # Massa de probabilidade por estado, agrupada pelo HP do personagem
+    niveis = {hp: {(hp_inimigo, mana, mana_inimigo): 1.0}}
+    vitoria = 0.0
+    rodadas = 0.0
+    distribuicao_hp = {}
+
+    for hp_atual in range(hp, 0, -1):
+        estados = niveis.pop(hp_atual, None)
+        if not estados:
+            continue
+        for (hp_i, mana_p, mana_i), massa in estados.items():
+            rodadas += massa
+
+            # Ação do personagem (seguida da regeneração do inimigo)
+            if usa_habilidade and mana_p >= custo:
+                vence, sobreviventes = golpear(hp_i, habilidade, (hp_i, True))
+                mana_p -= custo
+            else:
+                vence, sobreviventes = golpear(hp_i, ataque, (hp_i, False))
+            if vence:
+                vitoria += massa * vence
+                distribuicao_hp[hp_atual] = distribuicao_hp.get(hp_atual, 0.0) + massa * vence
+
+            # Ataque do inimigo
+            if especial is not None and especial[0] == "especial" and mana_i >= especial[2]:
+                opcoes = ((golpe_inimigo, mana_i, 1 - especial[1]),
+                          (golpe_especial, mana_i - especial[2], especial[1]))
+            else:
+                opcoes = ((golpe_inimigo, mana_i, 1.0),)
+
+            for dist, nova_mana_i, prob_opcao in opcoes:
+                massa_opcao = massa * prob_opcao
+                for dano, prob in dist:
+                    novo_hp = hp_atual - min(hp_atual, dano)
+                    p = massa_opcao * prob
+                    if novo_hp == 0:
+                        distribuicao_hp[0] = distribuicao_hp.get(0, 0.0) + p * (1 - vence)
+                        continue
+                    nivel = niveis.setdefault(novo_hp, {})
+                    for hp_r, prob_r in sobreviventes:
+                        chave = (hp_r, mana_p, nova_mana_i)
+                        nivel[chave] = nivel.get(chave, 0.0) + p * prob_r
+
+    return vitoria, rodadas, tuple(sorted(distribuicao_hp.items()))
+
+
+def resolver_confronto(personagem, inimigo, politica=None):
+    """
+    Calcula de forma exata o resultado de um combate a partir do estado atual.
+
+    Args:
+        personagem: Instância do personagem (Guerreiro, Mago, Arqueiro ou Personagem)
+        inimigo: Instância do inimigo (Goblin, Lobo, Orc, Chefao ou Inimigo)
+        politica: PoliticaAtacar ou PoliticaHabilidade (padrão: PoliticaAtacar)
+
+    Returns:
+        dict: prob_vitoria, turnos_esperados (contados como no
+        ResultadoCombate), rodadas_esperadas (ações do personagem) e
+        distribuicao_hp (HP final do personagem -> probabilidade; 0 = derrota)
+    """
+    politica = politica if politica is not None else PoliticaAtacar()
+    if type(politica) is PoliticaHabilidade:
+        usa_habilidade = True
+    elif type(politica) is PoliticaAtacar:
+        usa_habilidade = False
+    else:
+        raise ValueError(f"política {type(politica).__name__} não suportada pelo solucionador")
+
+    mana_inimigo = getattr(inimigo, "mana", 0)
+    vitoria, rodadas, distribuicao = _resolver(
+        _modelo_personagem(personagem), _modelo_inimigo(inimigo), usa_habilidade,
+        personagem.hp, personagem.mana, inimigo.hp, mana_inimigo,
+    )
+    return {
+        "prob_vitoria": vitoria,
+        # O contador de turnos do combate avança também no turno da derrota
+        "turnos_esperados": rodadas + (1 - vitoria),
+        "rodadas_esperadas": rodadas,
+        "distribuicao_hp": dict(distribuicao),
+    }